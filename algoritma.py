@@ -3,11 +3,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Dict, List, Optional, Tuple, Callable, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Callable, Set
 import heapq
 import math
 
 from graph import Graph, Node, Edge
+from traversal import bfs_arrays, dfs_arrays
 
 
 # ================== Soyut Temel Sınıf ==================
@@ -24,9 +25,14 @@ class GraphAlgorithm(ABC):
 # ================== BFS ==================
 
 class BFS(GraphAlgorithm):
-    """Genişlik öncelikli arama."""
+    """
+    Genişlik öncelikli arama.
+    Dondurulmuş (CSR) grafta dizi tabanlı çekirdek kullanılır (aynı sıra).
+    """
 
     def run(self, graph: Graph, start_id: int) -> List[int]:
+        if graph.frozen and start_id in graph.nodes:
+            return bfs_arrays(graph, start_id).order_ids()
         visited: Set[int] = set()
         order: List[int] = []
         q = deque()
@@ -53,9 +59,14 @@ def bfs(graph: Graph, start_id: int) -> List[int]:
 # ================== DFS ==================
 
 class DFS(GraphAlgorithm):
-    """Derinlik öncelikli arama (iteratif)."""
+    """
+    Derinlik öncelikli arama (iteratif).
+    Dondurulmuş (CSR) grafta dizi tabanlı çekirdek kullanılır (aynı sıra).
+    """
 
     def run(self, graph: Graph, start_id: int) -> List[int]:
+        if graph.frozen and start_id in graph.nodes:
+            return dfs_arrays(graph, start_id).order_ids()
         visited: Set[int] = set()
         order: List[int] = []
         stack: List[int] = [start_id]
@@ -83,13 +94,20 @@ def dfs(graph: Graph, start_id: int) -> List[int]:
 # ================== Dijkstra ==================
 
 class Dijkstra(GraphAlgorithm):
-    """Pozitif ağırlıklı kenarlarda en kısa yol."""
+    """
+    Pozitif ağırlıklı kenarlarda en kısa yol.
+    targets verilirse hepsi kesinleşince durur (diğer mesafeler eksik kalabilir).
+    Dondurulmuş (CSR) grafta indeks tabanlı çekirdek kullanılır.
+    """
 
     def run(
-        self, graph: Graph, source_id: int
+        self, graph: Graph, source_id: int, targets: Optional[Iterable[int]] = None
     ) -> Tuple[Dict[int, float], Dict[int, Optional[int]]]:
+        if graph.frozen and source_id in graph.nodes:
+            return self._run_csr(graph, source_id, targets)
         dist: Dict[int, float] = {nid: math.inf for nid in graph.nodes}
         prev: Dict[int, Optional[int]] = {nid: None for nid in graph.nodes}
+        pending: Optional[Set[int]] = set(targets) if targets is not None else None
 
         dist[source_id] = 0.0
         pq: List[Tuple[float, int]] = [(0.0, source_id)]
@@ -98,6 +116,10 @@ class Dijkstra(GraphAlgorithm):
             d_u, u = heapq.heappop(pq)
             if d_u > dist[u]:
                 continue  # eski kayıt
+            if pending is not None:
+                pending.discard(u)
+                if not pending:
+                    break
 
             for e in graph.edges_from(u):
                 v = e.to_id
@@ -109,11 +131,26 @@ class Dijkstra(GraphAlgorithm):
 
         return dist, prev
 
+    @staticmethod
+    def _run_csr(
+        graph: Graph, source_id: int, targets: Optional[Iterable[int]]
+    ) -> Tuple[Dict[int, float], Dict[int, Optional[int]]]:
+        csr = graph.to_csr()
+        index = csr.index
+        if targets is not None:
+            # grafta olmayan hedef hiç kesinleşmez (dict sürümündeki gibi)
+            targets = [index.get(t, -1) for t in targets]
+        dist_a, prev_a, _order = csr.shortest_path_tree(index[source_id], targets)
+        ids = csr.ids
+        dist = dict(zip(ids, dist_a))
+        prev = {nid: (None if p < 0 else ids[p]) for nid, p in zip(ids, prev_a)}
+        return dist, prev
+
 
 def dijkstra(
-    graph: Graph, source_id: int
+    graph: Graph, source_id: int, targets: Optional[Iterable[int]] = None
 ) -> Tuple[Dict[int, float], Dict[int, Optional[int]]]:
-    return Dijkstra().run(graph, source_id)
+    return Dijkstra().run(graph, source_id, targets)
 
 
 def reconstruct_path(prev: Dict[int, Optional[int]], target_id: int) -> List[int]:
@@ -134,6 +171,7 @@ class AStar(GraphAlgorithm):
     A* algoritması.
     heuristic: h(node_id) -> tahmini kalan maliyet.
     Heuristic verilmezse Dijkstra'ya eşdeğer olur (h=0).
+    Kabul edilebilir bir heuristic için: LandmarkIndex.heuristic(target_id)
     """
 
     def __init__(self, heuristic: Optional[Callable[[int], float]] = None) -> None:
@@ -184,30 +222,14 @@ def astar(
 # ================== Bağlı Bileşenler ==================
 
 class ConnectedComponents(GraphAlgorithm):
-    """Grafın bağlı bileşenlerini bulur."""
+    """
+    Grafın bağlı bileşenlerini bulur (grafın union-find takibinden).
+    Bileşenler BFS'teki gibi ilk düğümlerinin graf sırasıyla gelir; bileşen
+    içindeki düğümler ise BFS sırası yerine graf (ekleme) sırasındadır.
+    """
 
     def run(self, graph: Graph) -> List[List[int]]:
-        visited: Set[int] = set()
-        components: List[List[int]] = []
-
-        for nid in graph.nodes:
-            if nid in visited:
-                continue
-            comp: List[int] = []
-            q = deque([nid])
-            visited.add(nid)
-
-            while q:
-                u = q.popleft()
-                comp.append(u)
-                for v in graph.neighbors(u):
-                    if v not in visited:
-                        visited.add(v)
-                        q.append(v)
-
-            components.append(comp)
-
-        return components
+        return graph.components().groups()
 
 
 def connected_components(graph: Graph) -> List[List[int]]:
@@ -220,11 +242,9 @@ class DegreeCentrality(GraphAlgorithm):
     """Node'ları degree değerine göre sıralar; ilk k tanesini döner."""
 
     def run(self, graph: Graph, k: int = 5) -> List[int]:
-        # degree bilgisi node.degree alanında tutuluyor
-        sorted_nodes = sorted(
-            graph.nodes.values(), key=lambda n: n.degree, reverse=True
-        )
-        top = sorted_nodes[:k]
+        # degree bilgisi node.degree alanında tutuluyor; tam sıralama yerine
+        # k boyutlu yığın: O(n log k), eşitlikte sorted ile aynı sıra
+        top = heapq.nlargest(k, graph.nodes.values(), key=lambda n: n.degree)
         return [n.id for n in top]
 
 
@@ -241,36 +261,10 @@ class WelshPowellColoring(GraphAlgorithm):
     Çıktı: node_id -> renk numarası (1,2,3,...)
     """
 
-    def run(self, graph: Graph) -> Dict[int, int]:
-        # Node'ları degree'e göre azalan sırala
-        nodes_sorted = sorted(
-            graph.nodes.values(), key=lambda n: n.degree, reverse=True
-        )
-
-        color: Dict[int, int] = {}
-        current_color = 0
-
-        for node in nodes_sorted:
-            if node.id in color:
-                continue
-            current_color += 1
-            color[node.id] = current_color
-
-            # Aynı renge boyanabilecek diğer node'ları bul
-            for other in nodes_sorted:
-                if other.id in color:
-                    continue
-                # Diğer node, bu renge atanmış node'lardan hiçbiriyle komşu olmamalı
-                conflict = False
-                for nid, c in color.items():
-                    if c == current_color:
-                        # nid ile other komşu mu?
-                        if other.id in graph.neighbors(nid):
-                            conflict = True
-                            break
-                if not conflict:
-                    color[other.id] = current_color
-
+    def run(self, graph: Graph, strategy: str = "welsh_powell") -> Dict[int, int]:
+        # Renk sınıfları yasaklı-komşu işaret dizisiyle kurulur (welsh_powell.py)
+        from welsh_powell import welsh_powell_coloring
+        color, _table = welsh_powell_coloring(graph, strategy=strategy)
         return color
 
 
@@ -0,0 +1,140 @@
+# apsp.py
+# Tüm çiftler en kısa yol (APSP): her kaynak için bağımsız bir Dijkstra
+# çalıştırılır; kaynaklar parçalara bölünüp işçi süreçlere dağıtılır.
+# Graf işçilere paylaşımlı bellekteki CSR dizileri olarak verilir.
+from __future__ import annotations
+import struct
+from array import array
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from graph import Graph
+import parallel
+
+MAGIC = b"GRAFAPSP"
+
+# İşçi süreçte sonuç matrisinin görünümü (matris modunda)
+_WORKER_OUT = None
+
+
+class DistanceMatrix:
+    """n x n mesafe matrisi; data satır satır (ids sırasıyla) float64 tutulur."""
+
+    def __init__(self, ids: List[int], data: array):
+        self.ids = ids
+        self.index: Dict[int, int] = {nid: i for i, nid in enumerate(ids)}
+        self.data = data
+
+    def row(self, source_id: int) -> memoryview:
+        n = len(self.ids)
+        i = self.index[source_id]
+        return memoryview(self.data)[i * n:(i + 1) * n]
+
+    def distance(self, a: int, b: int) -> float:
+        return self.data[self.index[a] * len(self.ids) + self.index[b]]
+
+
+# ---------- İşçi tarafı ----------
+
+def _attach_output(name: str, n: int) -> None:
+    global _WORKER_OUT
+    _WORKER_OUT = parallel.attach_block((name, "d", n * n))
+
+
+def _fill_rows(sources: range) -> None:
+    """Matris modu: satırları doğrudan paylaşımlı matrise yazar."""
+    csr = parallel.worker_csr()
+    n = len(csr)
+    for src in sources:
+        _WORKER_OUT[src * n:(src + 1) * n] = csr.sssp(src)
+
+
+def _compute_rows(sources: range) -> List[bytes]:
+    """Akış modu: satırları ham bayt olarak döndürür."""
+    csr = parallel.worker_csr()
+    return [csr.sssp(src).tobytes() for src in sources]
+
+
+# ---------- Ana süreç ----------
+
+def all_pairs_shortest_paths(
+    g: Graph, workers: Optional[int] = None, chunk_size: int = 64
+) -> DistanceMatrix:
+    """
+    Tam mesafe matrisini hesaplar (bellek: n*n*8 bayt).
+    Büyük graflarda iter_apsp_rows / write_apsp_matrix tercih edilmeli.
+    """
+    csr = g.to_csr()
+    ids = list(csr.ids)
+    n = len(ids)
+    workers = parallel.resolve_workers(workers)
+
+    if workers == 1 or n < 2:
+        data = array("d")
+        for src in range(n):
+            data.extend(csr.sssp(src))
+        return DistanceMatrix(ids, data)
+
+    out = shared_memory.SharedMemory(create=True, size=n * n * 8)
+    try:
+        shared, pool = parallel.csr_pool(csr, workers, _attach_output, (out.name, n))
+        with shared, pool:
+            list(pool.map(_fill_rows, parallel.chunked(n, chunk_size)))
+        data = array("d")
+        data.frombytes(out.buf[:n * n * 8])
+    finally:
+        out.close()
+        out.unlink()
+    return DistanceMatrix(ids, data)
+
+
+def iter_apsp_rows(
+    g: Graph, workers: Optional[int] = None, chunk_size: int = 64
+) -> Iterator[Tuple[int, array]]:
+    """
+    (kaynak_id, mesafe satırı) çiftlerini ids sırasıyla akış halinde üretir.
+    Aynı anda en fazla 2 * workers parça bellekte bekler.
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    workers = parallel.resolve_workers(workers)
+
+    if workers == 1:
+        for src in range(n):
+            yield csr.ids[src], csr.sssp(src)
+        return
+
+    chunks = iter(parallel.chunked(n, chunk_size))
+    shared, pool = parallel.csr_pool(csr, workers)
+    with shared, pool:
+        window = deque()
+        for chunk in chunks:
+            window.append((chunk, pool.submit(_compute_rows, chunk)))
+            if len(window) >= 2 * workers:
+                break
+        while window:
+            chunk, fut = window.popleft()
+            nxt = next(chunks, None)
+            if nxt is not None:
+                window.append((nxt, pool.submit(_compute_rows, nxt)))
+            for src, raw in zip(chunk, fut.result()):
+                row = array("d")
+                row.frombytes(raw)
+                yield csr.ids[src], row
+
+
+def write_apsp_matrix(
+    g: Graph, path: str, workers: Optional[int] = None, chunk_size: int = 64
+) -> None:
+    """
+    Mesafe matrisini satır satır dosyaya yazar:
+    MAGIC + n (int64) + ids (int64[n]) + n adet float64[n] satır.
+    """
+    ids = list(g.to_csr().ids)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<q", len(ids)))
+        f.write(array("q", ids).tobytes())
+        for _src, row in iter_apsp_rows(g, workers, chunk_size):
+            f.write(row.tobytes())
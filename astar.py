@@ -1,11 +1,18 @@
 # astar.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 import heapq
 
 from graph import Graph
 
+if TYPE_CHECKING:
+    from jobs import CancelToken
+    from landmarks import LandmarkIndex
+
+# İptal / ilerleme kontrolü bu kadar düğüm kapandıkça bir yapılır
+CHECK_EVERY = 1024
+
 
 @dataclass
 class PathResult:
@@ -19,22 +26,52 @@ def heuristic(g: Graph, a: int, b: int) -> float:
     A* için basit heuristic:
     Node özellik farklarını kullanıyoruz.
     (activity farkı + interaction farkı) küçük bir ölçekle.
+    DİKKAT: kabul edilebilir (admissible) değildir; kenar ağırlıklarından
+    bağımsız olduğundan gerçek mesafeyi aşabilir ve A* en kısa olmayan bir
+    yol döndürebilir. Yalnızca astar_shortest_path(heuristic_func=heuristic)
+    ile açıkça istenirse kullanılır.
     """
     na = g.nodes[a]
     nb = g.nodes[b]
     return abs(na.activity - nb.activity) + (abs(na.interaction - nb.interaction) / 100.0)
 
 
-def astar_shortest_path(g: Graph, start: int, goal: int) -> PathResult:
+def astar_shortest_path(
+    g: Graph,
+    start: int,
+    goal: int,
+    landmarks: Optional["LandmarkIndex"] = None,
+    cancel: Optional["CancelToken"] = None,
+    heuristic_func: Optional[Callable[[Graph, int, int], float]] = None,
+) -> PathResult:
+    """
+    A* en kısa yol.
+    Varsayılan heuristic h = 0'dır (Dijkstra'ya eşdeğer, her zaman en kısa).
+    landmarks verilirse (bkz. landmarks.LandmarkIndex) kabul edilebilir ALT
+    alt sınırı kullanılır; tablolar bu grafın içeriğine ait değilse ValueError.
+    heuristic_func(g, v, goal) açıkça verilirse o kullanılır (ör. özellik
+    farkı: heuristic; kabul edilebilir olmadığından sonuç en kısa olmayabilir).
+    cancel verilirse (bkz. jobs.CancelToken) döngüde ara ara kontrol edilir.
+    """
     if start not in g.nodes or goal not in g.nodes:
         raise ValueError("Start/goal graf içinde yok")
 
+    if landmarks is not None:
+        # başka bir graf için kurulmuş tablolar kabul edilebilir değildir
+        if not landmarks.is_current(g):
+            raise ValueError("Landmark tabloları bu graf için güncel değil")
+        h = lambda v: landmarks.lower_bound(v, goal)
+    elif heuristic_func is not None:
+        h = lambda v: heuristic_func(g, v, goal)
+    else:
+        h = lambda v: 0.0
+
     g_score: Dict[int, float] = {nid: float("inf") for nid in g.nodes}
     prev: Dict[int, Optional[int]] = {nid: None for nid in g.nodes}
     g_score[start] = 0.0
 
     # (f_score, g_score, node)
-    pq: List[Tuple[float, float, int]] = [(heuristic(g, start, goal), 0.0, start)]
+    pq: List[Tuple[float, float, int]] = [(h(start), 0.0, start)]
     visited_order: List[int] = []
     closed = set()
 
@@ -45,6 +82,8 @@ def astar_shortest_path(g: Graph, start: int, goal: int) -> PathResult:
             continue
         closed.add(u)
         visited_order.append(u)
+        if cancel is not None and len(visited_order) % CHECK_EVERY == 0:
+            cancel.check(len(visited_order), len(g.nodes))
 
         if u == goal:
             break
@@ -58,7 +97,7 @@ def astar_shortest_path(g: Graph, start: int, goal: int) -> PathResult:
             if tentative_g < g_score[v]:
                 g_score[v] = tentative_g
                 prev[v] = u
-                f_score = tentative_g + heuristic(g, v, goal)
+                f_score = tentative_g + h(v)
                 heapq.heappush(pq, (f_score, tentative_g, v))
 
     if g_score[goal] == float("inf"):
@@ -49,3 +49,45 @@ from graph import Graph
 g2 = Graph.from_csv("test_graf.csv", calculate_weight)
 print("CSV'den yüklenen graf - node sayısı:", len(g2.nodes))
 print("CSV'den yüklenen graf - komşuluk listesi:", g2.adjacency_list())
+
+    # Betweenness: örnek sayısı pozitif olmalı (kütüphane ve CLI)
+from centrality import betweenness_centrality
+import cli
+try:
+    betweenness_centrality(g2, samples=0)
+except ValueError as e:
+    print("samples=0 reddedildi:", e)
+else:
+    raise AssertionError("samples=0 kabul edilmemeliydi")
+try:
+    cli.build_parser().parse_args(["test_graf.csv", "--centrality", "betweenness", "--samples", "0"])
+except SystemExit as e:
+    assert e.code == 2
+    print("CLI --samples 0 kullanım hatası verdi")
+else:
+    raise AssertionError("--samples 0 kabul edilmemeliydi")
+
+    # gzip akışından yükleme: çağıranın akışı açık kalmalı, sızıntı olmamalı
+    # (python -W error::ResourceWarning backendtest.py ile de çalıştırılabilir)
+import gc
+import gzip
+import io
+import warnings
+with open("test_graf.csv", "rb") as f:
+    packed = io.BytesIO(gzip.compress(f.read()))
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter("always", ResourceWarning)
+    g3 = Graph.from_csv(packed, calculate_weight)
+    gc.collect()
+assert not caught, [str(w.message) for w in caught]
+assert not packed.closed
+packed.seek(0)
+assert packed.read(2) == b"\x1f\x8b"
+assert g3.adjacency_list() == g2.adjacency_list()
+from graph import _open_csv_source
+packed.seek(0)
+with _open_csv_source(packed) as text:
+    gz = text.buffer
+    text.readline()
+assert gz is not packed and gz.closed and not packed.closed
+print("gzip akışından yüklendi; akış açık, sızıntı yok")
@@ -0,0 +1,309 @@
+# benchmark.py
+# Performans karşılaştırmaları. Örnek kullanım:
+#   python benchmark.py storage --nodes 50000 --degree 10
+import argparse
+import gc
+import os
+import random
+import time
+import tracemalloc
+
+from graph import Graph, Node
+from dinamik_agirlik import calculate_weight
+from algoritma import BFS, DFS, bfs, dijkstra
+from dijkstra import dijkstra_shortest_path
+from contraction import ContractionHierarchy
+from apsp import iter_apsp_rows
+from centrality import betweenness_centrality, betweenness_error_bound
+from traversal import bfs_arrays, dfs_arrays, direction_optimizing_bfs
+from community import label_propagation_communities, louvain_communities, modularity
+from layout import force_layout, layout_available, np as layout_numpy
+
+
+def random_social_graph(n: int, avg_degree: float, seed: int = 42) -> Graph:
+    """n düğümlü, ortalama derecesi yaklaşık avg_degree olan rastgele graf."""
+    rnd = random.Random(seed)
+    g = Graph()
+    g.weight_func = calculate_weight
+    for i in range(1, n + 1):
+        g.add_node(Node(i, f"Node{i}", round(rnd.random(), 2), rnd.randint(0, 30)))
+
+    m = int(n * avg_degree / 2)
+    for _ in range(m):
+        a = rnd.randint(1, n)
+        b = rnd.randint(1, n)
+        if a == b:
+            continue
+        g.add_undirected_edge(a, b)
+    g.refresh_weights()
+    return g
+
+
+def grid_graph(n: int, seed: int = 42) -> Graph:
+    """Yaklaşık n düğümlü, rastgele ağırlıklı kare ızgara (yol ağı benzeri)."""
+    rnd = random.Random(seed)
+    side = max(2, int(n ** 0.5))
+    g = Graph()
+    for i in range(side * side):
+        g.add_node(Node(i, f"Node{i}", 0.5, 10))
+    for r in range(side):
+        for c in range(side):
+            i = r * side + c
+            if c + 1 < side:
+                g.add_undirected_edge(i, i + 1, rnd.uniform(1.0, 10.0))
+            if r + 1 < side:
+                g.add_undirected_edge(i, i + side, rnd.uniform(1.0, 10.0))
+    return g
+
+
+def planted_partition_graph(
+    n: int, groups: int, avg_degree: float, mixing: float = 0.1, seed: int = 42
+) -> Graph:
+    """
+    Ekilmiş bölüntü (planted partition): düğüm i, i % groups grubundadır;
+    kenarların yaklaşık (1 - mixing) kadarı grup içindedir. Ağırlıklar 1.0.
+    """
+    rnd = random.Random(seed)
+    g = Graph()
+    for i in range(n):
+        g.add_node(Node(i, f"Node{i}", round(rnd.random(), 2), rnd.randint(0, 30)))
+
+    m = int(n * avg_degree / 2)
+    for _ in range(m):
+        a = rnd.randrange(n)
+        if rnd.random() < mixing:
+            b = rnd.randrange(n)
+        else:
+            # aynı gruptan rastgele bir düğüm
+            b = a % groups + groups * rnd.randrange((n - 1 - a % groups) // groups + 1)
+        if a != b:
+            g.add_undirected_edge(a, b, 1.0)
+    return g
+
+
+def _timeit(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_storage(args) -> None:
+    """Dict-of-lists ile CSR (freeze) düzenini bellek ve gezinme hızında kıyaslar."""
+    gc.collect()
+    tracemalloc.start()
+    g = random_social_graph(args.nodes, args.degree, args.seed)
+    gc.collect()
+    mem_dict = tracemalloc.get_traced_memory()[0]
+
+    csr = g.freeze()
+    gc.collect()
+    mem_csr = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Süre ölçümleri tracemalloc kapalıyken yapılır
+    start = next(iter(g.nodes))
+    g.thaw()
+    t_bfs_dict = _timeit(bfs, g, start)
+    t_dij_dict = _timeit(dijkstra, g, start)
+    g.freeze()
+    t_bfs_csr = _timeit(bfs, g, start)
+    t_dij_csr = _timeit(dijkstra, g, start)
+
+    print(f"Düğüm: {len(g.nodes)}  Yönlü kenar: {csr.num_edges}")
+    print(f"Bellek (tüm graf)  dict-of-lists: {mem_dict / 1e6:8.1f} MB")
+    print(f"Bellek (tüm graf)  CSR          : {mem_csr / 1e6:8.1f} MB"
+          f"  (diziler: {csr.nbytes() / 1e6:.1f} MB)")
+    print(f"BFS       dict: {t_bfs_dict * 1000:8.1f} ms   CSR: {t_bfs_csr * 1000:8.1f} ms")
+    print(f"Dijkstra  dict: {t_dij_dict * 1000:8.1f} ms   CSR: {t_dij_csr * 1000:8.1f} ms")
+
+
+def bench_bidirectional(args) -> None:
+    """Tek ve çift yönlü Dijkstra'nın kesinleşen düğüm sayısı ve süresi."""
+    g = random_social_graph(args.nodes, args.degree, args.seed)
+    rnd = random.Random(args.seed)
+    ids = list(g.nodes)
+    pairs = [(rnd.choice(ids), rnd.choice(ids)) for _ in range(args.queries)]
+
+    totals = {}
+    for label, bidir in (("tek yönlü", False), ("çift yönlü", True)):
+        settled = 0
+        t0 = time.perf_counter()
+        for s, t in pairs:
+            settled += len(dijkstra_shortest_path(g, s, t, bidirectional=bidir).visited_order)
+        totals[label] = (settled / len(pairs), (time.perf_counter() - t0) / len(pairs))
+
+    print(f"Düğüm: {len(g.nodes)}  Sorgu: {len(pairs)}")
+    for label, (avg_settled, avg_time) in totals.items():
+        print(f"{label:11s}: ort. kesinleşen düğüm {avg_settled:10.1f}  "
+              f"ort. süre {avg_time * 1000:8.2f} ms")
+
+
+def bench_ch(args) -> None:
+    """Contraction Hierarchies sorgu süresi ile düz Dijkstra karşılaştırması."""
+    g = grid_graph(args.nodes, args.seed)
+    t0 = time.perf_counter()
+    ch = ContractionHierarchy(g)
+    t_prep = time.perf_counter() - t0
+
+    rnd = random.Random(args.seed)
+    ids = list(g.nodes)
+    pairs = [(rnd.choice(ids), rnd.choice(ids)) for _ in range(args.queries)]
+
+    t0 = time.perf_counter()
+    for s, t in pairs:
+        dijkstra_shortest_path(g, s, t)
+    t_dij = (time.perf_counter() - t0) / len(pairs)
+
+    t0 = time.perf_counter()
+    for s, t in pairs:
+        ch.shortest_path(s, t)
+    t_ch = (time.perf_counter() - t0) / len(pairs)
+
+    print(f"Düğüm: {len(g.nodes)}  Kısayol: {len(ch.middle)}  Önhesap: {t_prep:.1f} s")
+    print(f"Ort. sorgu  Dijkstra: {t_dij * 1000:8.2f} ms   CH: {t_ch * 1000:8.2f} ms")
+
+
+def bench_apsp(args) -> None:
+    """Paralel APSP'nin işçi sayısına göre ölçeklenmesi (ilk --queries kaynak)."""
+    g = random_social_graph(args.nodes, args.degree, args.seed)
+    max_workers = os.cpu_count() or 1
+    base = None
+    workers = 1
+    while workers <= max_workers:
+        t0 = time.perf_counter()
+        for k, _row in enumerate(iter_apsp_rows(g, workers=workers, chunk_size=8)):
+            if k + 1 >= args.queries:
+                break
+        elapsed = time.perf_counter() - t0
+        base = base or elapsed
+        print(f"işçi={workers:3d}  {args.queries} kaynak: {elapsed:7.2f} s"
+              f"  hızlanma: {base / elapsed:5.2f}x")
+        workers *= 2
+
+
+def bench_betweenness(args) -> None:
+    """Kesin ve örneklemeli (--queries pivot) betweenness süresi ve hatası."""
+    g = random_social_graph(args.nodes, args.degree, args.seed)
+    n = len(g.nodes)
+
+    t0 = time.perf_counter()
+    exact = {r.node_id: r.centrality for r in betweenness_centrality(g, workers=None)}
+    t_exact = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    approx = betweenness_centrality(
+        g, samples=args.queries, workers=None, seed=args.seed
+    )
+    t_approx = time.perf_counter() - t0
+
+    err = max(abs(r.centrality - exact[r.node_id]) for r in approx)
+    print(f"kesin       : {t_exact:7.2f} s")
+    print(f"örneklemeli : {t_approx:7.2f} s  ({args.queries} pivot)")
+    print(f"en büyük hata: {err:.5f}  (sınır: {betweenness_error_bound(n, args.queries):.5f})")
+
+
+def bench_traversal(args) -> None:
+    """algoritma.BFS/DFS sınıfları ile dizi tabanlı çekirdekler (traversal.py)."""
+    g = random_social_graph(args.nodes, args.degree, args.seed)
+    rnd = random.Random(args.seed)
+    ids = list(g.nodes)
+    starts = [rnd.choice(ids) for _ in range(max(1, min(args.queries, 5)))]
+
+    t0 = time.perf_counter()
+    g.to_csr()
+    print(f"Düğüm: {len(g.nodes)}  CSR kurulumu (bir kez): "
+          f"{time.perf_counter() - t0:.2f} s")
+
+    runs = (
+        ("BFS (algoritma)", lambda s: BFS().run(g, s)),
+        ("bfs_arrays", lambda s: bfs_arrays(g, s)),
+        ("direction_optimizing_bfs", lambda s: direction_optimizing_bfs(g, s)),
+        ("DFS (algoritma)", lambda s: DFS().run(g, s)),
+        ("dfs_arrays", lambda s: dfs_arrays(g, s)),
+    )
+    for label, fn in runs:
+        t0 = time.perf_counter()
+        for s in starts:
+            fn(s)
+        avg = (time.perf_counter() - t0) / len(starts)
+        print(f"{label:25s}: ort. {avg * 1000:9.1f} ms")
+
+
+def bench_community(args) -> None:
+    """Louvain ve etiket yayılımı: ekilmiş bölüntüde süre, modülerlik, saflık."""
+    g = planted_partition_graph(args.nodes, args.groups, args.degree, seed=args.seed)
+    truth = {nid: nid % args.groups for nid in g.nodes}
+    print(f"Düğüm: {len(g.nodes)}  Kenar: {g.to_csr().num_edges // 2}  "
+          f"Grup: {args.groups}  Ekilmiş modülerlik: {modularity(g, truth):.4f}")
+
+    for label, func in (
+        ("Louvain", louvain_communities),
+        ("Etiket yayılımı", label_propagation_communities),
+    ):
+        t0 = time.perf_counter()
+        res = func(g, seed=args.seed)
+        elapsed = time.perf_counter() - t0
+        # saflık: her bulunan topluluktaki en kalabalık gerçek grubun payı
+        majority = 0
+        for comm in res.communities:
+            counts = {}
+            for nid in comm:
+                counts[truth[nid]] = counts.get(truth[nid], 0) + 1
+            majority += max(counts.values())
+        print(f"{label:16s}: {elapsed:7.2f} s  topluluk: {len(res.communities):6d}  "
+              f"Q={res.modularity:.4f}  saflık={majority / len(g.nodes):.3f}")
+
+
+def bench_layout(args) -> None:
+    """Barnes-Hut yerleşim: iterasyon başına süre, kenar / rastgele çift uzunluğu."""
+    g = planted_partition_graph(args.nodes, args.groups, args.degree, seed=args.seed)
+    n = len(g.nodes)
+    if not layout_available(n):
+        print(f"numpy yok: {n} düğüm için yerleşim atlanıyor")
+        return
+    iterations = 20
+    t0 = time.perf_counter()
+    pos = force_layout(g, iterations=iterations, seed=args.seed)
+    elapsed = time.perf_counter() - t0
+    print(f"Düğüm: {n}  numpy: {'var' if layout_numpy is not None else 'yok'}  "
+          f"{elapsed / iterations * 1000:.1f} ms/iterasyon")
+
+    def dist(a: int, b: int) -> float:
+        (x1, y1), (x2, y2) = pos[a], pos[b]
+        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+
+    rnd = random.Random(args.seed)
+    ids = list(g.nodes)
+    edges = [(a, b) for a in ids for b in g.neighbors(a) if a < b]
+    sample = [rnd.choice(edges) for _ in range(1000)] if edges else []
+    pairs = [(rnd.choice(ids), rnd.choice(ids)) for _ in range(1000)]
+    if sample:
+        print(f"Ortalama kenar uzunluğu: {sum(dist(a, b) for a, b in sample) / len(sample):.1f}  "
+              f"rastgele çift: {sum(dist(a, b) for a, b in pairs) / len(pairs):.1f}")
+
+
+BENCHMARKS = {
+    "storage": bench_storage,
+    "bidirectional": bench_bidirectional,
+    "ch": bench_ch,
+    "apsp": bench_apsp,
+    "betweenness": bench_betweenness,
+    "traversal": bench_traversal,
+    "community": bench_community,
+    "layout": bench_layout,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Graf performans karşılaştırmaları")
+    parser.add_argument("name", choices=sorted(BENCHMARKS))
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--degree", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--groups", type=int, default=100)
+    args = parser.parse_args()
+    BENCHMARKS[args.name](args)
@@ -1,9 +1,24 @@
 # centrality.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List
+import heapq
+import math
+import random
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
 
+from csr import CSRGraph
 from graph import Graph
+import parallel
+
+if TYPE_CHECKING:
+    from jobs import CancelToken
+
+try:
+    import numpy as np
+except ImportError:  # numpy isteğe bağlı; yoksa saf Python yolu kullanılır
+    np = None
 
 
 @dataclass
@@ -11,7 +26,16 @@ class CentralityRow:
     node_id: int
     name: str
     degree: int
-    centrality: float  # normalize edilmiş degree centrality
+    centrality: float  # normalize edilmiş merkezilik (degree, betweenness, ...)
+
+
+@dataclass
+class RankResult:
+    """Kuvvet yinelemesi (PageRank / eigenvector) sonucu."""
+    rows: List[CentralityRow]
+    scores: Dict[int, float]  # node_id -> skor; sonraki çağrıya start olarak verilebilir
+    trace: List[float] = field(default_factory=list)  # iterasyon başına (göreli) L1 değişim
+    converged: bool = False
 
 
 def degree_centrality(g: Graph) -> List[CentralityRow]:
@@ -41,5 +65,643 @@ def degree_centrality(g: Graph) -> List[CentralityRow]:
 
 
 def top_k_degree_centrality(g: Graph, k: int = 5) -> List[CentralityRow]:
-    return degree_centrality(g)[:k]
+    """
+    degree_centrality(g)[:k] ile aynı sonuç; ancak tüm düğümleri sıralayıp
+    her biri için satır üretmek yerine k boyutlu bir yığın kullanır:
+    O(n log k) zaman, yalnızca k satır.
+    """
+    n = len(g.nodes)
+    if n <= 1:
+        return []
+    top = heapq.nlargest(k, g.nodes.values(), key=lambda node: node.degree)
+    return [
+        CentralityRow(
+            node_id=node.id,
+            name=node.name,
+            degree=node.degree,
+            centrality=node.degree / (n - 1),
+        )
+        for node in top
+    ]
+
+
+# ================== Betweenness (Brandes) ==================
+
+def rows_from_scores(
+    g: Graph, ids: Sequence[int], scores: Sequence[float]
+) -> List[CentralityRow]:
+    """CSR indeks sırasındaki skorlardan büyükten küçüğe CentralityRow listesi."""
+    rows = [
+        CentralityRow(
+            node_id=nid,
+            name=g.nodes[nid].name,
+            degree=g.nodes[nid].degree,
+            centrality=score,
+        )
+        for nid, score in zip(ids, scores)
+    ]
+    rows.sort(key=lambda r: r.centrality, reverse=True)
+    return rows
+
+
+def _brandes_accumulate(
+    csr: CSRGraph,
+    sources: Sequence[int],
+    weighted: bool,
+    cancel: Optional["CancelToken"] = None,
+) -> array:
+    """
+    Verilen kaynak indeksleri için Brandes bağımlılıklarını toplar.
+    Sonuç: bc[i] = sum_s delta_s(i)  (sıralı s,t çiftleri üzerinden)
+    cancel her kaynaktan önce kontrol edilir.
+    """
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    bc = array("d", [0.0]) * n
+    inf = math.inf
+
+    for done_sources, s in enumerate(sources):
+        if cancel is not None:
+            cancel.check(done_sources, len(sources))
+        sigma = [0] * n
+        dist = [inf] * n
+        sigma[s] = 1
+        dist[s] = 0.0
+        order: List[int] = []  # kesinleşme sırası
+
+        if weighted:
+            pq = [(0.0, s)]
+            done = [False] * n
+            while pq:
+                d, v = heapq.heappop(pq)
+                if done[v]:
+                    continue
+                done[v] = True
+                order.append(v)
+                for k in range(offsets[v], offsets[v + 1]):
+                    w = targets[k]
+                    nd = d + weights[k]
+                    if nd < dist[w]:
+                        dist[w] = nd
+                        sigma[w] = sigma[v]
+                        heapq.heappush(pq, (nd, w))
+                    elif nd == dist[w]:
+                        sigma[w] += sigma[v]
+        else:
+            q = deque([s])
+            while q:
+                v = q.popleft()
+                order.append(v)
+                dv = dist[v] + 1
+                for k in range(offsets[v], offsets[v + 1]):
+                    w = targets[k]
+                    if dist[w] == inf:
+                        dist[w] = dv
+                        q.append(w)
+                    if dist[w] == dv:
+                        sigma[w] += sigma[v]
+
+        # Geri izleme: v'nin en kısa yol ardılları üzerinden bağımlılık
+        delta = [0.0] * n
+        for v in reversed(order):
+            dv = dist[v]
+            sv = sigma[v]
+            acc = 0.0
+            for k in range(offsets[v], offsets[v + 1]):
+                w = targets[k]
+                step = weights[k] if weighted else 1
+                if dist[w] == dv + step:
+                    acc += sv / sigma[w] * (1.0 + delta[w])
+            delta[v] = acc
+            if v != s:
+                bc[v] += acc
+    return bc
+
+
+def _betweenness_chunk(sources: List[int], weighted: bool) -> bytes:
+    """İşçi süreç: paylaşılan CSR üzerinde bir kaynak parçası."""
+    return _brandes_accumulate(parallel.worker_csr(), sources, weighted).tobytes()
+
+
+def betweenness_error_bound(n: int, samples: int, delta: float = 0.05) -> float:
+    """
+    Örneklemeli betweenness için (normalize) mutlak hata sınırı:
+    1 - delta olasılıkla tüm düğümlerde |tahmin - gerçek| <= eps,
+    eps = sqrt(ln(2n / delta) / (2 * samples))  (Hoeffding + birleşim sınırı)
+    """
+    if samples <= 0 or n <= 0:
+        return math.inf
+    return math.sqrt(math.log(2 * n / delta) / (2 * samples))
+
+
+def betweenness_centrality(
+    g: Graph,
+    weighted: bool = True,
+    samples: Optional[int] = None,
+    workers: Optional[int] = 1,
+    seed: Optional[int] = None,
+    chunk_size: int = 32,
+    cancel: Optional["CancelToken"] = None,
+) -> List[CentralityRow]:
+    """
+    Brandes betweenness centrality.
+      C_B(v) = sum_{s != v != t} sigma_st(v) / sigma_st, (n-1)(n-2)/2 ile normalize
+    weighted : True ise kenar ağırlıklı (Dijkstra), değilse adım sayısı (BFS)
+    samples  : verilirse yalnızca rastgele seçilen bu kadar kaynak (pivot)
+               kullanılır ve sonuç n/samples ile ölçeklenir (yaklaşık mod;
+               hata sınırı için bkz. betweenness_error_bound)
+    workers  : kaynaklar bu kadar işçi sürece dağıtılır (None: CPU sayısı)
+    cancel   : jobs.CancelToken; kaynak (paralelde parça) başına kontrol edilir
+    """
+    if samples is not None and samples <= 0:
+        raise ValueError(f"samples pozitif olmalı: {samples}")
+    csr = g.to_csr()
+    n = len(csr)
+    if n <= 2:
+        return rows_from_scores(g, csr.ids, [0.0] * n)
+
+    sources = list(range(n))
+    scale = 1.0
+    if samples is not None and samples < n:
+        sources = random.Random(seed).sample(sources, samples)
+        scale = n / samples
+
+    workers = parallel.resolve_workers(workers)
+    if workers == 1:
+        bc = _brandes_accumulate(csr, sources, weighted, cancel)
+    else:
+        bc = array("d", [0.0]) * n
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        shared, pool = parallel.csr_pool(csr, workers)
+        with shared, pool:
+            futures = [pool.submit(_betweenness_chunk, c, weighted) for c in chunks]
+            for done_chunks, future in enumerate(futures):
+                if cancel is not None:
+                    if cancel.cancelled:
+                        for f in futures:
+                            f.cancel()  # sırada bekleyen parçalar başlamasın
+                    cancel.check(done_chunks, len(chunks))
+                raw = future.result()
+                part = array("d")
+                part.frombytes(raw)
+                for i, x in enumerate(part):
+                    bc[i] += x
+
+    norm = scale / ((n - 1) * (n - 2))
+    return rows_from_scores(g, csr.ids, [x * norm for x in bc])
+
+
+# ================== Closeness / Harmonic ==================
+#
+# Ağırlıksız graflarda mesafe toplamları bit-paralel çok kaynaklı BFS ile
+# bulunur: bir geçişte word_size kaynak birlikte ilerler; her düğümün
+# "hangi kaynaklar beni gördü" bilgisi tek bir tamsayının bitlerinde tutulur.
+# Graf yönsüz olduğundan d(s, v) = d(v, s); v'ye ilk kez d. seviyede ulaşan
+# kaynak sayısı popcount ile bulunup doğrudan v'nin toplamına eklenir.
+
+def _bitparallel_distance_sums(csr: CSRGraph, word_size: int = 64):
+    """Her düğüm için (mesafe toplamı, ulaşılan düğüm sayısı, 1/d toplamı)."""
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    dist_sum = [0] * n
+    reach = [0] * n
+    harm = [0.0] * n
+
+    for base in range(0, n, word_size):
+        visited = [0] * n
+        frontier = {}
+        for j, s in enumerate(range(base, min(base + word_size, n))):
+            visited[s] = 1 << j
+            frontier[s] = 1 << j
+
+        level = 0
+        while frontier:
+            level += 1
+            pushed = {}
+            for u, bits in frontier.items():
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    pushed[v] = pushed.get(v, 0) | bits
+
+            frontier = {}
+            inv = 1.0 / level
+            for v, bits in pushed.items():
+                new = bits & ~visited[v]
+                if new:
+                    visited[v] |= new
+                    frontier[v] = new
+                    c = new.bit_count()
+                    dist_sum[v] += c * level
+                    reach[v] += c
+                    harm[v] += c * inv
+
+    return dist_sum, reach, harm
+
+
+def _dijkstra_distance_sums(csr: CSRGraph):
+    """Ağırlıklı graf için aynı toplamlar; her kaynaktan csr.sssp."""
+    n = len(csr)
+    dist_sum = [0.0] * n
+    reach = [0] * n
+    harm = [0.0] * n
+    for s in range(n):
+        for d in csr.sssp(s):
+            if 0.0 < d < math.inf:
+                dist_sum[s] += d
+                reach[s] += 1
+                harm[s] += 1.0 / d
+    return dist_sum, reach, harm
+
+
+def closeness_value(dist_sum: float, reach: int, n: int) -> float:
+    """
+    Wasserman-Faust closeness: (r / (n-1)) * (r / toplam),
+    r = v'den ulaşılan diğer düğüm sayısı (bağlı olmayan graflarda da anlamlı).
+    """
+    if dist_sum <= 0 or n <= 1:
+        return 0.0
+    return (reach / (n - 1)) * (reach / dist_sum)
+
+
+def distance_sums(csr: CSRGraph, weighted: bool, word_size: int):
+    """
+    Her düğüm için (mesafe toplamı, ulaşılan düğüm sayısı, harmonik toplam)
+    dizileri; ağırlıklıysa Dijkstra, değilse bit-paralel BFS ile.
+    """
+    if weighted:
+        return _dijkstra_distance_sums(csr)
+    return _bitparallel_distance_sums(csr, word_size)
+
+
+def closeness_centrality(
+    g: Graph, weighted: bool = False, word_size: int = 64
+) -> List[CentralityRow]:
+    """
+    Closeness centrality (Wasserman-Faust normalizasyonu):
+      C_C(v) = (r / (n-1)) * (r / sum_u d(v, u)),  r = ulaşılan düğüm sayısı
+    weighted=False: adım sayısı, bit-paralel BFS (word_size kaynak / geçiş)
+    weighted=True : kenar ağırlıkları, her düğümden Dijkstra
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    dist_sum, reach, _harm = distance_sums(csr, weighted, word_size)
+    scores = [closeness_value(dist_sum[i], reach[i], n) for i in range(n)]
+    return rows_from_scores(g, csr.ids, scores)
+
+
+def harmonic_centrality(
+    g: Graph, weighted: bool = False, word_size: int = 64
+) -> List[CentralityRow]:
+    """
+    Harmonic centrality:
+      C_H(v) = sum_{u != v} 1 / d(v, u) / (n - 1)   (ulaşılamayan: 0)
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    _dist_sum, _reach, harm = distance_sums(csr, weighted, word_size)
+    norm = 1.0 / (n - 1) if n > 1 else 0.0
+    return rows_from_scores(g, csr.ids, [h * norm for h in harm])
+
+
+# ---------- Top-k: üst sınırla budanan tek kaynaklı aramalar ----------
+
+def _component_sizes(csr: CSRGraph) -> List[int]:
+    """Her indeks için içinde bulunduğu bağlı bileşenin boyutu."""
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    size = [0] * n
+    for s in range(n):
+        if size[s]:
+            continue
+        members = [s]
+        size[s] = -1  # ziyaret edildi işareti
+        for u in members:
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if not size[v]:
+                    size[v] = -1
+                    members.append(v)
+        for u in members:
+            size[u] = len(members)
+    return size
+
+
+def _bounded_scan(
+    csr: CSRGraph,
+    s: int,
+    weighted: bool,
+    comp_size: int,
+    metric: str,
+    threshold: float,
+) -> Optional[float]:
+    """
+    s'den BFS/Dijkstra; her yeni mesafe seviyesinde skorun üst sınırı
+    hesaplanır (henüz görülmeyen düğümlerin hepsi en yakın olası mesafede
+    varsayılır). Üst sınır threshold'un altına düşerse arama kesilir, None döner.
+    """
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    others = comp_size - 1  # closeness için r
+
+    def upper(total, harm, near, d_near, far, d_far) -> float:
+        # near adet düğüm d_near'de, far adet düğüm en iyi ihtimalle d_far'da
+        if metric == "harmonic":
+            return (harm + near / d_near + far / d_far) / (n - 1)
+        return closeness_value(total + near * d_near + far * d_far, others, n)
+
+    total = 0.0
+    harm = 0.0
+
+    if not weighted:
+        # Seviye seviye BFS: bir sonraki seviyenin boyutu kesin bilinir,
+        # geri kalanlar en az bir seviye daha uzaktadır
+        seen = {s}
+        frontier = [s]
+        level = 0
+        while frontier:
+            level += 1
+            nxt = []
+            for u in frontier:
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if v not in seen:
+                        seen.add(v)
+                        nxt.append(v)
+            if not nxt:
+                break
+            far = comp_size - len(seen)
+            if upper(total, harm, len(nxt), level, far, level + 1) < threshold:
+                return None
+            total += len(nxt) * level
+            harm += len(nxt) / level
+            frontier = nxt
+    else:
+        weights = csr.weights
+        remaining = others
+        dist = {s: 0.0}
+        done = set()
+        pq = [(0.0, s)]
+        last = 0.0
+        while pq:
+            d, u = heapq.heappop(pq)
+            if u in done:
+                continue
+            done.add(u)
+            if d > 0:
+                if d > last:
+                    # u'dan sonra kesinleşecek her düğümün mesafesi >= d
+                    if upper(total, harm, 0, 1.0, remaining, d) < threshold:
+                        return None
+                    last = d
+                total += d
+                harm += 1.0 / d
+                remaining -= 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = d + weights[k]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+
+    if metric == "harmonic":
+        return harm / (n - 1)
+    return closeness_value(total, others, n)
+
+
+def _top_k_pruned(
+    g: Graph, k: int, weighted: bool, metric: str, cancel: Optional["CancelToken"]
+) -> List[CentralityRow]:
+    csr = g.to_csr()
+    n = len(csr)
+    if n <= 1 or k <= 0:
+        return []
+    comp = _component_sizes(csr)
+
+    # Yüksek dereceli düğümler önce: eşik erken yükselir, budama artar
+    order = sorted(range(n), key=csr.degree, reverse=True)
+    best: List[tuple] = []  # (skor, indeks) min-heap
+    for done, s in enumerate(order):
+        if cancel is not None:
+            cancel.check(done, n)
+        threshold = best[0][0] if len(best) >= k else -1.0
+        score = _bounded_scan(csr, s, weighted, comp[s], metric, threshold)
+        if score is None:
+            continue
+        if len(best) < k:
+            heapq.heappush(best, (score, s))
+        elif score > best[0][0]:
+            heapq.heapreplace(best, (score, s))
+
+    return rows_from_scores(
+        g, [csr.ids[i] for _, i in best], [score for score, _ in best]
+    )
+
+
+def top_k_closeness_centrality(
+    g: Graph, k: int = 5, weighted: bool = False, cancel: Optional["CancelToken"] = None
+) -> List[CentralityRow]:
+    """En yüksek closeness'a sahip k düğüm (sınırı yetmeyen kaynaklar budanır)."""
+    return _top_k_pruned(g, k, weighted, "closeness", cancel)
+
+
+def top_k_harmonic_centrality(
+    g: Graph, k: int = 5, weighted: bool = False, cancel: Optional["CancelToken"] = None
+) -> List[CentralityRow]:
+    """En yüksek harmonic centrality'ye sahip k düğüm (budamalı)."""
+    return _top_k_pruned(g, k, weighted, "harmonic", cancel)
+
+
+# ================== PageRank / Eigenvector ==================
+#
+# Her iki skor da kuvvet yinelemesiyle (power iteration) bulunur. Seyrek
+# matris ayrıca kurulmaz: CSR dizileri (offsets/targets/weights) zaten
+# matrisin satır sıkıştırılmış halidir. numpy varsa her iterasyon birkaç
+# vektörel işlemdir (np.bincount ile dağıtma), yoksa dizi tabanlı döngü.
+
+def _initial_vector(csr: CSRGraph, start: Optional[Dict[int, float]]) -> List[float]:
+    """
+    Başlangıç vektörü (toplamı 1). start verilirse (önceki sonucun scores'u)
+    oradan ısınarak başlanır; yeni eklenen düğümler ortalama değeri alır.
+    """
+    n = len(csr)
+    if not start:
+        return [1.0 / n] * n
+    known = [start[nid] for nid in csr.ids if nid in start]
+    fill = sum(known) / len(known) if known else 1.0 / n
+    x = [float(start.get(nid, fill)) for nid in csr.ids]
+    total = sum(x)
+    if total <= 0:
+        return [1.0 / n] * n
+    return [v / total for v in x]
+
+
+def _power_iterate(step: Callable, x, tol: float, max_iter: int):
+    """
+    x <- step(x) tekrarı; step (yeni x, değişim) döner. Değişim toplamı 1'e
+    ölçekli vektörde L1 farkıdır, bu yüzden eşik düğüm sayısından bağımsızdır.
+    """
+    trace: List[float] = []
+    for _ in range(max_iter):
+        y, err = step(x)
+        trace.append(err)
+        x = y
+        if err < tol:
+            return x, trace, True
+    return x, trace, False
+
+
+def _rank_result(g: Graph, csr: CSRGraph, x, trace, converged) -> RankResult:
+    scores = [float(v) for v in x]
+    return RankResult(
+        rows=rows_from_scores(g, csr.ids, scores),
+        scores=dict(zip(csr.ids, scores)),
+        trace=trace,
+        converged=converged,
+    )
+
+
+def _csr_numpy(csr: CSRGraph, weighted: bool):
+    """CSR dizilerinin numpy görünümleri: (kaynak, hedef, ağırlık) kenar vektörleri."""
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    tgt = np.asarray(csr.targets, dtype=np.int64)
+    src = np.repeat(np.arange(len(csr), dtype=np.int64), np.diff(offsets))
+    if weighted:
+        w = np.asarray(csr.weights, dtype=np.float64)
+    else:
+        w = np.ones(len(tgt), dtype=np.float64)
+    return src, tgt, w
+
+
+def pagerank(
+    g: Graph,
+    alpha: float = 0.85,
+    weighted: bool = True,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    start: Optional[Dict[int, float]] = None,
+) -> RankResult:
+    """
+    PageRank:
+      x'[v] = (1 - alpha) / n + alpha * sum_{u~v} x[u] * w(u,v) / W(u)
+              + alpha * (çıkışı olmayan düğümlerin kütlesi) / n
+    weighted=True ise w kenar ağırlığıdır (calculate_weight benzerliği),
+    değilse her kenar 1 sayılır. Skorların toplamı 1'dir.
+    start: önceki bir RankResult.scores; graf düzenlemelerinden sonra
+    yakınsamayı hızlandırmak için başlangıç vektörü olarak kullanılır.
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    if n == 0:
+        return RankResult(rows=[], scores={}, converged=True)
+    x0 = _initial_vector(csr, start)
+    base = (1.0 - alpha) / n
+
+    if np is not None:
+        src, tgt, w = _csr_numpy(csr, weighted)
+        out_w = np.bincount(src, weights=w, minlength=n)
+        dangling = out_w == 0
+        coef = np.divide(
+            w, out_w[src], out=np.zeros_like(w), where=out_w[src] > 0
+        )
+
+        def step(x):
+            y = alpha * np.bincount(tgt, weights=x[src] * coef, minlength=n)
+            y += base + alpha * x[dangling].sum() / n
+            return y, float(np.abs(y - x).sum())
+
+        x, trace, ok = _power_iterate(step, np.asarray(x0), tol, max_iter)
+        return _rank_result(g, csr, x, trace, ok)
+
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    out_w = [0.0] * n
+    for u in range(n):
+        if weighted:
+            out_w[u] = sum(weights[offsets[u]:offsets[u + 1]])
+        else:
+            out_w[u] = float(offsets[u + 1] - offsets[u])
+
+    def step(x):
+        dangling_mass = 0.0
+        y = [0.0] * n
+        for u in range(n):
+            if out_w[u] <= 0:
+                dangling_mass += x[u]
+                continue
+            share = alpha * x[u] / out_w[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                y[targets[k]] += share * (weights[k] if weighted else 1.0)
+        extra = base + alpha * dangling_mass / n
+        err = 0.0
+        for v in range(n):
+            y[v] += extra
+            err += abs(y[v] - x[v])
+        return y, err
+
+    x, trace, ok = _power_iterate(step, x0, tol, max_iter)
+    return _rank_result(g, csr, x, trace, ok)
+
+
+def eigenvector_centrality(
+    g: Graph,
+    weighted: bool = True,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    start: Optional[Dict[int, float]] = None,
+) -> RankResult:
+    """
+    Eigenvector centrality: komşuluk matrisinin baskın öz vektörü.
+    (A + c*I) ile yinelenir (c = ortalama kenar ağırlığı); böylece iki
+    parçalı graflarda salınım olmaz, öz vektör değişmez. Kaydırma ağırlıklarla
+    ölçeklenir ki küçük ağırlıklarda yakınsama yavaşlamasın.
+    Sonuç L2 normu 1 olacak şekilde ölçeklenir.
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    if n == 0:
+        return RankResult(rows=[], scores={}, converged=True)
+    x0 = _initial_vector(csr, start)
+    norm0 = math.sqrt(sum(v * v for v in x0))
+    x0 = [v / norm0 for v in x0]
+
+    if np is not None:
+        src, tgt, w = _csr_numpy(csr, weighted)
+        shift = float(w.mean()) if len(w) else 1.0
+
+        def step(x):
+            y = shift * x + np.bincount(src, weights=w * x[tgt], minlength=n)
+            norm = float(np.sqrt(y @ y)) or 1.0
+            y /= norm
+            return y, float(np.abs(y - x).sum() / np.abs(y).sum())
+
+        x, trace, ok = _power_iterate(step, np.asarray(x0), tol, max_iter)
+        return _rank_result(g, csr, x, trace, ok)
+
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    m = len(targets)
+    shift = (sum(weights) / m if weighted else 1.0) if m else 1.0
+
+    def step(x):
+        y = [shift * v for v in x]
+        for u in range(n):
+            acc = 0.0
+            for k in range(offsets[u], offsets[u + 1]):
+                acc += (weights[k] if weighted else 1.0) * x[targets[k]]
+            y[u] += acc
+        norm = math.sqrt(sum(v * v for v in y)) or 1.0
+        err = 0.0
+        for v in range(n):
+            y[v] /= norm
+            err += abs(y[v] - x[v])
+        return y, err / (sum(map(abs, y)) or 1.0)
 
+    x, trace, ok = _power_iterate(step, x0, tol, max_iter)
+    return _rank_result(g, csr, x, trace, ok)
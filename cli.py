@@ -0,0 +1,417 @@
+# cli.py
+# Ekransız (headless) toplu analiz giriş noktası. Örnek kullanım:
+#   python cli.py graf.csv --components --centrality degree,betweenness --top 20
+#   python cli.py graf.snap --paths sorgular.txt --algorithm astar --workers 4
+#   python cli.py graf.csv --coloring --format csv -o renkler.csv --profile
+#
+# Graf CSV (.csv / .csv.gz) ya da snapshot dosyasından yüklenir (biçim dosya
+# başlığından anlaşılır). Sonuçlar üretildikçe yazılır: JSON satırları
+# (varsayılan) ya da CSV. Her kaydın "type" alanı analizi belirtir; CSV'de
+# kayıt türü değişince yeni bir başlık satırı yazılır.
+# --profile aşama sürelerini stderr'e JSON satırı olarak yazar.
+from __future__ import annotations
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import IO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from graph import Graph, Node
+from dinamik_agirlik import calculate_weight
+from dijkstra import dijkstra_shortest_path
+from astar import astar_shortest_path
+from contraction import ContractionHierarchy
+from landmarks import LandmarkIndex
+from components import connected_components
+from centrality import (
+    betweenness_centrality,
+    eigenvector_centrality,
+    degree_centrality,
+    pagerank,
+    top_k_closeness_centrality,
+    top_k_degree_centrality,
+    top_k_harmonic_centrality,
+)
+from sharding import (
+    sharded_closeness_centrality,
+    sharded_coloring,
+    sharded_harmonic_centrality,
+)
+from snapshot import MAGIC as SNAPSHOT_MAGIC
+from welsh_powell import STRATEGIES
+import parallel
+
+PATH_ALGORITHMS = ("dijkstra", "bidirectional", "astar", "ch")
+CENTRALITY_METRICS = (
+    "degree", "closeness", "harmonic", "betweenness", "pagerank", "eigenvector",
+)
+# Paralel yol sorgularında işçiye tek seferde giden sorgu sayısı
+PATH_CHUNK = 256
+# İşçi başına aynı anda havuzda bekleyebilen parça sayısı (bellek sınırı)
+PATH_WINDOW = 2
+
+
+# ================== Yükleme ==================
+
+def load_graph_file(path: str, input_format: str = "auto") -> Graph:
+    """CSV ya da snapshot dosyasından graf; auto iken dosya başlığına bakılır."""
+    if input_format == "auto":
+        with open(path, "rb") as f:
+            head = f.read(len(SNAPSHOT_MAGIC))
+        input_format = "snapshot" if head == SNAPSHOT_MAGIC else "csv"
+    if input_format == "snapshot":
+        return Graph.load_snapshot(path)
+    return Graph.from_csv(path, calculate_weight)
+
+
+# ================== Çıktı ==================
+
+class RecordWriter:
+    """Kayıtları (dict) JSON satırı ya da CSV olarak akış halinde yazar."""
+
+    def __init__(self, out: IO[str], fmt: str = "jsonl"):
+        self.out = out
+        self.fmt = fmt
+        self.count = 0
+        self._csv = csv.writer(out) if fmt == "csv" else None
+        self._columns: Optional[Tuple[str, ...]] = None
+
+    def write(self, record: Dict) -> None:
+        self.count += 1
+        if self._csv is None:
+            self.out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return
+        columns = tuple(record)
+        if columns != self._columns:
+            self._csv.writerow(columns)
+            self._columns = columns
+        self._csv.writerow(
+            " ".join(map(str, v)) if isinstance(v, list) else ("" if v is None else v)
+            for v in record.values()
+        )
+
+    def write_all(self, records: Iterable[Dict]) -> None:
+        for record in records:
+            self.write(record)
+        self.out.flush()
+
+
+class Profiler:
+    """Aşama süreleri; etkinse her aşama sonunda stderr'e bir JSON satırı."""
+
+    def __init__(self, enabled: bool, writer: RecordWriter, stream: IO[str] = sys.stderr):
+        self.enabled = enabled
+        self.writer = writer
+        self.stream = stream
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, **info) -> Iterator[Dict]:
+        before = self.writer.count
+        t0 = time.perf_counter()
+        yield info
+        if self.enabled:
+            record = {
+                "type": "profile",
+                "stage": name,
+                "seconds": round(time.perf_counter() - t0, 6),
+                "records": self.writer.count - before,
+                **info,
+            }
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.stream.flush()
+
+    def total(self) -> None:
+        if self.enabled:
+            record = {
+                "type": "profile",
+                "stage": "total",
+                "seconds": round(time.perf_counter() - self.started, 6),
+                "records": self.writer.count,
+            }
+            self.stream.write(json.dumps(record) + "\n")
+
+
+def _distance(value: float) -> Optional[float]:
+    # JSON'da sonsuz yok: ulaşılamayan hedef null
+    return None if value == float("inf") else value
+
+
+# ================== Yol sorguları ==================
+
+def read_queries(path: str) -> Iterator[Tuple[int, int]]:
+    """
+    Satır başına 'başlangıç hedef' (boşluk ya da virgülle ayrılmış).
+    Boş satırlar ve # ile başlayanlar atlanır; ilk satır sayı değilse
+    CSV başlığı sayılır.
+    """
+    with open(path, encoding="utf-8") as f:
+        first = True
+        for lineno, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.replace(",", " ").split()
+            try:
+                start, goal = int(parts[0]), int(parts[1])
+            except (ValueError, IndexError):
+                if first:
+                    first = False
+                    continue
+                raise ValueError(f"Geçersiz sorgu satırı {lineno}: {line}")
+            first = False
+            yield start, goal
+
+
+class PathSolver:
+    """Seçilen algoritmayla (önhesabı bir kez yapılmış) yol sorgusu."""
+
+    def __init__(self, g: Graph, algorithm: str, landmarks: Optional[LandmarkIndex] = None):
+        self.graph = g
+        self.algorithm = algorithm
+        self.landmarks = landmarks
+        self.ch = ContractionHierarchy(g) if algorithm == "ch" else None
+        if algorithm == "astar" and landmarks is None:
+            self.landmarks = LandmarkIndex.build(g, k=8)
+
+    def record(self, start: int, goal: int) -> Dict:
+        try:
+            if self.algorithm == "ch":
+                res = self.ch.shortest_path(start, goal)
+            elif self.algorithm == "astar":
+                res = astar_shortest_path(self.graph, start, goal, landmarks=self.landmarks)
+            else:
+                res = dijkstra_shortest_path(
+                    self.graph, start, goal,
+                    bidirectional=self.algorithm == "bidirectional",
+                )
+        except ValueError as e:
+            return {
+                "type": "path", "algorithm": self.algorithm, "start": start,
+                "goal": goal, "distance": None, "hops": None, "settled": 0,
+                "path": [], "error": str(e),
+            }
+        return {
+            "type": "path", "algorithm": self.algorithm, "start": start,
+            "goal": goal, "distance": _distance(res.distance),
+            "hops": len(res.path) - 1 if res.path else None,
+            "settled": len(res.visited_order), "path": res.path, "error": None,
+        }
+
+
+# İşçi süreçteki çözücü (paylaşılan CSR üzerinde dondurulmuş graf)
+_WORKER_SOLVER: Optional[PathSolver] = None
+
+
+def _init_path_worker(nodes: Dict[int, Node], algorithm: str, landmarks) -> None:
+    global _WORKER_SOLVER
+    g = Graph.from_csr(nodes, parallel.worker_csr())
+    _WORKER_SOLVER = PathSolver(g, algorithm, landmarks)
+
+
+def _path_chunk(queries: List[Tuple[int, int]]) -> List[Dict]:
+    return [_WORKER_SOLVER.record(s, t) for s, t in queries]
+
+
+def _chunks(queries: Iterable[Tuple[int, int]], size: int) -> Iterator[List[Tuple[int, int]]]:
+    chunk: List[Tuple[int, int]] = []
+    for q in queries:
+        chunk.append(q)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def path_records(
+    g: Graph, queries: Iterable[Tuple[int, int]], algorithm: str, workers: int
+) -> Iterator[Dict]:
+    """
+    Sorgu sırasıyla yol kayıtları. workers > 1 iken sorgu parçaları, grafın
+    CSR'ını paylaşan işçi süreçlerde çözülür (A* landmark'ları bir kez,
+    ana süreçte kurulur). Havuza en fazla workers * PATH_WINDOW parça
+    gönderilir; sonuçlar sırayla yazıldıkça yenileri eklenir, böylece bellek
+    girdi boyutuyla büyümez. CH önhesabı pahalı olduğundan CH hep tek süreçtir.
+    """
+    if workers == 1 or algorithm == "ch":
+        solver = PathSolver(g, algorithm)
+        for s, t in queries:
+            yield solver.record(s, t)
+        return
+
+    landmarks = LandmarkIndex.build(g, k=8) if algorithm == "astar" else None
+    shared, pool = parallel.csr_pool(
+        g.to_csr(), workers,
+        extra_init=_init_path_worker, extra_args=(g.nodes, algorithm, landmarks),
+    )
+    with shared, pool:
+        window: Deque[Future] = deque()
+        for chunk in _chunks(queries, PATH_CHUNK):
+            window.append(pool.submit(_path_chunk, chunk))
+            if len(window) >= workers * PATH_WINDOW:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+
+# ================== Diğer analizler ==================
+
+def component_records(g: Graph) -> Iterator[Dict]:
+    for i, comp in enumerate(connected_components(g), start=1):
+        yield {"type": "component", "component": i, "size": len(comp), "nodes": comp}
+
+
+def centrality_rows(g: Graph, metric: str, top: Optional[int], workers: int,
+                    samples: Optional[int]):
+    """Ölçüte göre (azalan) CentralityRow listesi; top verilirse ilk top."""
+    if metric == "degree":
+        if top is not None:
+            return top_k_degree_centrality(g, top)
+        rows = degree_centrality(g)
+        rows.sort(key=lambda r: r.centrality, reverse=True)
+    elif metric in ("closeness", "harmonic"):
+        if top is not None and workers == 1:
+            # budamalı top-k tüm düğümleri hesaplamaktan çok daha hızlı
+            func = top_k_closeness_centrality if metric == "closeness" else top_k_harmonic_centrality
+            return func(g, top)
+        func = sharded_closeness_centrality if metric == "closeness" else sharded_harmonic_centrality
+        rows = func(g, workers=workers)
+    elif metric == "betweenness":
+        rows = betweenness_centrality(g, samples=samples, workers=workers)
+    elif metric == "pagerank":
+        rows = pagerank(g).rows
+    elif metric == "eigenvector":
+        rows = eigenvector_centrality(g).rows
+    else:
+        raise ValueError(f"Bilinmeyen ölçüt: {metric}")
+    return rows if top is None else rows[:top]
+
+
+def centrality_records(g: Graph, metric: str, top: Optional[int], workers: int,
+                       samples: Optional[int]) -> Iterator[Dict]:
+    for rank, r in enumerate(centrality_rows(g, metric, top, workers, samples), start=1):
+        yield {
+            "type": "centrality", "metric": metric, "rank": rank,
+            "node_id": r.node_id, "name": r.name, "degree": r.degree,
+            "centrality": r.centrality,
+        }
+
+
+def coloring_records(g: Graph, strategy: str, workers: int) -> Iterator[Dict]:
+    _color_map, table = sharded_coloring(g, strategy, workers)
+    for r in table:
+        yield {
+            "type": "coloring", "node_id": r.node_id, "name": r.name,
+            "degree": r.degree, "color": r.color,
+        }
+
+
+# ================== Komut satırı ==================
+
+def _metric_list(value: str) -> List[str]:
+    metrics = [m.strip() for m in value.split(",") if m.strip()]
+    for m in metrics:
+        if m not in CENTRALITY_METRICS:
+            raise argparse.ArgumentTypeError(
+                f"bilinmeyen ölçüt: {m} (seçenekler: {', '.join(CENTRALITY_METRICS)})"
+            )
+    return metrics
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tamsayı bekleniyor: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"pozitif olmalı: {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sosyal ağ grafı toplu analiz (ekransız)")
+    parser.add_argument("graph", help="CSV (.csv/.csv.gz) ya da snapshot dosyası")
+    parser.add_argument("--input-format", choices=("auto", "csv", "snapshot"), default="auto")
+    parser.add_argument("--save-snapshot", metavar="YOL",
+                        help="yüklenen grafı sonraki çalıştırmalar için snapshot olarak kaydet")
+
+    analyses = parser.add_argument_group("analizler")
+    analyses.add_argument("--paths", metavar="SORGU_DOSYASI",
+                          help="satır başına 'başlangıç hedef' en kısa yol sorguları")
+    analyses.add_argument("--algorithm", choices=PATH_ALGORITHMS, default="dijkstra")
+    analyses.add_argument("--components", action="store_true", help="bağlı bileşenler")
+    analyses.add_argument("--centrality", type=_metric_list, metavar="ÖLÇÜTLER",
+                          help=f"virgülle ayrılmış: {','.join(CENTRALITY_METRICS)}")
+    analyses.add_argument("--top", type=int, help="merkezilikte yalnızca ilk k düğüm")
+    analyses.add_argument("--samples", type=_positive_int,
+                          help="betweenness için örneklenen kaynak sayısı (yaklaşık)")
+    analyses.add_argument("--coloring", action="store_true", help="graf renklendirme")
+    analyses.add_argument("--strategy", choices=STRATEGIES, default="welsh_powell")
+
+    output = parser.add_argument_group("çıktı")
+    output.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    output.add_argument("-o", "--output", metavar="YOL", help="varsayılan: stdout")
+    output.add_argument("--workers", type=int, default=1,
+                        help="işçi süreç sayısı (0: CPU sayısı)")
+    output.add_argument("--profile", action="store_true",
+                        help="aşama sürelerini stderr'e JSON satırı olarak yaz")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not (args.paths or args.components or args.centrality or args.coloring
+            or args.save_snapshot):
+        parser.error("en az bir analiz seçin: --paths, --components, --centrality, "
+                     "--coloring, --save-snapshot")
+    workers = parallel.resolve_workers(args.workers or None)
+
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    writer = RecordWriter(out, args.format)
+    profiler = Profiler(args.profile, writer)
+    try:
+        with profiler.stage("load") as info:
+            g = load_graph_file(args.graph, args.input_format)
+            info["nodes"] = len(g.nodes)
+            # CSR kopyası kurmadan: düğümlerin tuttuğu derecelerden
+            info["edges"] = sum(node.degree for node in g.nodes.values()) // 2
+        if args.save_snapshot:
+            with profiler.stage("save_snapshot"):
+                g.save_snapshot(args.save_snapshot)
+
+        if args.paths:
+            with profiler.stage("paths", algorithm=args.algorithm):
+                writer.write_all(path_records(g, read_queries(args.paths), args.algorithm, workers))
+        if args.components:
+            with profiler.stage("components"):
+                writer.write_all(component_records(g))
+        for metric in args.centrality or ():
+            with profiler.stage("centrality", metric=metric):
+                writer.write_all(centrality_records(g, metric, args.top, workers, args.samples))
+        if args.coloring:
+            with profiler.stage("coloring", strategy=args.strategy):
+                writer.write_all(coloring_records(g, args.strategy, workers))
+        profiler.total()
+    except BrokenPipeError:
+        # çıktıyı okuyan süreç (ör. head) erken kapandı; kapanışta tekrar
+        # hata vermemesi için stdout /dev/null'a yönlendirilir
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, KeyError) as e:
+        parser.exit(1, f"hata: {e}\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
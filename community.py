@@ -0,0 +1,261 @@
+# community.py
+# Topluluk (community) tespiti: Louvain modülerlik optimizasyonu ve asenkron
+# etiket yayılımı (label propagation). İkisi de grafın CSR dizileri üzerinde
+# indeks tabanlı çalışır; kenar ağırlıkları grafın ağırlıklarıdır
+# (weight_func tanımlıysa calculate_weight benzerliği).
+#
+# Sonuçtaki membership, components.component_index_map ile aynı biçimdedir:
+# node_id -> topluluk numarası (0 en büyük topluluk).
+from __future__ import annotations
+import random
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from csr import CSRGraph
+from graph import Graph
+
+
+@dataclass
+class CommunityResult:
+    communities: List[List[int]]  # connected_components ile aynı biçim
+    membership: Dict[int, int]    # node_id -> topluluk numarası
+    modularity: float
+    iterations: int = 0           # Louvain: seviye, etiket yayılımı: tur sayısı
+
+
+def _edge_weights(csr: CSRGraph, weighted: bool) -> Sequence[float]:
+    return csr.weights if weighted else array("d", [1.0]) * len(csr.targets)
+
+
+def _modularity_indices(
+    csr: CSRGraph, weights: Sequence[float], comm: Sequence[int]
+) -> float:
+    """
+    Q = sum_c [ in_c / 2m - (tot_c / 2m)^2 ]
+    in_c : c içindeki kenar ağırlıkları (CSR'da her kenar iki kez)
+    tot_c: c'deki düğümlerin ağırlıklı dereceleri toplamı
+    """
+    offsets = csr.offsets
+    targets = csr.targets
+    m2 = 0.0
+    inside: Dict[int, float] = {}
+    tot: Dict[int, float] = {}
+    for i in range(len(csr)):
+        ci = comm[i]
+        k = 0.0
+        for e in range(offsets[i], offsets[i + 1]):
+            w = weights[e]
+            k += w
+            if comm[targets[e]] == ci:
+                inside[ci] = inside.get(ci, 0.0) + w
+        tot[ci] = tot.get(ci, 0.0) + k
+        m2 += k
+    if m2 == 0:
+        return 0.0
+    return sum(inside.values()) / m2 - sum((t / m2) ** 2 for t in tot.values())
+
+
+def _result(
+    g: Graph, csr: CSRGraph, weights: Sequence[float], comm: List[int], iterations: int
+) -> CommunityResult:
+    """Topluluk numaralarını boyuta göre (büyük önce) yeniden sıralar."""
+    groups: Dict[int, List[int]] = {}
+    for i, c in enumerate(comm):
+        groups.setdefault(c, []).append(i)
+    ordered = sorted(groups.values(), key=len, reverse=True)
+
+    ids = csr.ids
+    renumber = [0] * len(comm)
+    communities: List[List[int]] = []
+    for new_c, members in enumerate(ordered):
+        for i in members:
+            renumber[i] = new_c
+        communities.append(sorted(ids[i] for i in members))
+    membership = {ids[i]: renumber[i] for i in range(len(comm))}
+    return CommunityResult(
+        communities=communities,
+        membership=membership,
+        modularity=_modularity_indices(csr, weights, renumber),
+        iterations=iterations,
+    )
+
+
+def modularity(g: Graph, membership: Dict[int, int], weighted: bool = True) -> float:
+    """Verilen node_id -> topluluk eşlemesinin modülerliği (Newman)."""
+    csr = g.to_csr()
+    comm = [membership[nid] for nid in csr.ids]
+    return _modularity_indices(csr, _edge_weights(csr, weighted), comm)
+
+
+# ================== Louvain ==================
+
+def _louvain_local_moves(
+    offsets, targets, weights, loops: List[float], order: List[int], tol: float
+) -> tuple:
+    """
+    Birinci aşama: her düğüm, modülerlik kazancı en büyük komşu topluluğa
+    taşınır; bir turda hiçbir düğüm taşınmayana kadar tekrarlanır.
+    Dönen: (topluluk dizisi, en az bir taşıma oldu mu)
+    """
+    n = len(loops)
+    k = [loops[i] + sum(weights[offsets[i]:offsets[i + 1]]) for i in range(n)]
+    m2 = sum(k)
+    comm = list(range(n))
+    tot = list(k)
+    moved_any = False
+    if m2 == 0:
+        return comm, False
+
+    while True:
+        moves = 0
+        for i in order:
+            ci = comm[i]
+            ki = k[i]
+            # i'nin komşu topluluklara bağlanan ağırlıkları
+            links: Dict[int, float] = {}
+            for e in range(offsets[i], offsets[i + 1]):
+                j = targets[e]
+                if j != i:
+                    cj = comm[j]
+                    links[cj] = links.get(cj, 0.0) + weights[e]
+
+            tot[ci] -= ki
+            best = ci
+            best_gain = links.get(ci, 0.0) - tot[ci] * ki / m2
+            for c, w in links.items():
+                gain = w - tot[c] * ki / m2
+                if gain > best_gain + tol:
+                    best = c
+                    best_gain = gain
+            tot[best] += ki
+            if best != ci:
+                comm[i] = best
+                moves += 1
+        if not moves:
+            return comm, moved_any
+        moved_any = True
+
+
+def _louvain_aggregate(offsets, targets, weights, loops, comm):
+    """
+    İkinci aşama: her topluluk tek düğüm olur; topluluklar arası kenar
+    ağırlıkları toplanır, topluluk içi ağırlık öz-döngüye (loops) yazılır.
+    Dönen: (yeni offsets, targets, weights, loops, eski topluluk -> yeni indeks)
+    """
+    renumber: Dict[int, int] = {}
+    for c in comm:
+        if c not in renumber:
+            renumber[c] = len(renumber)
+    size = len(renumber)
+    new_loops = [0.0] * size
+    rows: List[Dict[int, float]] = [{} for _ in range(size)]
+    for i, c in enumerate(comm):
+        a = renumber[c]
+        new_loops[a] += loops[i]
+        row = rows[a]
+        for e in range(offsets[i], offsets[i + 1]):
+            b = renumber[comm[targets[e]]]
+            if a == b:
+                new_loops[a] += weights[e]
+            else:
+                row[b] = row.get(b, 0.0) + weights[e]
+
+    new_offsets = array("q", [0])
+    new_targets = array("q")
+    new_weights = array("d")
+    for row in rows:
+        new_targets.extend(row.keys())
+        new_weights.extend(row.values())
+        new_offsets.append(len(new_targets))
+    return new_offsets, new_targets, new_weights, new_loops, renumber
+
+
+def louvain_communities(
+    g: Graph,
+    weighted: bool = True,
+    seed: Optional[int] = None,
+    tol: float = 1e-12,
+    max_levels: int = 20,
+) -> CommunityResult:
+    """
+    Louvain modülerlik optimizasyonu (Blondel vd.).
+    Yerel taşıma + toplulukları düğüme indirgeme adımları, modülerlik artmayana
+    kadar tekrarlanır. Düğüm gezme sırası seed ile karıştırılır.
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    weights = _edge_weights(csr, weighted)
+    if n == 0:
+        return CommunityResult(communities=[], membership={}, modularity=0.0)
+    rnd = random.Random(seed)
+
+    # node -> güncel seviyedeki süper düğüm
+    assignment = list(range(n))
+    offsets, targets, level_weights = csr.offsets, csr.targets, weights
+    loops = [0.0] * n
+    levels = 0
+    while levels < max_levels:
+        order = list(range(len(loops)))
+        rnd.shuffle(order)
+        comm, moved = _louvain_local_moves(
+            offsets, targets, level_weights, loops, order, tol
+        )
+        if not moved:
+            break
+        levels += 1
+        offsets, targets, level_weights, loops, renumber = _louvain_aggregate(
+            offsets, targets, level_weights, loops, comm
+        )
+        assignment = [renumber[comm[a]] for a in assignment]
+
+    return _result(g, csr, weights, assignment, levels)
+
+
+# ================== Etiket yayılımı ==================
+
+def label_propagation_communities(
+    g: Graph,
+    weighted: bool = True,
+    seed: Optional[int] = None,
+    max_iter: int = 100,
+) -> CommunityResult:
+    """
+    Asenkron etiket yayılımı (Raghavan vd.): her turda düğümler rastgele
+    sırayla, komşularında toplam ağırlığı en büyük olan etiketi alır
+    (eşitlikte mevcut etiket korunur, yoksa rastgele seçilir). Hiçbir etiket
+    değişmeyince durur.
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    weights = _edge_weights(csr, weighted)
+    offsets = csr.offsets
+    targets = csr.targets
+    rnd = random.Random(seed)
+    labels = list(range(n))
+    order = list(range(n))
+
+    rounds = 0
+    while rounds < max_iter:
+        rounds += 1
+        rnd.shuffle(order)
+        changes = 0
+        for i in order:
+            start, end = offsets[i], offsets[i + 1]
+            if start == end:
+                continue
+            score: Dict[int, float] = {}
+            for e in range(start, end):
+                lab = labels[targets[e]]
+                score[lab] = score.get(lab, 0.0) + weights[e]
+            best = max(score.values())
+            current = labels[i]
+            if score.get(current) == best:
+                continue
+            candidates = [lab for lab, s in score.items() if s == best]
+            labels[i] = candidates[0] if len(candidates) == 1 else rnd.choice(candidates)
+            changes += 1
+        if not changes:
+            break
+
+    return _result(g, csr, weights, labels, rounds)
@@ -1,7 +1,6 @@
 # components.py
 from __future__ import annotations
-from typing import Dict, List
-from collections import deque
+from typing import Dict, Iterator, List, Mapping, Union
 
 from graph import Graph
 
@@ -10,39 +9,73 @@ def connected_components(g: Graph) -> List[List[int]]:
     """
     Yönsüz graf için bağlı bileşenleri döner.
     Çıktı: [[1,2,3], [4,5], ...] gibi
+    Bileşenler grafın canlı tuttuğu union-find yapısından okunur
+    (bkz. Graph.components); BFS yalnızca yapı yoksa bir kez yapılır.
     """
-    visited = set()
-    comps: List[List[int]] = []
+    comps = [sorted(comp) for comp in g.components().groups()]
 
-    for start in g.nodes.keys():
-        if start in visited:
-            continue
+    # Büyük bileşen önce gelsin (istersen)
+    comps.sort(key=len, reverse=True)
+    return comps
 
-        q = deque([start])
-        visited.add(start)
-        comp: List[int] = []
 
-        while q:
-            u = q.popleft()
-            comp.append(u)
-            for v in g.neighbors(u):
-                if v not in visited:
-                    visited.add(v)
-                    q.append(v)
+class ComponentIndexView(Mapping):
+    """
+    node_id -> bileşen indeksi görünümü. İndeksler connected_components(g)
+    sırasıdır (0 en büyük bileşen), yani bileşen listesinden kurulan
+    eşlemeyle aynı değerleri verir. Düğüm başına kopya üretmez: erişim
+    union-find üzerinde bir find ve temsilci -> indeks sözlüğüne bakıştır;
+    bu sözlük (bileşen başına bir kayıt) graf sürümü değiştikçe yenilenir.
+    """
 
-        comps.append(sorted(comp))
+    def __init__(self, g: Graph):
+        self._graph = g
+        self._version = None
+        self._root_index: Dict[int, int] = {}
 
-    # Büyük bileşen önce gelsin (istersen)
-    comps.sort(key=len, reverse=True)
-    return comps
+    def _roots(self) -> Dict[int, int]:
+        g = self._graph
+        if self._version != g.version:
+            ds = g.components()
+            # temsilciler, bileşenin ilk düğümünün sırasıyla (groups() sırası)
+            first: Dict[int, None] = {}
+            for x in ds.parent:
+                first.setdefault(ds.find(x))
+            # connected_components ile aynı: büyükten küçüğe, eşitlikte kararlı
+            roots = sorted(first, key=ds.size.__getitem__, reverse=True)
+            self._root_index = {r: i for i, r in enumerate(roots)}
+            self._version = g.version
+        return self._root_index
+
+    def __getitem__(self, node_id: int) -> int:
+        if node_id not in self._graph.nodes:
+            raise KeyError(node_id)
+        roots = self._roots()
+        return roots[self._graph.components().find(node_id)]
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._graph.nodes
 
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._graph.nodes)
 
-def component_index_map(components: List[List[int]]) -> Dict[int, int]:
+    def __len__(self) -> int:
+        return len(self._graph.nodes)
+
+
+def component_index_map(
+    source: Union[Graph, List[List[int]]]
+) -> Mapping[int, int]:
     """
-    node_id -> component_id map
+    node_id -> component_id map (component_id listedeki 0 tabanlı sıra)
+    Graph verilirse grafın bileşen takibine bağlı ucuz bir görünüm döner;
+    indeksler connected_components(g) sırasıyla aynıdır.
     """
+    if isinstance(source, Graph):
+        return ComponentIndexView(source)
+
     mp: Dict[int, int] = {}
-    for i, comp in enumerate(components):
+    for i, comp in enumerate(source):
         for nid in comp:
             mp[nid] = i
     return mp
@@ -0,0 +1,243 @@
+# contraction.py
+# Contraction Hierarchies (CH): çok sayıda en kısa yol sorgusu için önhesaplama.
+#
+# Önhesap: düğümler önem sırasına göre tek tek "büzülür" (contract). v
+# büzülürken, komşuları u ve w arasındaki en kısa yol yalnızca v'den
+# geçiyorsa u-w arasına ağırlığı w(u,v)+w(v,w) olan bir kısayol eklenir.
+# Sorgu: her iki uçtan yalnızca sırası daha yüksek düğümlere giden
+# ("yukarı") kenarlar üzerinde çift yönlü Dijkstra; kısayollar sonra açılır.
+from __future__ import annotations
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from graph import Graph
+from dijkstra import PathResult
+
+
+class ContractionHierarchy:
+    """Graph'tan üretilmiş, kısayollarla zenginleştirilmiş yukarı-graf."""
+
+    def __init__(self, g: Graph, witness_limit: int = 500):
+        self.graph = g
+        self.witness_limit = witness_limit
+        self.ids: List[int] = []
+        self.index: Dict[int, int] = {}
+        self.rank: List[int] = []
+        # up[i]: (j, ağırlık) — yalnızca rank[j] > rank[i] olan kenarlar
+        self.up: List[List[Tuple[int, float]]] = []
+        # (min(i,j), max(i,j)) -> kısayolun ortasındaki düğüm
+        self.middle: Dict[Tuple[int, int], int] = {}
+        self.version: Optional[int] = None
+        self.rebuild()
+
+    # ---------- Önhesap ----------
+
+    def is_current(self) -> bool:
+        return self.version == self.graph.version
+
+    def refresh(self) -> "ContractionHierarchy":
+        """Graf toplu güncellemelerden sonra değiştiyse hiyerarşiyi yeniden kurar."""
+        if not self.is_current():
+            self.rebuild()
+        return self
+
+    def rebuild(self) -> None:
+        g = self.graph
+        self.ids = list(g.nodes.keys())
+        self.index = {nid: i for i, nid in enumerate(self.ids)}
+        n = len(self.ids)
+
+        # Kalan (henüz büzülmemiş) graf: i -> {j: en küçük ağırlık}
+        rem: List[Dict[int, float]] = [{} for _ in range(n)]
+        for i, nid in enumerate(self.ids):
+            nbrs = rem[i]
+            for e in g.edges_from(nid):
+                j = self.index[e.to_id]
+                w = float(e.weight)
+                if w < nbrs.get(j, float("inf")):
+                    nbrs[j] = w
+
+        self.rank = [0] * n
+        self.up = [[] for _ in range(n)]
+        self.middle = {}
+        contracted = [False] * n
+        deleted_nbrs = [0] * n
+
+        # öncelik = kenar farkı (eklenecek kısayol - kalkan kenar) + büzülmüş komşu
+        pq = [
+            (len(self._shortcuts_for(rem, v)) - len(rem[v]), v) for v in range(n)
+        ]
+        heapq.heapify(pq)
+        order = 0
+
+        while pq:
+            _, v = heapq.heappop(pq)
+            if contracted[v]:
+                continue
+            # Tembel güncelleme: öncelik değiştiyse sıraya geri koy
+            shortcuts = self._shortcuts_for(rem, v)
+            p = len(shortcuts) - len(rem[v]) + deleted_nbrs[v]
+            if pq and p > pq[0][0]:
+                heapq.heappush(pq, (p, v))
+                continue
+
+            for u, w, weight in shortcuts:
+                if weight < rem[u].get(w, float("inf")):
+                    rem[u][w] = weight
+                    rem[w][u] = weight
+                    self.middle[(u, w) if u < w else (w, u)] = v
+
+            contracted[v] = True
+            self.rank[v] = order
+            order += 1
+            # v'nin kalan komşularının hepsi daha yüksek sıradadır
+            self.up[v] = list(rem[v].items())
+            for u in rem[v]:
+                del rem[u][v]
+                deleted_nbrs[u] += 1
+            rem[v] = {}
+
+        self.version = g.version
+
+    def _shortcuts_for(
+        self, rem: List[Dict[int, float]], v: int
+    ) -> List[Tuple[int, int, float]]:
+        """v büzülürse gereken kısayollar: (u, w, ağırlık), u < w."""
+        nbrs = list(rem[v].items())
+        if len(nbrs) < 2:
+            return []
+        max_out = max(w for _, w in nbrs)
+        result: List[Tuple[int, int, float]] = []
+
+        for k, (u, w_uv) in enumerate(nbrs):
+            targets = {w: w_uv + w_vw for w, w_vw in nbrs[k + 1:]}
+            if not targets:
+                continue
+            witness = self._witness_search(rem, u, v, w_uv + max_out, targets)
+            for w, via_v in targets.items():
+                if witness.get(w, float("inf")) > via_v:
+                    result.append((u, w, via_v) if u < w else (w, u, via_v))
+        return result
+
+    def _witness_search(
+        self,
+        rem: List[Dict[int, float]],
+        source: int,
+        skip: int,
+        max_dist: float,
+        targets: Dict[int, float],
+    ) -> Dict[int, float]:
+        """
+        skip düğümünü kullanmadan source'tan sınırlı Dijkstra.
+        Limit aşılırsa bulunamayan tanıklar kısayol eklenmesine yol açar
+        (güvenli taraf: fazladan kısayol doğruluğu bozmaz).
+        """
+        dist: Dict[int, float] = {source: 0.0}
+        pq: List[Tuple[float, int]] = [(0.0, source)]
+        settled = 0
+        remaining = len(targets)
+
+        while pq and settled < self.witness_limit and remaining:
+            d, x = heapq.heappop(pq)
+            if d > dist[x]:
+                continue
+            if d > max_dist:
+                break
+            settled += 1
+            if x in targets:
+                remaining -= 1
+            for y, w in rem[x].items():
+                if y == skip:
+                    continue
+                nd = d + w
+                if nd < dist.get(y, float("inf")):
+                    dist[y] = nd
+                    heapq.heappush(pq, (nd, y))
+        return dist
+
+    # ---------- Sorgu ----------
+
+    def shortest_path(self, start: int, goal: int) -> PathResult:
+        """dijkstra_shortest_path ile aynı sonucu, yukarı-graf üzerinde bulur."""
+        if start not in self.index or goal not in self.index:
+            raise ValueError("Start/goal graf içinde yok")
+        s = self.index[start]
+        t = self.index[goal]
+        inf = float("inf")
+
+        dist = [{s: 0.0}, {t: 0.0}]
+        prev: List[Dict[int, Optional[int]]] = [{s: None}, {t: None}]
+        pqs: List[List[Tuple[float, int]]] = [[(0.0, s)], [(0.0, t)]]
+        settled = [set(), set()]
+        visited_order: List[int] = []
+        mu = inf
+        meet: Optional[int] = None
+
+        while pqs[0] or pqs[1]:
+            # Her taraf, kuyruğunun tepesi mu'yu aşınca durabilir
+            for side in (0, 1):
+                pq = pqs[side]
+                if not pq:
+                    continue
+                if pq[0][0] >= mu:
+                    pq.clear()
+                    continue
+                d, x = heapq.heappop(pq)
+                if x in settled[side]:
+                    continue
+                settled[side].add(x)
+                visited_order.append(self.ids[x])
+
+                other = dist[1 - side].get(x)
+                if other is not None and d + other < mu:
+                    mu = d + other
+                    meet = x
+
+                for y, w in self.up[x]:
+                    nd = d + w
+                    if nd < dist[side].get(y, inf):
+                        dist[side][y] = nd
+                        prev[side][y] = x
+                        heapq.heappush(pq, (nd, y))
+
+        if meet is None:
+            return PathResult(distance=inf, path=[], visited_order=visited_order)
+
+        # Yukarı yolları birleştir: s .. meet .. t (indeks cinsinden)
+        packed: List[int] = []
+        cur: Optional[int] = meet
+        while cur is not None:
+            packed.append(cur)
+            cur = prev[0][cur]
+        packed.reverse()
+        cur = prev[1][meet]
+        while cur is not None:
+            packed.append(cur)
+            cur = prev[1][cur]
+
+        path: List[int] = [packed[0]]
+        for a, b in zip(packed, packed[1:]):
+            self._unpack(a, b, path)
+        return PathResult(
+            distance=mu,
+            path=[self.ids[i] for i in path],
+            visited_order=visited_order,
+        )
+
+    def _unpack(self, a: int, b: int, out: List[int]) -> None:
+        """a-b (kısayol olabilir) kenarını orijinal kenarlara açar; b'yi out'a ekler."""
+        stack = [(a, b)]
+        while stack:
+            x, y = stack.pop()
+            mid = self.middle.get((x, y) if x < y else (y, x))
+            if mid is None:
+                out.append(y)
+            else:
+                # önce x-mid, sonra mid-y işlensin diye ters sırada yığına
+                stack.append((mid, y))
+                stack.append((x, mid))
+
+
+def ch_shortest_path(ch: ContractionHierarchy, start: int, goal: int) -> PathResult:
+    """Hiyerarşi bayatsa yeniden kurup sorguyu cevaplar."""
+    return ch.refresh().shortest_path(start, goal)
@@ -0,0 +1,264 @@
+# csr.py
+from __future__ import annotations
+import hashlib
+import heapq
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from graph import Edge
+
+
+class CSRGraph:
+    """
+    Sıkıştırılmış satır (CSR) düzeninde, dizi tabanlı komşuluk deposu.
+      - ids[i]     : i. indeksteki düğümün id'si
+      - index      : node_id -> indeks
+      - offsets[i] : i. düğümün kenarlarının targets/weights içindeki başlangıcı
+                     (offsets[i+1] bitişi, len(offsets) = n + 1)
+      - targets[k] : k. kenarın hedef düğüm İNDEKSİ
+      - weights[k] : k. kenarın ağırlığı
+    Her kenar bir Python nesnesi değil, üç dizide birer hücredir.
+    """
+
+    __slots__ = ("ids", "index", "offsets", "targets", "weights", "_fingerprints",
+                 "_edge_keys")
+
+    def __init__(
+        self,
+        ids: Sequence[int],
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[float],
+        index: Optional[Dict[int, int]] = None,
+    ):
+        self.ids = ids
+        self.index: Dict[int, int] = (
+            index if index is not None else {nid: i for i, nid in enumerate(ids)}
+        )
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        # fingerprint() önbelleği (diziler yerinde değiştirilmez)
+        self._fingerprints: Dict[bool, str] = {}
+        # has_edge için i * n + j kümesi; ilk sorguda kurulur
+        self._edge_keys: Optional[Set[int]] = None
+
+    @classmethod
+    def from_graph(cls, g) -> "CSRGraph":
+        """Dict-of-lists komşuluk listesinden CSR deposu üretir."""
+        ids = array("q", g.nodes.keys())
+        index = {nid: i for i, nid in enumerate(ids)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+
+        for nid in ids:
+            for e in g.adj.get(nid, ()):
+                targets.append(index[e.to_id])
+                weights.append(e.weight)
+            offsets.append(len(targets))
+
+        return cls(ids, offsets, targets, weights, index)
+
+    # ---------- Boyut bilgileri ----------
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Yönlü kenar sayısı (yönsüz her kenar iki kez sayılır)."""
+        return len(self.targets)
+
+    def nbytes(self) -> int:
+        """Dizilerin kapladığı yaklaşık bellek (id -> indeks sözlüğü hariç)."""
+        return sum(
+            len(a) * a.itemsize
+            for a in (self.ids, self.offsets, self.targets, self.weights)
+        )
+
+    def fingerprint(self, weights: bool = True) -> str:
+        """
+        İçerik parmak izi: id'ler, offsets, targets ve (weights=True ise)
+        ağırlıklar. Aynı içerikli iki depo, hangi süreçte/sürümde
+        kurulmuş olursa olsun aynı değeri verir.
+        """
+        key = self._fingerprints.get(weights)
+        if key is None:
+            h = hashlib.blake2b(digest_size=16)
+            parts = [(self.ids, "q"), (self.offsets, "q"), (self.targets, "q")]
+            if weights:
+                parts.append((self.weights, "d"))
+            for values, typecode in parts:
+                h.update(memoryview(array(typecode, values)).cast("B"))
+            key = self._fingerprints[weights] = h.hexdigest()
+        return key
+
+    # ---------- İndeks tabanlı erişim (hızlı çekirdekler için) ----------
+
+    def degree(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbor_indices(self, i: int) -> Sequence[int]:
+        """i. düğümün komşu indeksleri (targets dilimi)."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def subgraph(self, indices: Sequence[int]) -> "CSRGraph":
+        """
+        Verilen indekslerin oluşturduğu alt graf (yeni CSR; indeksler verilen
+        sırayla 0..k-1 olur). Alt küme dışına giden kenarlar atlanır.
+        """
+        local = {gi: i for i, gi in enumerate(indices)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for gi in indices:
+            for k in range(self.offsets[gi], self.offsets[gi + 1]):
+                j = local.get(self.targets[k])
+                if j is not None:
+                    targets.append(j)
+                    weights.append(self.weights[k])
+            offsets.append(len(targets))
+        ids = array("q", map(self.ids.__getitem__, indices))
+        return CSRGraph(ids, offsets, targets, weights)
+
+    # ---------- Graph ile aynı arayüz (node_id tabanlı) ----------
+
+    def has_edge(self, a: int, b: int) -> bool:
+        """O(1) kenar sorgusu (kenar kümesi ilk çağrıda bir kez kurulur)."""
+        i = self.index.get(a)
+        j = self.index.get(b)
+        if i is None or j is None:
+            return False
+        n = len(self.ids)
+        keys = self._edge_keys
+        if keys is None:
+            offsets = self.offsets
+            targets = self.targets
+            keys = self._edge_keys = {
+                u * n + targets[k]
+                for u in range(n)
+                for k in range(offsets[u], offsets[u + 1])
+            }
+        return i * n + j in keys
+
+    def neighbors(self, node_id: int) -> List[int]:
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        return list(map(self.ids.__getitem__, self.neighbor_indices(i)))
+
+    def edges_from(self, node_id: int) -> List[Edge]:
+        """
+        Kenarları Edge nesnesi olarak üretir (mevcut algoritmalar için).
+        Dönen nesneler kopyadır; üzerlerinde yapılan değişiklik depoya yansımaz.
+        """
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        ids = self.ids
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return [
+            Edge(node_id, ids[t], w)
+            for t, w in zip(self.targets[start:end], self.weights[start:end])
+        ]
+
+    def adjacency_list(self) -> Dict[int, List[int]]:
+        return {nid: self.neighbors(nid) for nid in self.ids}
+
+    # ---------- Dizi tabanlı çekirdekler ----------
+
+    def sssp(self, src: int) -> array:
+        """
+        src indeksinden tek kaynaklı Dijkstra; dist[i] (ulaşılamazsa inf).
+        Python nesnesi yerine doğrudan offsets/targets/weights dizilerini gezer.
+        """
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        dist = array("d", [math.inf]) * len(self.ids)
+        dist[src] = 0.0
+        pq = [(0.0, src)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+        return dist
+
+    def shortest_path_tree(
+        self,
+        src: int,
+        targets: Optional[Iterable[int]] = None,
+        cancel=None,
+        check_every: int = 1024,
+    ) -> Tuple[array, array, array]:
+        """
+        src indeksinden Dijkstra; (dist, prev, order) dizileri döner:
+        prev[i] yol ağacında ebeveyn (-1 yok), order kesinleşme sırası.
+        targets (indeksler) verilirse hepsi kesinleşince durur.
+        cancel (jobs.CancelToken) check_every düğümde bir kontrol edilir.
+        """
+        offsets = self.offsets
+        tgt = self.targets
+        weights = self.weights
+        n = len(self.ids)
+        dist = array("d", [math.inf]) * n
+        prev = array("q", [-1]) * n
+        done = bytearray(n)
+        order = array("q")
+        pending = set(targets) if targets is not None else None
+        dist[src] = 0.0
+        pq = [(0.0, src)]
+        while pq:
+            d, u = heapq.heappop(pq)
+            if done[u]:
+                continue
+            done[u] = 1
+            order.append(u)
+            if cancel is not None and len(order) % check_every == 0:
+                cancel.check(len(order), n)
+            if pending is not None:
+                pending.discard(u)
+                if not pending:
+                    break
+            for k in range(offsets[u], offsets[u + 1]):
+                v = tgt[k]
+                if done[v]:
+                    continue
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    prev[v] = u
+                    heapq.heappush(pq, (nd, v))
+        return dist, prev, order
+
+
+class CSRAdjacency(Mapping):
+    """
+    Dondurulmuş grafta Graph.adj yerine geçen salt okunur görünüm.
+    adj[node_id] her erişimde CSR dizilerinden Edge listesi üretir.
+    """
+
+    def __init__(self, csr: CSRGraph):
+        self._csr = csr
+
+    def __getitem__(self, node_id: int) -> List[Edge]:
+        if node_id not in self._csr.index:
+            raise KeyError(node_id)
+        return self._csr.edges_from(node_id)
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._csr.index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._csr.ids)
+
+    def __len__(self) -> int:
+        return len(self._csr.ids)
@@ -1,11 +1,17 @@
 # dijkstra.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 import heapq
 
 from graph import Graph
 
+if TYPE_CHECKING:
+    from jobs import CancelToken
+
+# İptal / ilerleme kontrolü bu kadar düğüm kesinleştikçe bir yapılır
+CHECK_EVERY = 1024
+
 
 @dataclass
 class PathResult:
@@ -14,9 +20,31 @@ class PathResult:
     visited_order: List[int]
 
 
-def dijkstra_shortest_path(g: Graph, start: int, goal: int) -> PathResult:
+@dataclass
+class MultiSourceResult:
+    dist: Dict[int, float]             # node_id -> en yakın kaynağa mesafe
+    nearest: Dict[int, Optional[int]]  # node_id -> en yakın kaynak (ulaşılamazsa None)
+    prev: Dict[int, Optional[int]]     # yol ağacı (kaynaklarda None)
+
+
+def dijkstra_shortest_path(
+    g: Graph,
+    start: int,
+    goal: int,
+    bidirectional: bool = False,
+    cancel: Optional["CancelToken"] = None,
+) -> PathResult:
+    """
+    start -> goal en kısa yolu.
+    bidirectional=True ise iki uçtan aynı anda arayan sürüm kullanılır.
+    cancel verilirse (bkz. jobs.CancelToken) döngüde ara ara kontrol edilir.
+    """
+    if bidirectional:
+        return bidirectional_dijkstra_shortest_path(g, start, goal, cancel)
     if start not in g.nodes or goal not in g.nodes:
         raise ValueError("Start/goal graf içinde yok")
+    if g.frozen:
+        return _one_to_many_csr(g, start, [goal], cancel)[goal]
 
     dist: Dict[int, float] = {nid: float("inf") for nid in g.nodes}
     prev: Dict[int, Optional[int]] = {nid: None for nid in g.nodes}
@@ -32,6 +60,8 @@ def dijkstra_shortest_path(g: Graph, start: int, goal: int) -> PathResult:
             continue
         visited.add(u)
         visited_order.append(u)
+        if cancel is not None and len(visited_order) % CHECK_EVERY == 0:
+            cancel.check(len(visited_order), len(g.nodes))
 
         if u == goal:
             break
@@ -49,11 +79,210 @@ def dijkstra_shortest_path(g: Graph, start: int, goal: int) -> PathResult:
     if dist[goal] == float("inf"):
         return PathResult(distance=float("inf"), path=[], visited_order=visited_order)
 
+    return PathResult(
+        distance=dist[goal], path=_build_path(prev, goal), visited_order=visited_order
+    )
+
+
+def _build_path(prev: Dict[int, Optional[int]], goal: int) -> List[int]:
     path: List[int] = []
-    cur = goal
+    cur: Optional[int] = goal
     while cur is not None:
         path.append(cur)
         cur = prev[cur]
     path.reverse()
+    return path
+
+
+def _one_to_many_csr(
+    g: Graph, start: int, goals: List[int], cancel: Optional["CancelToken"] = None
+) -> Dict[int, PathResult]:
+    """Dondurulmuş graf için dizi tabanlı çekirdek (CSRGraph.shortest_path_tree)."""
+    csr = g.to_csr()
+    index = csr.index
+    ids = csr.ids
+    dist, prev, order = csr.shortest_path_tree(
+        index[start], [index[t] for t in goals], cancel, CHECK_EVERY
+    )
+    visited_order = list(map(ids.__getitem__, order))
+    results: Dict[int, PathResult] = {}
+    for t in goals:
+        i = index[t]
+        d = dist[i]
+        path: List[int] = []
+        if d != float("inf"):
+            while i >= 0:
+                path.append(ids[i])
+                i = prev[i]
+            path.reverse()
+        results[t] = PathResult(d, path, visited_order)
+    return results
+
+
+def dijkstra_one_to_many(
+    g: Graph, start: int, targets: Iterable[int]
+) -> Dict[int, PathResult]:
+    """
+    start'tan birden çok hedefe en kısa yollar.
+    Tüm hedefler kesinleşince arama durur (grafın geri kalanı gezilmez).
+    Sonuçların visited_order listesi ortaktır (aramanın tamamı).
+    """
+    if start not in g.nodes:
+        raise ValueError("Start graf içinde yok")
+    # targets bir üreteç olabilir: tek sefer tüketilir
+    target_set = set(targets)
+    pending = set(target_set)
+    missing = [t for t in target_set if t not in g.nodes]
+    if missing:
+        raise ValueError(f"Hedef(ler) graf içinde yok: {missing}")
+    if g.frozen:
+        return _one_to_many_csr(g, start, list(target_set))
+
+    inf = float("inf")
+    dist: Dict[int, float] = {start: 0.0}
+    prev: Dict[int, Optional[int]] = {start: None}
+    pq: List[Tuple[float, int]] = [(0.0, start)]
+    visited = set()
+    visited_order: List[int] = []
+
+    while pq and pending:
+        cur_dist, u = heapq.heappop(pq)
+        if u in visited:
+            continue
+        visited.add(u)
+        visited_order.append(u)
+        pending.discard(u)
+
+        for e in g.edges_from(u):
+            v = e.to_id
+            if v in visited:
+                continue
+            nd = cur_dist + float(e.weight)
+            if nd < dist.get(v, inf):
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd, v))
+
+    results: Dict[int, PathResult] = {}
+    for t in target_set:
+        if t in visited:
+            results[t] = PathResult(dist[t], _build_path(prev, t), visited_order)
+        else:
+            results[t] = PathResult(inf, [], visited_order)
+    return results
+
+
+def multi_source_dijkstra(g: Graph, sources: Iterable[int]) -> MultiSourceResult:
+    """
+    Çok kaynaklı Dijkstra: tüm kaynaklar 0 mesafeli sanal bir süper kaynağa
+    bağlıymış gibi tek bir arama yapılır. Her düğüm için en yakın kaynak
+    (ör. "en yakın influencer") ve ona olan mesafe döner.
+    """
+    inf = float("inf")
+    dist: Dict[int, float] = {nid: inf for nid in g.nodes}
+    nearest: Dict[int, Optional[int]] = {nid: None for nid in g.nodes}
+    prev: Dict[int, Optional[int]] = {nid: None for nid in g.nodes}
+
+    pq: List[Tuple[float, int]] = []
+    for s in sources:
+        if s not in g.nodes:
+            raise ValueError(f"Kaynak graf içinde yok: {s}")
+        dist[s] = 0.0
+        nearest[s] = s
+        pq.append((0.0, s))
+    heapq.heapify(pq)
+
+    visited = set()
+    while pq:
+        cur_dist, u = heapq.heappop(pq)
+        if u in visited:
+            continue
+        visited.add(u)
+        seed = nearest[u]
+
+        for e in g.edges_from(u):
+            v = e.to_id
+            if v in visited:
+                continue
+            nd = cur_dist + float(e.weight)
+            if nd < dist[v]:
+                dist[v] = nd
+                nearest[v] = seed
+                prev[v] = u
+                heapq.heappush(pq, (nd, v))
+
+    return MultiSourceResult(dist=dist, nearest=nearest, prev=prev)
+
+
+def bidirectional_dijkstra_shortest_path(
+    g: Graph, start: int, goal: int, cancel: Optional["CancelToken"] = None
+) -> PathResult:
+    """
+    Çift yönlü Dijkstra: start'tan ileri, goal'dan geri iki arama yürütülür
+    (graf yönsüz olduğu için geri arama da edges_from kullanır).
+    En iyi buluşma mesafesi mu iken, iki kuyruğun tepe değerleri toplamı
+    mu'ya ulaşınca daha kısa yol kalmaz ve arama durur.
+    visited_order iki cephede kesinleşen düğümleri sırayla içerir.
+    """
+    if start not in g.nodes or goal not in g.nodes:
+        raise ValueError("Start/goal graf içinde yok")
+    if start == goal:
+        return PathResult(distance=0.0, path=[start], visited_order=[start])
+
+    inf = float("inf")
+    # indeks 0: ileri (start'tan), 1: geri (goal'dan)
+    dist: List[Dict[int, float]] = [{start: 0.0}, {goal: 0.0}]
+    prev: List[Dict[int, Optional[int]]] = [{start: None}, {goal: None}]
+    pqs: List[List[Tuple[float, int]]] = [[(0.0, start)], [(0.0, goal)]]
+    settled = [set(), set()]
+    seen = set()
+    visited_order: List[int] = []
+
+    mu = inf
+    meet: Optional[int] = None
+
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= mu:
+            break
+
+        # Tepe değeri küçük olan taraf genişletilir
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        d_u, u = heapq.heappop(pqs[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        if u not in seen:
+            seen.add(u)
+            visited_order.append(u)
+            if cancel is not None and len(visited_order) % CHECK_EVERY == 0:
+                cancel.check(len(visited_order), len(g.nodes))
+
+        dist_s = dist[side]
+        dist_o = dist[1 - side]
+        for e in g.edges_from(u):
+            v = e.to_id
+            nd = d_u + float(e.weight)
+            if nd < dist_s.get(v, inf):
+                dist_s[v] = nd
+                prev[side][v] = u
+                heapq.heappush(pqs[side], (nd, v))
+            if v in dist_o and dist_s[v] + dist_o[v] < mu:
+                mu = dist_s[v] + dist_o[v]
+                meet = v
+
+    if meet is None:
+        return PathResult(distance=inf, path=[], visited_order=visited_order)
+
+    # start -> meet (ileri prev) + meet -> goal (geri prev)
+    path: List[int] = []
+    cur: Optional[int] = meet
+    while cur is not None:
+        path.append(cur)
+        cur = prev[0][cur]
+    path.reverse()
+    cur = prev[1][meet]
+    while cur is not None:
+        path.append(cur)
+        cur = prev[1][cur]
 
-    return PathResult(distance=dist[goal], path=path, visited_order=visited_order)
+    return PathResult(distance=mu, path=path, visited_order=visited_order)
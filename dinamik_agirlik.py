@@ -1,5 +1,13 @@
 # weights.py
-from graph import Node
+from array import array
+from typing import Dict, Sequence, Tuple
+
+from graph import Graph, Node
+
+try:
+    import numpy as np
+except ImportError:  # numpy isteğe bağlı; yoksa saf Python yolu kullanılır
+    np = None
 
 
 def calculate_weight(a: Node, b: Node) -> float:
@@ -15,3 +23,51 @@ def calculate_weight(a: Node, b: Node) -> float:
 
     sum_square = 1 + da * da + di * di + dd * dd
     return 1.0 / sum_square
+
+
+def node_columns(g: Graph) -> Tuple[Dict[int, int], array, array, array]:
+    """
+    Düğüm özelliklerini kolon (dizi) halinde çıkarır.
+    Dönen: (node_id -> indeks, activity[], interaction[], degree[])
+    """
+    nodes = list(g.nodes.values())
+    index = {node.id: i for i, node in enumerate(nodes)}
+    activity = array("d", (float(node.activity) for node in nodes))
+    interaction = array("d", (float(node.interaction) for node in nodes))
+    degree = array("d", (float(node.degree) for node in nodes))
+    return index, activity, interaction, degree
+
+
+def calculate_weights_batch(
+    g: Graph, a_ids: Sequence[int], b_ids: Sequence[int]
+) -> Sequence[float]:
+    """
+    calculate_weight'in toplu sürümü: (a_ids[k], b_ids[k]) çiftlerinin
+    ağırlıklarını kolon dizileri üzerinden tek geçişte hesaplar.
+    numpy varsa tek bir vektörel ifade, yoksa dizi tabanlı döngü kullanılır.
+    """
+    index, activity, interaction, degree = node_columns(g)
+    if np is not None:
+        ia = np.fromiter(map(index.__getitem__, a_ids), dtype=np.int64, count=len(a_ids))
+        ib = np.fromiter(map(index.__getitem__, b_ids), dtype=np.int64, count=len(b_ids))
+        act = np.frombuffer(activity, dtype=np.float64)
+        inter = np.frombuffer(interaction, dtype=np.float64)
+        deg = np.frombuffer(degree, dtype=np.float64)
+        da = act[ia] - act[ib]
+        di = inter[ia] - inter[ib]
+        dd = deg[ia] - deg[ib]
+        return 1.0 / (1.0 + da * da + di * di + dd * dd)
+
+    out = array("d")
+    for a, b in zip(a_ids, b_ids):
+        i = index[a]
+        j = index[b]
+        da = activity[i] - activity[j]
+        di = interaction[i] - interaction[j]
+        dd = degree[i] - degree[j]
+        out.append(1.0 / (1.0 + da * da + di * di + dd * dd))
+    return out
+
+
+# Toplu yükleyiciler (Graph.from_csv gibi) weight_func.batch varsa onu kullanır
+calculate_weight.batch = calculate_weights_batch
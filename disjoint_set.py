@@ -0,0 +1,72 @@
+# disjoint_set.py
+# Ayrık küme (union-find) yapısı: yol sıkıştırma + rank ile birleştirme.
+# Graph bunu bağlı bileşenleri kenar eklemeleriyle birlikte canlı tutmak
+# için kullanır (bkz. Graph.same_component / Graph.component_of).
+from __future__ import annotations
+from typing import Dict, Hashable, Iterable, List
+
+
+class DisjointSet:
+    """Elemanlar herhangi bir hashable olabilir (burada node_id)."""
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        self.parent: Dict[Hashable, Hashable] = {}
+        self.rank: Dict[Hashable, int] = {}
+        self.size: Dict[Hashable, int] = {}
+        self.count = 0  # küme sayısı
+        for x in items:
+            self.add(x)
+
+    def __contains__(self, x) -> bool:
+        return x in self.parent
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self, x: Hashable) -> None:
+        """x'i tek elemanlı yeni küme olarak ekler (zaten varsa dokunmaz)."""
+        if x in self.parent:
+            return
+        self.parent[x] = x
+        self.rank[x] = 0
+        self.size[x] = 1
+        self.count += 1
+
+    def find(self, x: Hashable) -> Hashable:
+        """x'in kümesinin temsilcisi; yol üzerindeki herkes köke bağlanır."""
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: Hashable, b: Hashable) -> bool:
+        """a ve b'nin kümelerini birleştirir; zaten aynıysa False döner."""
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return False
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size.pop(rb)
+        if self.rank[ra] == self.rank.pop(rb):
+            self.rank[ra] += 1
+        self.count -= 1
+        return True
+
+    def same(self, a: Hashable, b: Hashable) -> bool:
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x: Hashable) -> int:
+        """x'in içinde bulunduğu kümenin eleman sayısı."""
+        return self.size[self.find(x)]
+
+    def groups(self) -> List[List[Hashable]]:
+        """Kümeler; elemanlar ve kümeler ilk eklenme sırasıyla."""
+        by_root: Dict[Hashable, List[Hashable]] = {}
+        for x in self.parent:
+            by_root.setdefault(self.find(x), []).append(x)
+        return list(by_root.values())
@@ -1,6 +1,16 @@
 # graph.py
+import csv
+import gzip
+import io
+from array import array
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Dict, List
+from itertools import islice
+from typing import IO, TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from csr import CSRGraph
+    from disjoint_set import DisjointSet
 
 
 @dataclass
@@ -28,40 +38,344 @@ class Graph:
         self.nodes: Dict[int, Node] = {}
         # node_id -> List[Edge]
         self.adj: Dict[int, List[Edge]] = {}
+        # node_id -> {komşu_id -> Edge}; has_edge için O(1) kenar indeksi
+        self._edge_index: Dict[int, Dict[int, Edge]] = {}
+        # freeze() sonrası: dizi tabanlı (CSR) depo, adj onun görünümü olur
+        self._csr: Optional["CSRGraph"] = None
+        # load_snapshot ile açıldıysa CSR dizilerinin baktığı dosya eşlemesi
+        # (mmap); thaw() ya da graf bırakılınca serbest kalır
+        self._mapping = None
+        # to_csr() önbelleği: (sürüm, CSR kopyası)
+        self._csr_cache: Optional[Tuple[int, "CSRGraph"]] = None
+        # Tanımlıysa kenar ağırlıkları bu fonksiyondan türetilir (calculate_weight)
+        self.weight_func: Optional[Callable[[Node, Node], float]] = None
+        # degree/aktiflik/etkileşim değiştiği için kenar ağırlıkları bayatlayan düğümler
+        self._dirty: Set[int] = set()
+        # Bağlı bileşen takibi (union-find): ilk sorguda kurulur, sonra kenar
+        # eklemeleriyle canlı tutulur; silmelerde düşürülüp yeniden kurulur
+        self._components: Optional["DisjointSet"] = None
+        # Her yapısal/ağırlık değişikliğinde artar; önhesap tabloları
+        # (landmark vb.) bununla grafın değişip değişmediğini anlar
+        self.version = 0
+
+    # ---------- Sıkıştırılmış (CSR) depo ----------
+
+    @property
+    def frozen(self) -> bool:
+        return self._csr is not None
+
+    def freeze(self) -> "CSRGraph":
+        """
+        Komşuluk listesini sıkıştırılmış dizi (CSR) düzenine çevirir.
+        Edge nesneleri bırakılır; neighbors/edges_from/has_edge/adjacency_list
+        dizilerden cevaplanır. Graf tekrar değiştirilirse otomatik çözülür.
+        """
+        if self._csr is None:
+            from csr import CSRAdjacency, CSRGraph
+            self.refresh_weights()
+            self._csr = CSRGraph.from_graph(self)
+            self.adj = CSRAdjacency(self._csr)
+            self._edge_index = {}
+        return self._csr
+
+    def to_csr(self) -> "CSRGraph":
+        """
+        Grafın CSR karşılığı: dondurulmuşsa kendi deposu, değilse sürüm
+        değişmedikçe önbellekten dönen bir kopya (graf çözülmez).
+        """
+        if self._csr is not None:
+            return self._csr
+        self.refresh_weights()
+        if self._csr_cache is None or self._csr_cache[0] != self.version:
+            from csr import CSRGraph
+            self._csr_cache = (self.version, CSRGraph.from_graph(self))
+        return self._csr_cache[1]
+
+    @classmethod
+    def from_csr(cls, nodes: Dict[int, Node], csr: "CSRGraph") -> "Graph":
+        """Hazır düğümler ve CSR dizilerinden dondurulmuş graf kurar."""
+        from csr import CSRAdjacency
+        g = cls()
+        g.nodes = nodes
+        g._csr = csr
+        g.adj = CSRAdjacency(csr)
+        return g
+
+    def snapshot(self) -> "Graph":
+        """
+        Arka plan işleri için salt okunur kopya: to_csr() dizileri üzerinde
+        dondurulmuş graf, düğümler kopyalanır. Asıl graf sonradan
+        değiştirilse de (CSR dizileri yerinde değişmez) kopya etkilenmez.
+        Sürüm korunur; kopya üzerinde kurulan önhesaplar asıl grafa da uyar.
+        """
+        nodes = {
+            nid: Node(n.id, n.name, n.activity, n.interaction, n.degree)
+            for nid, n in self.nodes.items()
+        }
+        g = Graph.from_csr(nodes, self.to_csr())
+        g.weight_func = self.weight_func
+        g.version = self.version
+        return g
+
+    def thaw(self) -> None:
+        """Dondurulmuş grafı tekrar dict-of-lists düzenine döndürür."""
+        if self._csr is None:
+            return
+        csr = self._csr
+        self._csr = None
+        self.adj = {nid: csr.edges_from(nid) for nid in csr.ids}
+        self._edge_index = {
+            nid: {e.to_id: e for e in edges} for nid, edges in self.adj.items()
+        }
+        del csr
+        self._release_mapping()
+
+    def _release_mapping(self) -> None:
+        """Snapshot dosyasının eşlemesini kapatır (bkz. snapshot.load_snapshot)."""
+        mapping = self._mapping
+        if mapping is None:
+            return
+        self._mapping = None
+        try:
+            mapping.close()
+        except BufferError:
+            # diziler başka bir grafta (snapshot() kopyası vb.) hâlâ kullanılıyor;
+            # son görünüm bırakıldığında eşleme kendiliğinden kapanır
+            pass
+
+    # ---------- Düğüm / kenar işlemleri ----------
 
     def add_node(self, node: Node):
         """Graf'a yeni düğüm ekler."""
+        self.thaw()
         if node.id in self.nodes:
             raise ValueError(f"Bu id zaten var: {node.id}")
         self.nodes[node.id] = node
         self.adj[node.id] = []
+        self._edge_index[node.id] = {}
+        if self._components is not None:
+            self._components.add(node.id)
+        self.version += 1
+
+    def remove_node(self, node_id: int) -> None:
+        """Düğümü ve ona bağlı tüm kenarları siler."""
+        if node_id not in self.nodes:
+            raise ValueError(f"Böyle bir id yok: {node_id}")
+
+        self.thaw()
+        for other in list(self._edge_index[node_id]):
+            self.remove_edge(node_id, other)
+
+        del self.nodes[node_id]
+        del self.adj[node_id]
+        del self._edge_index[node_id]
+        self._dirty.discard(node_id)
+        self._components = None
+        self.version += 1
+
+    def update_node(
+        self,
+        node_id: int,
+        name: Optional[str] = None,
+        activity: Optional[float] = None,
+        interaction: Optional[int] = None,
+    ) -> None:
+        """
+        Düğüm bilgilerini günceller. Aktiflik/etkileşim değişirse bu düğüme
+        bağlı kenarların ağırlıkları yeniden hesaplanmak üzere işaretlenir.
+        (Node alanlarına doğrudan atama yapılırsa ağırlıklar takip edilmez.)
+        """
+        node = self.nodes[node_id]
+        if name is not None:
+            node.name = name
+        if activity is not None and activity != node.activity:
+            self.thaw()
+            node.activity = activity
+            self._mark_dirty(node_id)
+            self.version += 1
+        if interaction is not None and interaction != node.interaction:
+            self.thaw()
+            node.interaction = interaction
+            self._mark_dirty(node_id)
+            self.version += 1
 
     def has_edge(self, a: int, b: int) -> bool:
         """İki node arasında kenar var mı kontrol eder."""
-        return any(e.to_id == b for e in self.adj.get(a, []))
+        if self._csr is not None:
+            return self._csr.has_edge(a, b)
+        return b in self._edge_index.get(a, ())
 
-    def add_undirected_edge(self, a: int, b: int, weight: float):
+    def add_undirected_edge(
+        self, a: int, b: int, weight: Optional[float] = None
+    ) -> bool:
         """
         Yönsüz bir kenar ekler.
         a-b ve b-a olarak iki kenar ekler.
+        Kenar zaten varsa False döner.
+        weight_func tanımlıysa ağırlık ondan türetilir (verilen weight
+        yalnızca geçicidir); değilse weight verilmezse 1.0 kabul edilir.
         """
         if a == b:
             raise ValueError("Self-loop yasak! (Node kendine bağlanamaz.)")
 
+        self.thaw()
         if self.has_edge(a, b) or self.has_edge(b, a):
-            return
+            return False
+
+        if weight is None:
+            weight = 1.0 if self.weight_func is None else 0.0
 
-        self.adj[a].append(Edge(a, b, weight))
-        self.adj[b].append(Edge(b, a, weight))
+        e_ab = Edge(a, b, weight)
+        e_ba = Edge(b, a, weight)
+        self.adj[a].append(e_ab)
+        self.adj[b].append(e_ba)
+        self._edge_index[a][b] = e_ab
+        self._edge_index[b][a] = e_ba
         self.nodes[a].degree += 1  #eklenenler
         self.nodes[b].degree += 1
+        self._mark_dirty(a)
+        self._mark_dirty(b)
+        if self._components is not None:
+            self._components.union(a, b)
+        self.version += 1
+        return True
+
+    def set_edge_weight(self, a: int, b: int, weight: float) -> None:
+        """a-b kenarının ağırlığını (iki yönde de) günceller."""
+        self.thaw()
+        self._edge_index[a][b].weight = weight
+        self._edge_index[b][a].weight = weight
+        self.version += 1
+
+    def remove_edge(self, a: int, b: int) -> bool:
+        """
+        a-b yönsüz kenarını (iki yönüyle) siler.
+        Kenar yoksa False döner.
+        """
+        self.thaw()
+        e_ab = self._edge_index.get(a, {}).pop(b, None)
+        e_ba = self._edge_index.get(b, {}).pop(a, None)
+        if e_ab is None and e_ba is None:
+            return False
+
+        if e_ab is not None:
+            self.adj[a].remove(e_ab)
+            self.nodes[a].degree -= 1
+        if e_ba is not None:
+            self.adj[b].remove(e_ba)
+            self.nodes[b].degree -= 1
+        self._mark_dirty(a)
+        self._mark_dirty(b)
+        # Silme bileşeni bölebilir; union-find bunu geri alamaz
+        self._components = None
+        self.version += 1
+        return True
+
+    # ---------- Bağlı bileşen takibi ----------
+
+    def components(self) -> "DisjointSet":
+        """
+        Bağlı bileşenlerin union-find yapısı. Yoksa tüm kenarlardan bir kez
+        kurulur; sonraki kenar/düğüm eklemeleri onu yerinde günceller.
+        """
+        if self._components is None:
+            from disjoint_set import DisjointSet
+            ds = DisjointSet(self.nodes)
+            for a in self.nodes:
+                for b in self.neighbors(a):
+                    if a < b:
+                        ds.union(a, b)
+            self._components = ds
+        return self._components
+
+    def same_component(self, a: int, b: int) -> bool:
+        """a ile b aynı bağlı bileşende mi (neredeyse sabit zaman)."""
+        if a not in self.nodes or b not in self.nodes:
+            raise ValueError(f"Böyle bir id yok: {a if a not in self.nodes else b}")
+        return self.components().same(a, b)
+
+    def component_of(self, node_id: int) -> int:
+        """node_id'nin bileşeninin temsilci düğüm id'si."""
+        if node_id not in self.nodes:
+            raise ValueError(f"Böyle bir id yok: {node_id}")
+        return self.components().find(node_id)
+
+    # ---------- Dinamik ağırlık bakımı ----------
+
+    def _mark_dirty(self, node_id: int) -> None:
+        if self.weight_func is not None:
+            self._dirty.add(node_id)
+
+    def refresh_weights(self) -> None:
+        """
+        Yalnızca bayatlamış düğümlere bağlı kenarların ağırlığını yeniden
+        hesaplar. Kenarlar okunurken (edges_from, freeze) otomatik çağrılır;
+        böylece art arda eklemeler tek seferde, toplu olarak güncellenir.
+        """
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        self._dirty = set()
+
+        a_ids = array("q")
+        b_ids = array("q")
+        for x in dirty:
+            for y in self._edge_index.get(x, ()):
+                # iki ucu da bayatsa kenar bir kez (küçük id tarafından) alınır
+                if y in dirty and y < x:
+                    continue
+                a_ids.append(x)
+                b_ids.append(y)
+        self._assign_weights(a_ids, b_ids)
+
+    def recompute_all_weights(self) -> None:
+        """Tüm kenar ağırlıklarını weight_func ile baştan hesaplar."""
+        if self.weight_func is None:
+            return
+        self.thaw()
+        self._dirty = set()
+        a_ids = array("q")
+        b_ids = array("q")
+        for x, nbrs in self._edge_index.items():
+            for y in nbrs:
+                if x < y:
+                    a_ids.append(x)
+                    b_ids.append(y)
+        self._assign_weights(a_ids, b_ids)
+        self.version += 1
+
+    def _assign_weights(self, a_ids: array, b_ids: array) -> None:
+        if not a_ids:
+            return
+        func = self.weight_func
+        batch = getattr(func, "batch", None)
+        # Toplu hesap düğüm kolonlarını baştan çıkarır (O(n)); bu yüzden
+        # yalnızca güncellenen kenar sayısı buna değecek kadar çoksa kullanılır
+        if batch is not None and len(a_ids) * 4 >= len(self.nodes):
+            weights = batch(self, a_ids, b_ids)
+            if hasattr(weights, "tolist"):
+                weights = weights.tolist()
+        else:
+            nodes = self.nodes
+            weights = [func(nodes[a], nodes[b]) for a, b in zip(a_ids, b_ids)]
+
+        index = self._edge_index
+        for a, b, w in zip(a_ids, b_ids, weights):
+            index[a][b].weight = w
+            index[b][a].weight = w
 
     def neighbors(self, node_id: int) -> List[int]:
         """Bir node'un komşu node id'lerini döner."""
+        if self._csr is not None:
+            return self._csr.neighbors(node_id)
         return [e.to_id for e in self.adj.get(node_id, [])]
 
     def edges_from(self, node_id: int) -> List[Edge]:
         """Bir node'dan çıkan kenarları döner."""
+        if self._csr is not None:
+            return self._csr.edges_from(node_id)
+        if self._dirty:
+            self.refresh_weights()
         return self.adj.get(node_id, [])
 
     # ---------- Komşuluk Listesi / Matrisi ----------
@@ -71,6 +385,8 @@ class Graph:
         Her düğüm için komşularının id listesini döner.
         Örnek: {1: [2,3], 2: [1,3], ...}
         """
+        if self._csr is not None:
+            return self._csr.adjacency_list()
         return {nid: [e.to_id for e in edges] for nid, edges in self.adj.items()}
 
     def adjacency_matrix(self) -> tuple[list[int], list[list[int]]]:
@@ -96,49 +412,100 @@ class Graph:
     # ---------- CSV içe/dışa aktarma ----------
 
     @classmethod
-    def from_csv(cls, path: str, weight_func) -> "Graph":
+    def from_csv(
+        cls,
+        source: Union[str, IO],
+        weight_func,
+        progress: Optional[Callable[[str, int], None]] = None,
+        chunk_size: int = 10000,
+    ) -> "Graph":
         """
-        CSV'den graf oluşturur.
+        CSV'den graf oluşturur (tek geçiş, akış halinde okuma).
         Beklenen kolon isimleri:
           DugumId, Ozellik_I, Ozellik_II, Ozellik_III, Komsular
         Komsular: '2,4,5' gibi virgülle ayrılmış id listesi
         weight_func: iki Node alıp ağırlık dönen fonksiyon (calculate_weight)
+                     grafın weight_func'ı olur; weight_func.batch(g, a_ids, b_ids)
+                     tanımlıysa ağırlıklar yükleme sonunda toplu hesaplanır
+        source: dosya yolu ya da açık dosya nesnesi (.gz / gzip desteklenir)
+        progress: isteğe bağlı, progress(aşama, sayı) şeklinde çağrılır;
+                  aşama "rows" (okunan satır) veya "edges" (işlenen komşuluk)
+
+        Satırlar chunk_size'lık parçalar halinde okunur; ham satırlar
+        saklanmaz, komşuluklar (a_id, b_id) dizilerinde bekletilir ve
+        tüm düğümler bilindikten sonra (ileri referanslar) kenara çevrilir.
         """
         g = cls()
-        rows = []
-
-        # Önce tüm düğümleri ekle
-        import csv
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter=",")
-            for row in reader:
-                rows.append(row)
-                node_id = int(row["DugumId"])
-                activity = float(row["Ozellik_I"])
-                interaction = int(row["Ozellik_II"])
-                # name veya Ozellik_III zorunlu değil
-                node = Node(id=node_id, name=f"Node{node_id}",
-                            activity=activity, interaction=interaction)
-                g.add_node(node)
-
-        # Sonra komşuluklara göre edge ekle
-
-        for row in rows:
-            a_id = int(row["DugumId"])
-            neighbors_str = row.get("Komsular", "").strip()
-            if not neighbors_str:
-                continue
-            neighbor_ids = [int(x) for x in neighbors_str.split(",") if x.strip()]
-            for b_id in neighbor_ids:
-                if b_id not in g.nodes:
-                    continue
-                a = g.nodes[a_id]
-                b = g.nodes[b_id]
-                w = weight_func(a, b)
-                g.add_undirected_edge(a_id, b_id, w)
+        pending_a = array("q")
+        pending_b = array("q")
+
+        with _open_csv_source(source) as f:
+            reader = csv.reader(f, delimiter=",")
+            header = next(reader, None)
+            if header is None:
+                return g
+            col = {name.strip(): i for i, name in enumerate(header)}
+            missing = [c for c in ("DugumId", "Ozellik_I", "Ozellik_II") if c not in col]
+            if missing:
+                raise ValueError(f"CSV'de zorunlu kolon(lar) yok: {', '.join(missing)}")
+            i_id = col["DugumId"]
+            i_act = col["Ozellik_I"]
+            i_int = col["Ozellik_II"]
+            i_nb = col.get("Komsular")
+
+            rows_read = 0
+            while True:
+                chunk = list(islice(reader, chunk_size))
+                if not chunk:
+                    break
+                for row in chunk:
+                    node_id = int(row[i_id])
+                    # name veya Ozellik_III zorunlu değil
+                    g.add_node(Node(id=node_id, name=f"Node{node_id}",
+                                    activity=float(row[i_act]),
+                                    interaction=int(row[i_int])))
+                    if i_nb is None or i_nb >= len(row):
+                        continue
+                    for x in row[i_nb].split(","):
+                        if x.strip():
+                            pending_a.append(node_id)
+                            pending_b.append(int(x))
+                rows_read += len(chunk)
+                if progress:
+                    progress("rows", rows_read)
+
+        # Sonra komşuluklara göre edge ekle (dosyadaki sırayla); ağırlıklar
+        # tüm kenarlar eklendikten sonra son degree'lerle toplu hesaplanır
+        g.weight_func = weight_func
+        nodes = g.nodes
+        for k, (a_id, b_id) in enumerate(zip(pending_a, pending_b), start=1):
+            if b_id in nodes:
+                g.add_undirected_edge(a_id, b_id)
+            if progress and k % chunk_size == 0:
+                progress("edges", k)
+        if progress:
+            progress("edges", len(pending_a))
+        g.refresh_weights()
 
         return g
 
+    # ---------- İkili anlık görüntü (snapshot) ----------
+
+    def save_snapshot(self, path: str) -> None:
+        """Grafı hızlı yüklenebilen ikili formatta kaydeder (bkz. snapshot.py)."""
+        from snapshot import save_snapshot
+        save_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, weight_func=None) -> "Graph":
+        """
+        save_snapshot ile yazılmış dosyayı mmap üzerinden açar.
+        weight_func: dinamik ağırlıklı dosyada kullanılacak fonksiyon
+                     (None ise calculate_weight)
+        """
+        from snapshot import load_snapshot
+        return load_snapshot(path, weight_func)
+
     def to_csv(self, path: str) -> None:
         """
         Grafı CSV'ye yazar.
@@ -146,7 +513,6 @@ class Graph:
           DugumId, Ozellik_I (aktiflik), Ozellik_II (etkileşim),
           Ozellik_III (degree), Komsular (virgülle ayrılmış id listesi)
         """
-        import csv
         fieldnames = ["DugumId", "Ozellik_I", "Ozellik_II", "Ozellik_III", "Komsular"]
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -162,3 +528,60 @@ class Graph:
                         "Komsular": neighbors,
                     }
                 )
+
+
+# ---------- CSV kaynağı açma yardımcıları ----------
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open_csv_source(source: Union[str, IO]):
+    """
+    Dosya yolu veya dosya nesnesini metin akışı olarak açar.
+    gzip içeriği uzantıdan bağımsız olarak ilk baytlardan tanınır.
+    Dışarıdan verilen dosya nesneleri kapatılmaz.
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, "rb") as probe:
+            is_gzip = probe.read(2) == _GZIP_MAGIC
+        if is_gzip:
+            return gzip.open(source, "rt", newline="", encoding="utf-8")
+        return open(source, newline="", encoding="utf-8")
+
+    if isinstance(source, io.TextIOBase):
+        return nullcontext(source)
+
+    # İkili dosya nesnesi: gerekirse gzip çöz, sonra metne çevir
+    raw = source
+    if hasattr(raw, "peek"):
+        head = raw.peek(2)[:2]
+    elif raw.seekable():
+        pos = raw.tell()
+        head = raw.read(2)
+        raw.seek(pos)
+    else:
+        head = b""
+    if head == _GZIP_MAGIC:
+        raw = gzip.GzipFile(fileobj=raw, mode="rb")
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    return _DetachOnExit(text, owned=raw if raw is not source else None)
+
+
+class _DetachOnExit:
+    """
+    TextIOWrapper'ı kapatırken alttaki (çağırana ait) dosyayı kapatmaz.
+    owned: arada bizim açtığımız katman (GzipFile); o kapatılır, ama
+    fileobj ile verildiği için çağıranın akışına dokunmaz.
+    """
+
+    def __init__(self, wrapper: io.TextIOWrapper, owned: Optional[IO] = None):
+        self.wrapper = wrapper
+        self.owned = owned
+
+    def __enter__(self) -> io.TextIOWrapper:
+        return self.wrapper
+
+    def __exit__(self, *exc) -> None:
+        self.wrapper.detach()
+        if self.owned is not None:
+            self.owned.close()
@@ -1,15 +1,58 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import math
+import os
 
 from dinamik_agirlik import calculate_weight
 from main import load_graph  # CSV varsa oradan, yoksa default graf
 from dijkstra import dijkstra_shortest_path
 from astar import astar_shortest_path
+from landmarks import LandmarkIndex
 from components import connected_components
-from centrality import top_k_degree_centrality
-from welsh_powell import welsh_powell_coloring
-from graph import Graph, Node, Edge
+from centrality import (
+    betweenness_centrality,
+    top_k_closeness_centrality,
+    top_k_degree_centrality,
+    top_k_harmonic_centrality,
+)
+from sharding import sharded_coloring
+from graph import Graph, Node
+from jobs import JobRunner
+from result_table import LazyRows, LazyTable
+from renderer import GraphRenderer, edge_key
+from layout import (
+    IDEAL_EDGE_LENGTH,
+    LayoutCache,
+    LayoutWorker,
+    fingerprint,
+    layout_available,
+)
+
+# Hesaplanan yerleşimler burada saklanır; aynı graf tekrar açılınca anında gelir
+LAYOUT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sosyal_ag_layout")
+# Arka plandaki yerleşim kuyruğunun yoklanma aralığı (ms)
+LAYOUT_POLL_MS = 50
+# Bundan uzun listeler metin paneline satır satır yazılmaz; Tablo sekmesinde
+# sayfa sayfa gösterilir, metne özet düşülür
+TEXT_ROW_LIMIT = 200
+# Renklendirmede kullanılan pastel palet
+COLOR_PALETTE = [
+    "#ffd966",
+    "#9fc5f8",
+    "#b6d7a8",
+    "#d5a6bd",
+    "#f4cccc",
+    "#cfe2f3",
+]
+
+
+# Merkezilik görünümündeki ölçütler: ad -> (graf, k, cancel) -> ilk k CentralityRow
+CENTRALITY_METRICS = {
+    "Degree": lambda g, k, cancel: top_k_degree_centrality(g, k),
+    "Closeness": lambda g, k, cancel: top_k_closeness_centrality(g, k, cancel=cancel),
+    "Harmonic": lambda g, k, cancel: top_k_harmonic_centrality(g, k, cancel=cancel),
+    "Betweenness": lambda g, k, cancel: betweenness_centrality(g, cancel=cancel)[:k],
+}
 
 
 class GraphApp(tk.Tk):
@@ -20,9 +63,17 @@ class GraphApp(tk.Tk):
         self.geometry("1200x650")
 
         # Canvas için yardımcı yapılar
-        self.node_positions = {}   # node_id -> (x, y)
-        self.node_items = {}       # node_id -> canvas oval id
-        self.edge_items = {}       # (a_id, b_id) -> line id
+        self.node_positions = {}   # node_id -> (x, y) dünya koordinatı
+        self.renderer = None       # GraphRenderer (canvas kurulunca)
+        # Kuvvet yönlendirmeli yerleşim: önbellek ve çalışan arka plan işi
+        self.layout_cache = LayoutCache(LAYOUT_CACHE_DIR)
+        self._layout_worker = None
+
+        # A* (ALT) için önhesaplanmış landmark tabloları
+        self._landmarks = None
+
+        # Algoritmalar arka planda, grafın anlık kopyası üzerinde çalışır
+        self.jobs = JobRunner(self, on_status=self._on_job_status)
 
         # 1) Grafı backend'den yükle
         try:
@@ -106,6 +157,27 @@ class GraphApp(tk.Tk):
         )
         self.goal_combo.grid(row=0, column=3, padx=5, pady=5)
 
+        # Dijkstra için çift yönlü arama seçeneği
+        self.bidirectional_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            top_frame,
+            text="Çift yönlü Dijkstra",
+            variable=self.bidirectional_var,
+        ).grid(row=0, column=4, padx=(20, 0), sticky="w")
+
+        # Merkezilik ölçütü
+        ttk.Label(top_frame, text="Merkezilik ölçütü:").grid(
+            row=1, column=0, sticky="w"
+        )
+        self.centrality_var = tk.StringVar(value="Degree")
+        ttk.Combobox(
+            top_frame,
+            textvariable=self.centrality_var,
+            state="readonly",
+            values=list(CENTRALITY_METRICS),
+            width=25,
+        ).grid(row=1, column=1, padx=5, pady=5)
+
         # Algoritma butonları
         button_frame = ttk.Frame(self)
         button_frame.pack(fill="x", padx=10, pady=(0, 10))
@@ -126,7 +198,7 @@ class GraphApp(tk.Tk):
         self.components_btn.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
 
         self.centrality_btn = ttk.Button(
-            button_frame, text="Degree Centrality (Top 5)", command=self.show_centrality
+            button_frame, text="Centrality (Top 5)", command=self.show_centrality
         )
         self.centrality_btn.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
 
@@ -183,6 +255,18 @@ class GraphApp(tk.Tk):
         )
         self.btn_save_csv.pack(side="left", padx=5)
 
+        # Arka plan işi: durum, ilerleme, iptal
+        self.btn_cancel_job = ttk.Button(
+            csv_frame, text="İptal", command=self.jobs.cancel, state="disabled"
+        )
+        self.btn_cancel_job.pack(side="right", padx=5)
+        self.job_progress = ttk.Progressbar(
+            csv_frame, length=160, maximum=1.0, mode="determinate"
+        )
+        self.job_progress.pack(side="right", padx=5)
+        self.job_status_var = tk.StringVar(value="Hazır")
+        ttk.Label(csv_frame, textvariable=self.job_status_var).pack(side="right", padx=5)
+
         # Ana görünüm: canvas solda, sonuçlar sağda
         main_pane = tk.PanedWindow(self, orient="horizontal")
         main_pane.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -195,127 +279,90 @@ class GraphApp(tk.Tk):
 
         self.canvas = tk.Canvas(left_frame, bg="white")
         self.canvas.pack(fill="both", expand=True)
-
-        self.output = tk.Text(right_frame, wrap="word")
-        self.output.pack(fill="both", expand=True)
+        # Sürükle: kaydır, tekerlek: yakınlaştır, düğüme tıkla: seç
+        self.renderer = GraphRenderer(self.canvas, self.node_positions)
+        self.renderer.on_node_click = self.on_node_click
+
+        # Sonuçlar: metin çıktısı ve uzun listeler için tembel tablo
+        self.result_tabs = ttk.Notebook(right_frame)
+        self.result_tabs.pack(fill="both", expand=True)
+        self.output = tk.Text(self.result_tabs, wrap="word")
+        self.result_tabs.add(self.output, text="Çıktı")
+        self.result_table = LazyTable(self.result_tabs)
+        self.result_tabs.add(self.result_table, text="Tablo")
 
         # Başlangıçta graf bilgilerini yaz
-        self.output.insert("end", "Graf yüklendi.\n\nDüğümler:\n")
-        for nid in self.node_ids:
-            node = self.graph.nodes[nid]
-            self.output.insert(
-                "end",
-                f"- {nid}: {node.name} "
-                f"(activity={node.activity}, "
-                f"interaction={node.interaction}, "
-                f"degree={node.degree})\n",
-            )
-
-        self.output.insert("end", "\nKomşuluk listesi:\n")
-        adj = self.graph.adjacency_list()
-        for nid in sorted(adj):
-            self.output.insert("end", f"{nid}: {adj[nid]}\n")
+        self._show_graph_summary("Graf yüklendi.")
 
     # -------------------------------------------------
     # ÇİZİM / HIGHLIGHT
     # -------------------------------------------------
-    def refresh_degrees(self):
-        """Adjacency list'e göre tüm düğümlerin degree değerlerini günceller."""
-        if not self.graph or not self.graph.nodes:
-            return
-
-        for nid, node in self.graph.nodes.items():
-            try:
-                neighbors = self.graph.neighbors(nid)
-                node.degree = len(neighbors)
-            except Exception:
-                if nid in self.graph.adj:
-                    node.degree = len(self.graph.adj[nid])
-                else:
-                    node.degree = 0
-
     def draw_graph(self):
-        """Grafı canvas üzerinde çizer."""
-        self.canvas.delete("all")
-        self.node_positions.clear()
-        self.node_items.clear()
-        self.edge_items.clear()
-
-        if not self.graph or not self.graph.nodes:
+        """
+        Grafı canvas'a yansıtır. Aynı graf için yalnızca değişen düğüm ve
+        kenarlar güncellenir; yeni bir graf (CSV yükleme) baştan yerleştirilir.
+        Ardından kuvvet yönlendirmeli yerleşim arka planda başlatılır.
+        """
+        new_graph = self.renderer.graph is not self.graph
+        if new_graph:
+            self.renderer.set_graph(self.graph)
+        else:
+            self.renderer.sync()
+        self._start_layout(new_graph)
+
+    def _start_layout(self, new_graph):
+        """
+        Yerleşimi önbellekten uygular ya da arka planda hesaplatır.
+        Düzenlemeden sonra mevcut konumlardan, düşük sıcaklıkla devam edilir.
+        """
+        if self._layout_worker is not None:
+            self._layout_worker.cancel()
+            self._layout_worker = None
+        if not self.graph or not layout_available(len(self.graph.nodes)):
             return
 
-        try:
-            self.refresh_degrees()
-        except AttributeError:
-            pass
-
-        nodes = list(self.graph.nodes.values())
-        n = len(nodes)
-        if n == 0:
-            return
-
-        # Düğümleri grid düzeninde yerleştir
-        cols = 6
-        spacing_x = 120
-        spacing_y = 90
-        start_x = 80
-        start_y = 80
-
-        for idx, node in enumerate(nodes):
-            row = idx // cols
-            col = idx % cols
-            x = start_x + col * spacing_x
-            y = start_y + row * spacing_y
-            self.node_positions[node.id] = (x, y)
-
-        # Kenarları çiz
-        try:
-            adj = self.graph.adjacency_list()
-        except Exception:
-            adj = {}
-
-        drawn_edges = set()
-        for a_id, neighbors in adj.items():
-            x1, y1 = self.node_positions.get(a_id, (0, 0))
-            for b_id in neighbors:
-                key = tuple(sorted((a_id, b_id)))
-                if key in drawn_edges:
-                    continue
-                drawn_edges.add(key)
-
-                x2, y2 = self.node_positions.get(b_id, (0, 0))
-                line_id = self.canvas.create_line(
-                    x1, y1, x2, y2, width=2, fill="gray"
-                )
-                self.edge_items[key] = line_id
-
-        # Düğümleri (oval + id yazısı) çiz
-        r = 20
-        for node in nodes:
-            x, y = self.node_positions[node.id]
-            oval_id = self.canvas.create_oval(
-                x - r, y - r, x + r, y + r,
-                fill="#88c4ff", outline="black", width=2
-            )
-            text_id = self.canvas.create_text(x, y, text=str(node.id))
-
-            self.node_items[node.id] = oval_id
+        cached = self.layout_cache.get(fingerprint(self.graph))
+        if cached is not None:
+            self.renderer.update_positions(cached)
+            if new_graph:
+                self.renderer.fit_view()
+            return
 
-            self.canvas.tag_bind(
-                oval_id,
-                "<Button-1>",
-                lambda event, nid=node.id: self.on_node_click(nid)
-            )
-            self.canvas.tag_bind(
-                text_id,
-                "<Button-1>",
-                lambda event, nid=node.id: self.on_node_click(nid)
-            )
+        worker = LayoutWorker(
+            self.graph,
+            initial=None if new_graph else self.node_positions,
+            cache=self.layout_cache,
+            iterations=100 if new_graph else 30,
+            temperature=None if new_graph else IDEAL_EDGE_LENGTH,
+        )
+        self._layout_worker = worker
+        worker.start()
+        self.after(LAYOUT_POLL_MS, self._poll_layout, worker, new_graph, True)
+
+    def _poll_layout(self, worker, new_graph, first):
+        """
+        Arka plandaki yerleşimin son ara konumlarını canvas'a aktarır.
+        Yeni grafta görünüm ilk ara sonuçta ve yerleşim bitince sığdırılır.
+        """
+        if worker is not self._layout_worker:
+            return  # iptal edildi / yerini yenisi aldı
+        latest = None
+        done = False
+        while not worker.updates.empty():
+            _, latest, done = worker.updates.get_nowait()
+        if latest is not None:
+            self.renderer.update_positions(latest)
+            if new_graph and (first or done):
+                self.renderer.fit_view()
+            first = False
+        if done:
+            self._layout_worker = None
+        else:
+            self.after(LAYOUT_POLL_MS, self._poll_layout, worker, new_graph, first)
 
     def _reset_edge_styles(self):
         """Tüm kenarları varsayılan görünüme döndür."""
-        for line_id in self.edge_items.values():
-            self.canvas.itemconfig(line_id, fill="gray", width=2)
+        self.renderer.reset_edge_styles()
 
     def _highlight_path(self, path, color="red"):
         """Verilen path üzerindeki kenarları renklendir."""
@@ -325,12 +372,9 @@ class GraphApp(tk.Tk):
         self._reset_edge_styles()
 
         for i in range(len(path) - 1):
-            a = path[i]
-            b = path[i + 1]
-            key = tuple(sorted((a, b)))
-            line_id = self.edge_items.get(key)
-            if line_id:
-                self.canvas.itemconfig(line_id, fill=color, width=4)
+            self.renderer.set_edge_style(
+                edge_key(path[i], path[i + 1]), fill=color, width=4
+            )
 
     # -------------------------------------------------
     # DÜĞÜM / KENAR İŞLEMLERİ
@@ -426,14 +470,7 @@ class GraphApp(tk.Tk):
         ):
             return
 
-        try:
-            self.graph.remove_node(node_id)
-        except AttributeError:
-            for nid, edges in list(self.graph.adj.items()):
-                self.graph.adj[nid] = [e for e in edges if e.to_id != node_id]
-            if node_id in self.graph.adj:
-                del self.graph.adj[node_id]
-            del self.graph.nodes[node_id]
+        self.graph.remove_node(node_id)
 
         self.refresh_node_options()
         self.draw_graph()
@@ -507,9 +544,10 @@ class GraphApp(tk.Tk):
             messagebox.showerror("Hata", "Etkileşim tam sayı olmalı.", parent=self)
             return
 
-        node.name = name
-        node.activity = activity
-        node.interaction = interaction
+        # Graph üzerinden güncellenir ki bağlı kenarların ağırlıkları yenilensin
+        self.graph.update_node(
+            node_id, name=name, activity=activity, interaction=interaction
+        )
 
         self.refresh_node_options()
         self.draw_graph()
@@ -556,42 +594,38 @@ class GraphApp(tk.Tk):
             messagebox.showerror("Hata", "Girilen id'lerden biri graf içinde yok.", parent=self)
             return
 
-        weight_str = simpledialog.askstring(
-            "Kenar Ekle",
-            "Ağırlık (boş bırakırsan 1.0 kabul edilir):",
-            parent=self,
-        )
-        if not weight_str:
-            weight = 1.0
-        else:
-            try:
-                weight = float(weight_str)
-            except ValueError:
-                messagebox.showerror("Hata", "Ağırlık sayı olmalı.", parent=self)
-                return
-
-        if from_id not in self.graph.adj:
-            self.graph.adj[from_id] = []
-        if to_id not in self.graph.adj:
-            self.graph.adj[to_id] = []
-
-        for e in self.graph.adj[from_id]:
-            if e.to_id == to_id:
-                messagebox.showerror("Hata", f"{from_id} -> {to_id} kenarı zaten var.", parent=self)
-                return
-
-        edge1 = Edge(from_id=from_id, to_id=to_id, weight=weight)
-        edge2 = Edge(from_id=to_id, to_id=from_id, weight=weight)
-
-        self.graph.adj[from_id].append(edge1)
-        self.graph.adj[to_id].append(edge2)
+        # Dinamik ağırlıklı grafta (CSV'den yüklenen) ağırlık otomatik hesaplanır
+        weight = None
+        if self.graph.weight_func is None:
+            weight_str = simpledialog.askstring(
+                "Kenar Ekle",
+                "Ağırlık (boş bırakırsan 1.0 kabul edilir):",
+                parent=self,
+            )
+            if not weight_str:
+                weight = 1.0
+            else:
+                try:
+                    weight = float(weight_str)
+                except ValueError:
+                    messagebox.showerror("Hata", "Ağırlık sayı olmalı.", parent=self)
+                    return
+
+        if self.graph.has_edge(from_id, to_id):
+            messagebox.showerror("Hata", f"{from_id} -> {to_id} kenarı zaten var.", parent=self)
+            return
 
-        if hasattr(self.graph, "edges"):
-            self.graph.edges.append(edge1)
-            self.graph.edges.append(edge2)
+        try:
+            self.graph.add_undirected_edge(from_id, to_id, weight)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e), parent=self)
+            return
 
         self.draw_graph()
 
+        weight = next(
+            e.weight for e in self.graph.edges_from(from_id) if e.to_id == to_id
+        )
         self.output.insert(
             "end",
             f"\n[Kenar Ekle] {from_id} <-> {to_id} (weight={weight}) eklendi.\n"
@@ -633,32 +667,7 @@ class GraphApp(tk.Tk):
             messagebox.showerror("Hata", "Girilen id'lerden biri graf içinde yok.", parent=self)
             return
 
-        silindi = False
-
-        if from_id in self.graph.adj:
-            eski_len = len(self.graph.adj[from_id])
-            self.graph.adj[from_id] = [
-                e for e in self.graph.adj[from_id] if e.to_id != to_id
-            ]
-            if len(self.graph.adj[from_id]) != eski_len:
-                silindi = True
-
-        if to_id in self.graph.adj:
-            eski_len = len(self.graph.adj[to_id])
-            self.graph.adj[to_id] = [
-                e for e in self.graph.adj[to_id] if e.to_id != from_id
-            ]
-            if len(self.graph.adj[to_id]) != eski_len:
-                silindi = True
-
-        if hasattr(self.graph, "edges"):
-            self.graph.edges = [
-                e for e in self.graph.edges
-                if not (
-                    (e.from_id == from_id and e.to_id == to_id) or
-                    (e.from_id == to_id and e.to_id == from_id)
-                )
-            ]
+        silindi = self.graph.remove_edge(from_id, to_id)
 
         if not silindi:
             messagebox.showinfo(
@@ -683,9 +692,7 @@ class GraphApp(tk.Tk):
         node = self.graph.nodes[node_id]
         neighbors = self.graph.neighbors(node_id)
 
-        for nid, item_id in self.node_items.items():
-            width = 3 if nid == node_id else 1
-            self.canvas.itemconfig(item_id, width=width)
+        self.renderer.select_node(node_id)
 
         self.output.insert("end", "\n--- Seçili düğüm ---\n")
         self.output.insert(
@@ -716,122 +723,262 @@ class GraphApp(tk.Tk):
     def clear_output(self):
         self.output.delete("1.0", "end")
 
+    def _write_output(self, lines):
+        """Satırları tek bir insert ile yazar (satır başına Tk çağrısı yok)."""
+        self.output.insert("end", "".join(lines))
+        self.output.see("end")
+
+    def _show_table(self, title, columns, rows, select):
+        """Listeyi Tablo sekmesine koyar; select ise sekmeyi öne alır."""
+        self.result_table.show(title, columns, rows)
+        if select:
+            self.result_tabs.select(self.result_table)
+
+    def _show_graph_summary(self, header):
+        """Düğümler ve komşuluk listesi (uzunsa tabloda, metinde özet)."""
+        g = self.graph
+        node_ids = sorted(g.nodes)
+        small = len(node_ids) <= TEXT_ROW_LIMIT
+        if small:
+            lines = [f"{header}\n\nDüğümler:\n"]
+            for nid in node_ids:
+                node = g.nodes[nid]
+                lines.append(
+                    f"- {nid}: {node.name} "
+                    f"(activity={node.activity}, "
+                    f"interaction={node.interaction}, "
+                    f"degree={node.degree})\n"
+                )
+            lines.append("\nKomşuluk listesi:\n")
+            adj = g.adjacency_list()
+            lines.extend(f"{nid}: {adj[nid]}\n" for nid in sorted(adj))
+        else:
+            lines = [
+                f"{header}\n\n{len(node_ids)} düğüm, "
+                f"{g.to_csr().num_edges // 2} kenar.\n"
+                "Düğümler ve komşuluk listesi Tablo sekmesinde.\n"
+            ]
+        self._write_output(lines)
+
+        def row(nid):
+            node = g.nodes.get(nid)
+            if node is None:  # tablo gösterildikten sonra silinmiş
+                return (nid, "-", "", "", "", "")
+            return (
+                nid, node.name, node.activity, node.interaction, node.degree,
+                " ".join(map(str, g.neighbors(nid))),
+            )
+
+        self._show_table(
+            "Düğümler",
+            ("id", "name", "activity", "interaction", "degree", "komşular"),
+            LazyRows(node_ids, row),
+            select=not small,
+        )
+
     # -------------------------------------------------
-    # ALGORİTMA BUTONLARI
+    # ARKA PLAN İŞLERİ
     # -------------------------------------------------
-    def run_dijkstra(self):
-        start, goal = self._get_selected_nodes()
-        if start is None:
-            return
+    def _run_job(self, name, func, on_done, error):
+        """
+        func(snapshot, cancel) grafın anlık kopyası üzerinde arka planda
+        çalışır; sonuç on_done'a ana iş parçacığında verilir. Bu arada
+        graf düzenlenebilir, yeni bir iş eskisini iptal eder.
+        """
+        snapshot = self.graph.snapshot()
+        self.jobs.submit(
+            name,
+            lambda cancel: func(snapshot, cancel),
+            on_done,
+            on_error=lambda e: messagebox.showerror("Hata", f"{error}:\n{e}"),
+        )
 
-        try:
-            result = dijkstra_shortest_path(self.graph, start, goal)
-        except Exception as e:
-            messagebox.showerror("Hata", f"Dijkstra çalışırken hata oluştu:\n{e}")
-            return
+    def _on_job_status(self, name, elapsed, fraction, finished):
+        """Durum çubuğu: iş adı, geçen süre ve ilerleme."""
+        if not finished:
+            text = f"{name}: {elapsed:.1f} s"
+            if fraction is not None:
+                text += f" (%{fraction * 100:.0f})"
+            self.job_progress.configure(
+                mode="determinate" if fraction is not None else "indeterminate"
+            )
+            if fraction is not None:
+                self.job_progress["value"] = fraction
+            else:
+                self.job_progress.step(0.05)
+            self.btn_cancel_job.configure(state="normal")
+        else:
+            label = {"ok": "bitti", "cancelled": "iptal edildi", "error": "hata"}[finished]
+            text = f"{name}: {label} ({elapsed:.2f} s)"
+            self.job_progress.configure(mode="determinate")
+            self.job_progress["value"] = 1.0 if finished == "ok" else 0.0
+            self.btn_cancel_job.configure(state="disabled")
+        self.job_status_var.set(text)
 
-        self.output.insert("end", "\n\n[Dijkstra Sonucu]\n")
+    # -------------------------------------------------
+    # ALGORİTMA BUTONLARI
+    # -------------------------------------------------
+    def _show_path_result(self, title, start, goal, result, color):
+        self.output.insert("end", f"\n\n[{title} Sonucu]\n")
         self.output.insert("end", f"Başlangıç: {start}  Hedef: {goal}\n")
         self.output.insert("end", f"Mesafe: {result.distance}\n")
         self.output.insert("end", f"Yol: {result.path}\n")
         self.output.insert("end", f"Ziyaret sırası: {result.visited_order}\n")
         self.output.see("end")
 
-        # Yol üzerindeki kenarları KIRMIZI ile vurgula
-        self._highlight_path(result.path, color="red")
+        # Yol üzerindeki kenarları vurgula
+        self._highlight_path(result.path, color=color)
 
-    def run_astar(self):
+    def run_dijkstra(self):
         start, goal = self._get_selected_nodes()
         if start is None:
             return
 
-        try:
-            result = astar_shortest_path(self.graph, start, goal)
-        except Exception as e:
-            messagebox.showerror("Hata", f"A* çalışırken hata oluştu:\n{e}")
+        bidirectional = self.bidirectional_var.get()
+        title = "Çift Yönlü Dijkstra" if bidirectional else "Dijkstra"
+        self._run_job(
+            title,
+            lambda g, cancel: dijkstra_shortest_path(
+                g, start, goal, bidirectional=bidirectional, cancel=cancel
+            ),
+            # Yol KIRMIZI ile vurgulanır
+            lambda result: self._show_path_result(title, start, goal, result, "red"),
+            "Dijkstra çalışırken hata oluştu",
+        )
+
+    def run_astar(self):
+        start, goal = self._get_selected_nodes()
+        if start is None:
             return
 
-        self.output.insert("end", "\n\n[A* Sonucu]\n")
-        self.output.insert("end", f"Başlangıç: {start}  Hedef: {goal}\n")
-        self.output.insert("end", f"Mesafe: {result.distance}\n")
-        self.output.insert("end", f"Yol: {result.path}\n")
-        self.output.insert("end", f"Ziyaret sırası: {result.visited_order}\n")
-        self.output.see("end")
+        # Landmark tabloları grafın içeriği (kenarlar + ağırlıklar)
+        # değişmedikçe yeniden kullanılır; gerekirse arka planda (kopya
+        # üzerinde) kurulur. Kopya asıl grafla aynı CSR'ı paylaştığından
+        # parmak izi aynıdır, tablolar asıl graf için de geçerlidir.
+        cached = self._landmarks
+        if cached is not None and not cached.is_current(self.graph):
+            cached = None
+
+        def job(g, cancel):
+            landmarks = cached or LandmarkIndex.build(g, k=8)
+            return landmarks, astar_shortest_path(
+                g, start, goal, landmarks=landmarks, cancel=cancel
+            )
 
-        # Yol üzerindeki kenarları YEŞİL ile vurgula
-        self._highlight_path(result.path, color="green")
+        def done(value):
+            landmarks, result = value
+            self._landmarks = landmarks
+            # Yol YEŞİL ile vurgulanır
+            self._show_path_result("A*", start, goal, result, "green")
+
+        self._run_job("A*", job, done, "A* çalışırken hata oluştu")
 
     def show_components(self):
-        try:
-            comps = connected_components(self.graph)
-        except Exception as e:
-            messagebox.showerror("Hata", f"Bağlı bileşenler hesaplanırken hata:\n{e}")
-            return
+        def job(g, cancel):
+            comps = connected_components(g)
+            return [(comp, [g.nodes[n].name for n in comp]) for comp in comps]
+
+        def done(comps):
+            small = sum(len(comp) for comp, _ in comps) <= TEXT_ROW_LIMIT
+            lines = ["\n\n[Bağlı Bileşenler]\n"]
+            if small:
+                lines.extend(
+                    f"- Bileşen {i}: {comp} -> {names}\n"
+                    for i, (comp, names) in enumerate(comps, start=1)
+                )
+            else:
+                sizes = [len(comp) for comp, _ in comps[:10]]
+                lines.append(
+                    f"{len(comps)} bileşen; en büyükleri: {sizes}\n"
+                    "Tüm bileşenler Tablo sekmesinde.\n"
+                )
+            self._write_output(lines)
+
+            def row(i):
+                comp, names = comps[i]
+                preview = comp[:20]
+                more = " ..." if len(comp) > len(preview) else ""
+                return (
+                    i + 1, len(comp), " ".join(map(str, preview)) + more,
+                    ", ".join(names[:20]) + more,
+                )
 
-        self.output.insert("end", "\n\n[Bağlı Bileşenler]\n")
-        for i, comp in enumerate(comps, start=1):
-            names = [self.graph.nodes[n].name for n in comp]
-            self.output.insert(
-                "end", f"- Bileşen {i}: {comp} -> {names}\n"
+            self._show_table(
+                "Bağlı Bileşenler",
+                ("bileşen", "boyut", "düğümler", "isimler"),
+                LazyRows(range(len(comps)), row),
+                select=not small,
             )
-        self.output.see("end")
+
+        self._run_job(
+            "Bağlı bileşenler", job, done, "Bağlı bileşenler hesaplanırken hata"
+        )
 
     def show_centrality(self):
-        try:
-            results = top_k_degree_centrality(self.graph, 5)
-        except Exception as e:
-            messagebox.showerror("Hata", f"Centrality hesaplanırken hata:\n{e}")
-            return
+        metric = self.centrality_var.get()
+
+        def done(results):
+            self.output.insert("end", f"\n\n[{metric} Centrality - Top 5]\n")
+            for r in results:
+                self.output.insert(
+                    "end",
+                    f"- {r.name} (id={r.node_id}) "
+                    f"degree={r.degree} "
+                    f"centrality={r.centrality:.3f}\n",
+                )
+            self.output.see("end")
 
-        self.output.insert("end", "\n\n[Degree Centrality - Top 5]\n")
-        for r in results:
-            self.output.insert(
-                "end",
-                f"- {r.name} (id={r.node_id}) "
-                f"degree={r.degree} "
-                f"centrality={r.centrality:.3f}\n",
-            )
-        self.output.see("end")
+        self._run_job(
+            f"{metric} centrality",
+            lambda g, cancel: CENTRALITY_METRICS[metric](g, 5, cancel),
+            done,
+            "Centrality hesaplanırken hata",
+        )
 
     def show_coloring(self):
-        try:
-            color_map, table = welsh_powell_coloring(self.graph)
-        except Exception as e:
-            messagebox.showerror("Hata", f"Renkleme yapılırken hata:\n{e}")
-            return
-
-        self.output.insert("end", "\n\n[Welsh-Powell Renkleme]\n")
-        self.output.insert("end", "Color map (node_id -> color):\n")
-        for nid in sorted(color_map):
-            self.output.insert("end", f"{nid} -> {color_map[nid]}\n")
-
-        # Önce tüm düğümleri varsayılan renge döndür
-        for nid, item_id in self.node_items.items():
-            self.canvas.itemconfig(item_id, fill="#88c4ff")
-
-        # Pastel renk paleti
-        palette = [
-            "#ffd966",
-            "#9fc5f8",
-            "#b6d7a8",
-            "#d5a6bd",
-            "#f4cccc",
-            "#cfe2f3",
-        ]
+        self._run_job(
+            "Renkleme",
+            lambda g, cancel: sharded_coloring(g, cancel=cancel),
+            self._show_coloring_result,
+            "Renkleme yapılırken hata",
+        )
 
-        self.output.insert("end", "\nTablo:\n")
-        for r in table:
-            self.output.insert(
-                "end",
-                f"- {r.name} (id={r.node_id}) degree={r.degree} -> color {r.color}\n",
+    def _show_coloring_result(self, value):
+        color_map, table = value
+        small = len(table) <= TEXT_ROW_LIMIT
+        lines = ["\n\n[Welsh-Powell Renkleme]\n"]
+        if small:
+            lines.append("Color map (node_id -> color):\n")
+            lines.extend(f"{nid} -> {color_map[nid]}\n" for nid in sorted(color_map))
+            lines.append("\nTablo:\n")
+            lines.extend(
+                f"- {r.name} (id={r.node_id}) degree={r.degree} -> color {r.color}\n"
+                for r in table
             )
+        else:
+            class_sizes = {}
+            for c in color_map.values():
+                class_sizes[c] = class_sizes.get(c, 0) + 1
+            lines.append(
+                f"{len(color_map)} düğüm, {len(class_sizes)} renk; "
+                f"renk sınıfı boyutları: {dict(sorted(class_sizes.items()))}\n"
+                "Tablo sekmesinde.\n"
+            )
+        self._write_output(lines)
+        self._show_table(
+            "Welsh-Powell Renkleme",
+            ("id", "name", "degree", "color"),
+            LazyRows(table, lambda r: (r.node_id, r.name, r.degree, r.color)),
+            select=not small,
+        )
 
-            item_id = self.node_items.get(r.node_id)
-            if item_id:
-                color_index = (r.color - 1) % len(palette)
-                self.canvas.itemconfig(item_id, fill=palette[color_index])
-
-        self.output.see("end")
+        # Canvas: palet rengi başına tek etiket, düğüm başına çağrı yok
+        self.renderer.reset_node_styles()
+        n_colors = len(COLOR_PALETTE)
+        self.renderer.set_node_classes(
+            {nid: (c - 1) % n_colors for nid, c in color_map.items()},
+            {i: {"fill": fill} for i, fill in enumerate(COLOR_PALETTE)},
+        )
 
     # -------------------------------------------------
     # CSV İÇE / DIŞA AKTARMA
@@ -840,7 +987,11 @@ class GraphApp(tk.Tk):
         """CSV dosyasından graf yükle."""
         path = filedialog.askopenfilename(
             title="CSV Dosyası Seç",
-            filetypes=[("CSV Files", "*.csv"), ("Tüm Dosyalar", "*.*")]
+            filetypes=[
+                ("CSV Files", "*.csv"),
+                ("Gzip CSV Files", "*.csv.gz"),
+                ("Tüm Dosyalar", "*.*"),
+            ]
         )
         if not path:
             return
@@ -851,24 +1002,15 @@ class GraphApp(tk.Tk):
             messagebox.showerror("Hata", f"CSV yüklenirken hata oluştu:\n{e}", parent=self)
             return
 
+        # Eski graf üzerindeki iş ve önhesaplar artık anlamsız
+        self.jobs.cancel()
+        self._landmarks = None
+
         self.refresh_node_options()
         self.draw_graph()
 
         self.clear_output()
-        self.output.insert("end", f"[CSV Yükle] {path} dosyasından graf yüklendi.\n\nDüğümler:\n")
-        for nid in sorted(self.graph.nodes.keys()):
-            node = self.graph.nodes[nid]
-            self.output.insert(
-                "end",
-                f"- {nid}: {node.name} "
-                f"(activity={node.activity}, interaction={node.interaction}, degree={node.degree})\n",
-            )
-
-        self.output.insert("end", "\nKomşuluk listesi:\n")
-        adj = self.graph.adjacency_list()
-        for nid in sorted(adj):
-            self.output.insert("end", f"{nid}: {adj[nid]}\n")
-        self.output.see("end")
+        self._show_graph_summary(f"[CSV Yükle] {path} dosyasından graf yüklendi.")
 
     def save_csv(self):
         """Mevcut grafı CSV olarak kaydet."""
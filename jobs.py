@@ -0,0 +1,149 @@
+# jobs.py
+# Uzun süren algoritmaları arka planda çalıştırma ve iptal.
+#
+# Algoritmalar iptali işbirlikçi olarak destekler: döngülerinde ara ara
+# cancel.check(yapılan, toplam) çağırırlar; bu çağrı ilerlemeyi kaydeder ve
+# iptal istenmişse Cancelled fırlatır. cancel parametresi verilmezse
+# (None) algoritmalar eskisi gibi çalışır.
+#
+# JobRunner Tk'ye bağımlı değildir; yalnızca after(ms, func, *args) sunan
+# bir nesne (tk.Tk / widget) ister. İşler iş parçacığında yürür: saf Python
+# döngüler GIL'i kısa aralıklarla bırakır, arayüz akıcı kalır; gerçek
+# paralellik gereken yerlerde algoritmaların workers parametresi süreç
+# havuzu kullanır.
+from __future__ import annotations
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class Cancelled(Exception):
+    """İş CancelToken ile iptal edildi."""
+
+
+class CancelToken:
+    """İptal bayrağı + ilerleme sayacı (iş parçacıkları arasında paylaşılır)."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.done = 0
+        self.total = 0
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self, done: Optional[int] = None, total: Optional[int] = None) -> None:
+        """İlerlemeyi kaydeder; iptal istendiyse Cancelled fırlatır."""
+        if done is not None:
+            self.done = done
+        if total is not None:
+            self.total = total
+        if self._event.is_set():
+            raise Cancelled()
+
+    def fraction(self) -> Optional[float]:
+        """0..1 arası ilerleme; toplam bilinmiyorsa None."""
+        if self.total <= 0:
+            return None
+        return min(1.0, self.done / self.total)
+
+
+class Job:
+    """Kuyruktaki tek iş: fonksiyon, geri çağrılar, belirteç ve sonuç."""
+
+    def __init__(self, name: str, func: Callable[[CancelToken], Any],
+                 on_done: Callable[[Any], None],
+                 on_error: Optional[Callable[[BaseException], None]]):
+        self.name = name
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+        self.token = CancelToken()
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        # iş parçacığı bitince doldurulur: ("ok" | "cancelled" | "error", değer)
+        self.outcome: Optional[tuple] = None
+
+    def run(self) -> None:
+        try:
+            self.outcome = ("ok", self.func(self.token))
+        except Cancelled:
+            self.outcome = ("cancelled", None)
+        except BaseException as e:
+            # KeyboardInterrupt / SystemExit de hata sayılır; yoksa outcome
+            # None kalır ve yoklama döngüsü hiç bitmez
+            self.outcome = ("error", e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            self.elapsed = time.perf_counter() - self.started
+
+
+class JobRunner:
+    """
+    Tek işlik arka plan yürütücü. submit() işi daemon iş parçacığında
+    başlatır (çalışan bir iş varsa önce onu iptal eder); sonuç ana iş
+    parçacığında, after() yoklamasıyla on_done / on_error'a iletilir.
+    on_status(ad, geçen_süre, ilerleme, bitti_mi) her yoklamada çağrılır;
+    ilerleme 0..1 ya da None, bitti_mi False veya sonuç türüdür
+    ("ok" | "cancelled" | "error").
+    """
+
+    def __init__(self, root, on_status: Optional[Callable[..., None]] = None,
+                 poll_ms: int = 100):
+        self.root = root
+        self.on_status = on_status
+        self.poll_ms = poll_ms
+        self._job: Optional[Job] = None
+
+    @property
+    def busy(self) -> bool:
+        return self._job is not None
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[[CancelToken], Any],
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> CancelToken:
+        """func(token) arka planda çalışır; token iptal ve ilerleme içindir."""
+        self.cancel()
+        job = Job(name, func, on_done, on_error)
+        self._job = job
+        threading.Thread(target=job.run, daemon=True).start()
+        self.root.after(self.poll_ms, self._poll, job)
+        return job.token
+
+    def cancel(self) -> None:
+        """Çalışan işi iptal eder; sonucu (gelirse) yok sayılır."""
+        job = self._job
+        if job is None:
+            return
+        job.token.cancel()
+        self._job = None
+        if self.on_status is not None:
+            self.on_status(job.name, time.perf_counter() - job.started, None, "cancelled")
+
+    def _poll(self, job: Job) -> None:
+        if job is not self._job:
+            return  # iptal edildi / yerini yenisi aldı
+        if job.outcome is None:
+            if self.on_status is not None:
+                elapsed = time.perf_counter() - job.started
+                self.on_status(job.name, elapsed, job.token.fraction(), False)
+            self.root.after(self.poll_ms, self._poll, job)
+            return
+
+        self._job = None
+        kind, value = job.outcome
+        if self.on_status is not None:
+            self.on_status(job.name, job.elapsed, 1.0 if kind == "ok" else None, kind)
+        if kind == "ok":
+            job.on_done(value)
+        elif kind == "error" and job.on_error is not None:
+            job.on_error(value)
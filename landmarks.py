@@ -0,0 +1,139 @@
+# landmarks.py
+# ALT (A*, Landmarks, Triangle inequality) önhesaplaması.
+#
+# Seçilen her landmark L için d(L, v) mesafeleri saklanır. Yönsüz grafta
+# üçgen eşitsizliğinden  d(u, t) >= |d(L, t) - d(L, u)|  olduğundan, bu
+# değerlerin maksimumu A* için kabul edilebilir (admissible) ve tutarlı
+# bir alt sınırdır.
+#
+# Tablolar yalnızca kuruldukları grafın içeriği (id'ler, kenarlar ve
+# ağırlıklar) için geçerlidir; başka ağırlıklarla kullanılan bir alt sınır
+# kabul edilebilir olmayabilir. Bu yüzden tablolar grafın CSR parmak iziyle
+# (bkz. CSRGraph.fingerprint) etiketlenir ve kullanılmadan önce denetlenir.
+from __future__ import annotations
+import math
+import struct
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from graph import Graph
+from algoritma import dijkstra
+
+MAGIC = b"GRAFALT2"
+_HEADER = struct.Struct("<qq16s")  # n, k, graf parmak izi
+
+
+class LandmarkIndex:
+    """k landmark için mesafe tabloları (tables[j][i] = d(landmarks[j], ids[i]))."""
+
+    def __init__(
+        self,
+        ids: List[int],
+        landmarks: List[int],
+        tables: List[array],
+        fingerprint: str,
+    ):
+        self.ids = ids
+        self.index: Dict[int, int] = {nid: i for i, nid in enumerate(ids)}
+        self.landmarks = landmarks
+        self.tables = tables
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, g: Graph, k: int = 8) -> "LandmarkIndex":
+        """
+        Landmark'ları "en uzak nokta" yöntemiyle seçer: her yeni landmark,
+        seçilmiş olanlara en uzak düğümdür. Ulaşılamayan düğüm kalırsa
+        (ayrık bileşen) önce oradan landmark alınır.
+        """
+        ids = list(g.nodes.keys())
+        fp = g.to_csr().fingerprint()
+        if not ids:
+            return cls([], [], [], fp)
+
+        landmarks: List[int] = []
+        tables: List[array] = []
+        # her düğümün seçili landmark'lara en küçük uzaklığı
+        closest = [math.inf] * len(ids)
+        # ilk landmark: en yüksek dereceli düğüm
+        nxt = max(ids, key=lambda nid: g.nodes[nid].degree)
+
+        for _ in range(min(k, len(ids))):
+            dist, _prev = dijkstra(g, nxt)
+            landmarks.append(nxt)
+            tables.append(array("d", (dist[nid] for nid in ids)))
+            for i, nid in enumerate(ids):
+                if dist[nid] < closest[i]:
+                    closest[i] = dist[nid]
+
+            candidates = [i for i, c in enumerate(closest) if c > 0]
+            if not candidates:
+                break
+            nxt = ids[max(candidates, key=closest.__getitem__)]
+
+        return cls(ids, landmarks, tables, fp)
+
+    def is_current(self, g: Graph) -> bool:
+        """Tablolar bu grafın şu anki içeriği (kenarlar + ağırlıklar) için mi?"""
+        return len(self.ids) == len(g.nodes) and self.fingerprint == g.to_csr().fingerprint()
+
+    def lower_bound(self, u: int, t: int) -> float:
+        """d(u, t) için üçgen eşitsizliği alt sınırı."""
+        i = self.index.get(u)
+        j = self.index.get(t)
+        if i is None or j is None:
+            return 0.0
+
+        best = 0.0
+        for table in self.tables:
+            du = table[i]
+            dt = table[j]
+            if du == math.inf or dt == math.inf:
+                if du != dt:
+                    # biri landmark'ın bileşeninde, diğeri değil: yol yok
+                    return math.inf
+                continue
+            diff = dt - du if dt > du else du - dt
+            if diff > best:
+                best = diff
+        return best
+
+    def heuristic(self, target: int) -> Callable[[int], float]:
+        """algoritma.AStar için h(node_id) fonksiyonu üretir."""
+        return lambda node_id: self.lower_bound(node_id, target)
+
+    # ---------- Kalıcı saklama ----------
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER.pack(len(self.ids), len(self.landmarks),
+                                 bytes.fromhex(self.fingerprint)))
+            f.write(array("q", self.ids).tobytes())
+            f.write(array("q", self.landmarks).tobytes())
+            for table in self.tables:
+                f.write(table.tobytes())
+
+    @classmethod
+    def load(cls, path: str, g: Optional[Graph] = None) -> "LandmarkIndex":
+        """
+        Kaydedilmiş tabloları okur. g verilirse tabloların bu graf için
+        kurulduğu denetlenir; değilse ValueError.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Geçersiz landmark dosyası: {path}")
+            n, k, digest = _HEADER.unpack(f.read(_HEADER.size))
+
+            def read(typecode: str, count: int) -> array:
+                a = array(typecode)
+                a.frombytes(f.read(count * a.itemsize))
+                return a
+
+            ids = read("q", n).tolist()
+            landmarks = read("q", k).tolist()
+            tables = [read("d", n) for _ in range(k)]
+        index = cls(ids, landmarks, tables, digest.hex())
+        if g is not None and not index.is_current(g):
+            raise ValueError(f"Landmark dosyası bu graf için değil: {path}")
+        return index
@@ -0,0 +1,388 @@
+# layout.py
+# Kuvvet yönlendirmeli (Fruchterman-Reingold) yerleşim.
+#
+# Düğümler birbirini iter (k^2 / d), kenarlar uçlarını çeker (d^2 / k).
+# İtme kuvveti Barnes-Hut dörtlü ağacıyla yaklaşıklanır: uzaktaki bir hücre
+# (genişlik / uzaklık < theta) tek bir kütle merkezi gibi davranır; böylece
+# bir iterasyon O(n log n) olur. numpy varsa ağaç kurulumu ve gezinmesi
+# vektöreldir (Morton kodu ile sıralama, seviye seviye hücre/düğüm çiftleri).
+# numpy yoksa itme kuvveti tam (O(n^2)) hesaplanır; bu yüzden yalnızca
+# küçük graflarda kullanılır.
+#
+# LayoutWorker hesabı arka plan iş parçacığında yürütür ve ara konumları bir
+# kuyruğa yazar; LayoutCache sonuçları graf parmak izine göre saklar.
+from __future__ import annotations
+import math
+import os
+import queue
+import random
+import threading
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from csr import CSRGraph
+from graph import Graph
+
+try:
+    import numpy as np
+except ImportError:  # numpy isteğe bağlı; yoksa saf Python yolu kullanılır
+    np = None
+
+Positions = Dict[int, Tuple[float, float]]
+
+# Kenar uzunluğu hedefi (dünya birimi; renderer'da düğüm yarıçapı 20)
+IDEAL_EDGE_LENGTH = 100.0
+# numpy yokken tam O(n^2) itme için üst sınır
+MAX_PURE_PYTHON_NODES = 2000
+# Morton kodunda eksen başına bit (ağacın en fazla derinliği)
+_DEPTH = 16
+
+
+def layout_available(n: int) -> bool:
+    """n düğüm için makul sürede yerleşim hesaplanabilir mi."""
+    return np is not None or n <= MAX_PURE_PYTHON_NODES
+
+
+def fingerprint(g: Graph) -> str:
+    """Grafın yapısal parmak izi (düğüm id'leri + kenarlar)."""
+    return _csr_fingerprint(g.to_csr())
+
+
+def _csr_fingerprint(csr: CSRGraph) -> str:
+    # yerleşim ağırlıkları kullanmaz; anahtar yalnızca yapıya bağlı
+    return csr.fingerprint(weights=False)
+
+
+# ================== Barnes-Hut (numpy) ==================
+
+def _part1by1(x):
+    """16 bitlik tamsayının bitlerini aralarına 0 koyarak yayar (Morton)."""
+    x = x & 0xFFFF
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    return x
+
+
+def _build_quadtree(pos):
+    """
+    Dörtlü ağaç, seviye başına diziler olarak:
+      starts[l][c] : c hücresinin Morton sıralı düğümlerdeki başlangıcı
+      count[l][c]  : hücredeki düğüm sayısı (kütle)
+      com[l][c]    : kütle merkezi
+      child_lo/hi  : c'nin çocuklarının (l+1 seviyesinde) indeks aralığı
+    Tüm hücreler tek düğümlü olunca (ya da en derin seviyede) durur.
+    """
+    n = len(pos)
+    lo = pos.min(axis=0)
+    span = float((pos.max(axis=0) - lo).max()) or 1.0
+    cells = ((pos - lo) / span * ((1 << _DEPTH) - 1)).astype(np.int64)
+    code = _part1by1(cells[:, 0]) | (_part1by1(cells[:, 1]) << 1)
+    order = np.argsort(code, kind="stable")
+    code = code[order]
+    sorted_pos = pos[order]
+
+    levels = []
+    for level in range(_DEPTH + 1):
+        prefix = code >> (2 * (_DEPTH - level))
+        starts = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+        count = np.diff(np.r_[starts, n])
+        com = np.add.reduceat(sorted_pos, starts, axis=0) / count[:, None]
+        levels.append((starts, count, com))
+        if count.max() == 1:
+            break
+
+    child_ranges = []
+    for (starts, count, _), (next_starts, _, _) in zip(levels, levels[1:]):
+        child_lo = np.searchsorted(next_starts, starts)
+        child_hi = np.searchsorted(next_starts, starts + count)
+        child_ranges.append((child_lo, child_hi))
+    return order, sorted_pos, span, levels, child_ranges
+
+
+def _repulsion_numpy(pos, k2: float, theta: float):
+    """Barnes-Hut ile itme kuvvetleri (n x 2)."""
+    n = len(pos)
+    order, sorted_pos, span, levels, child_ranges = _build_quadtree(pos)
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+    last = len(levels) - 1
+
+    # (düğüm, hücre) çiftleri; kök herkes için tek hücre
+    pi = np.arange(n)
+    pc = np.zeros(n, dtype=np.int64)
+    theta2 = theta * theta
+    for level, (_, count, com) in enumerate(levels):
+        if not len(pi):
+            break
+        cnt = count[pc]
+        d = sorted_pos[pi] - com[pc]
+        dist2 = (d * d).sum(axis=1)
+        width = span / (1 << level)
+        accept = (cnt == 1) | (width * width < theta2 * dist2)
+        if level == last:
+            accept[:] = True
+
+        use = accept & (dist2 > 0)
+        scale = k2 * cnt[use] / dist2[use]
+        fx += np.bincount(pi[use], weights=d[use, 0] * scale, minlength=n)
+        fy += np.bincount(pi[use], weights=d[use, 1] * scale, minlength=n)
+
+        expand = ~accept
+        if not expand.any():
+            break
+        child_lo, child_hi = child_ranges[level]
+        lo = child_lo[pc[expand]]
+        reps = child_hi[pc[expand]] - lo
+        pi = np.repeat(pi[expand], reps)
+        # her çift için lo, lo+1, ..., hi-1
+        first = np.repeat(np.cumsum(reps) - reps, reps)
+        pc = np.repeat(lo, reps) + (np.arange(len(pi)) - first)
+
+    out = np.empty((n, 2))
+    out[order, 0] = fx
+    out[order, 1] = fy
+    return out
+
+
+def _layout_numpy(csr: CSRGraph, pos, iterations: int, theta: float,
+                  gravity: float, temperature: float, emit, cancel):
+    n = len(csr)
+    k = IDEAL_EDGE_LENGTH
+    src = np.repeat(np.arange(n), np.diff(np.asarray(csr.offsets, dtype=np.int64)))
+    tgt = np.asarray(csr.targets, dtype=np.int64)
+
+    for it in range(iterations):
+        if cancel is not None and cancel.is_set():
+            return pos
+        disp = _repulsion_numpy(pos, k * k, theta)
+        if len(src):
+            delta = pos[src] - pos[tgt]
+            dist = np.sqrt((delta * delta).sum(axis=1))
+            pull = delta * (dist / k)[:, None]
+            disp[:, 0] -= np.bincount(src, weights=pull[:, 0], minlength=n)
+            disp[:, 1] -= np.bincount(src, weights=pull[:, 1], minlength=n)
+        disp -= gravity * (pos - pos.mean(axis=0))
+
+        length = np.sqrt((disp * disp).sum(axis=1))
+        length[length == 0] = 1.0
+        step = np.minimum(length, temperature) / length
+        pos = pos + disp * step[:, None]
+        temperature *= 1.0 - 1.0 / (iterations - it + 1)
+        emit(it, pos)
+    return pos
+
+
+# ================== Saf Python (küçük graflar) ==================
+
+def _layout_python(csr: CSRGraph, pos: List[List[float]], iterations: int,
+                   gravity: float, temperature: float, emit, cancel):
+    n = len(csr)
+    k = IDEAL_EDGE_LENGTH
+    k2 = k * k
+    offsets = csr.offsets
+    targets = csr.targets
+
+    for it in range(iterations):
+        if cancel is not None and cancel.is_set():
+            return pos
+        disp = [[0.0, 0.0] for _ in range(n)]
+        for i in range(n):
+            xi, yi = pos[i]
+            for j in range(i + 1, n):
+                dx = xi - pos[j][0]
+                dy = yi - pos[j][1]
+                d2 = dx * dx + dy * dy
+                if d2 == 0:
+                    continue
+                f = k2 / d2
+                disp[i][0] += dx * f
+                disp[i][1] += dy * f
+                disp[j][0] -= dx * f
+                disp[j][1] -= dy * f
+            for e in range(offsets[i], offsets[i + 1]):
+                j = targets[e]
+                dx = xi - pos[j][0]
+                dy = yi - pos[j][1]
+                f = math.sqrt(dx * dx + dy * dy) / k
+                disp[i][0] -= dx * f
+                disp[i][1] -= dy * f
+
+        mx = sum(p[0] for p in pos) / n
+        my = sum(p[1] for p in pos) / n
+        for i in range(n):
+            dx = disp[i][0] - gravity * (pos[i][0] - mx)
+            dy = disp[i][1] - gravity * (pos[i][1] - my)
+            length = math.sqrt(dx * dx + dy * dy) or 1.0
+            step = min(length, temperature) / length
+            pos[i][0] += dx * step
+            pos[i][1] += dy * step
+        temperature *= 1.0 - 1.0 / (iterations - it + 1)
+        emit(it, pos)
+    return pos
+
+
+# ================== Genel arayüz ==================
+
+def force_layout(
+    g: Graph,
+    initial: Optional[Positions] = None,
+    iterations: int = 100,
+    theta: float = 0.7,
+    gravity: float = 0.01,
+    temperature: Optional[float] = None,
+    seed: Optional[int] = 0,
+    callback: Optional[Callable[[int, Positions], None]] = None,
+    every: int = 10,
+    cancel: Optional[threading.Event] = None,
+) -> Positions:
+    """
+    Kuvvet yönlendirmeli yerleşim; node_id -> (x, y) döner.
+    initial    : başlangıç konumları (verilmeyen düğümler rastgele yerleşir)
+    theta      : Barnes-Hut eşiği (küçük: daha doğru, yavaş); 0.7'yi aşmamalı
+    temperature: ilk adımdaki en büyük yer değiştirme; varsayılan
+                 grafın boyuna göredir. Küçük bir düzenlemeden sonra önceki
+                 yerleşimden devam ederken IDEAL_EDGE_LENGTH civarı yeterli.
+    callback   : her `every` iterasyonda (iterasyon, ara konumlar) ile çağrılır
+    cancel     : set edilirse hesap o anki konumlarla sonlanır
+    """
+    return _force_layout_csr(
+        g.to_csr(), initial, iterations, theta, gravity, temperature,
+        seed, callback, every, cancel,
+    )
+
+
+def _force_layout_csr(csr: CSRGraph, initial, iterations, theta, gravity,
+                      temperature, seed, callback, every, cancel) -> Positions:
+    ids = list(csr.ids)
+    n = len(ids)
+    if n == 0:
+        return {}
+    if not layout_available(n):
+        raise ValueError("numpy olmadan büyük graf yerleşimi desteklenmiyor")
+    if temperature is None:
+        temperature = IDEAL_EDGE_LENGTH * (math.sqrt(n) / 10.0 + 1.0)
+
+    rnd = random.Random(seed)
+    spread = IDEAL_EDGE_LENGTH * math.sqrt(n)
+    start = []
+    for nid in ids:
+        x, y = initial[nid] if initial and nid in initial else (
+            rnd.uniform(0, spread), rnd.uniform(0, spread))
+        # çakışan noktalar birbirini itemesin diye küçük sarsıntı
+        start.append([x + rnd.uniform(-0.5, 0.5), y + rnd.uniform(-0.5, 0.5)])
+
+    def to_positions(pos) -> Positions:
+        return {nid: (float(p[0]), float(p[1])) for nid, p in zip(ids, pos)}
+
+    def emit(it: int, pos) -> None:
+        if callback is not None and (it + 1) % every == 0:
+            callback(it + 1, to_positions(pos))
+
+    if np is not None:
+        pos = _layout_numpy(csr, np.array(start), iterations, theta, gravity,
+                            temperature, emit, cancel)
+    else:
+        pos = _layout_python(csr, start, iterations, gravity, temperature,
+                             emit, cancel)
+    return to_positions(pos)
+
+
+class LayoutCache:
+    """
+    Parmak izi -> yerleşim önbelleği. directory verilirse yerleşimler diske
+    de yazılır; aynı graf tekrar açıldığında hesap yapılmaz.
+    Dosya: ids (int64[n]) + xs (float64[n]) + ys (float64[n]).
+    Disk okunamaz/yazılamazsa (salt okunur dizin vb.) yalnızca bellek
+    önbelleği kullanılır.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._memory: Dict[str, Positions] = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.layout")
+
+    def get(self, key: str) -> Optional[Positions]:
+        if key in self._memory:
+            return self._memory[key]
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        n = len(raw) // 24
+        ids = array("q")
+        ids.frombytes(raw[:8 * n])
+        coords = array("d")
+        coords.frombytes(raw[8 * n:])
+        positions = {nid: (coords[i], coords[n + i]) for i, nid in enumerate(ids)}
+        self._memory[key] = positions
+        return positions
+
+    def put(self, key: str, positions: Positions) -> None:
+        self._memory[key] = positions
+        if self.directory is None:
+            return
+        ids = array("q", positions.keys())
+        xs = array("d", (p[0] for p in positions.values()))
+        ys = array("d", (p[1] for p in positions.values()))
+        tmp = self._path(key) + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(ids.tobytes())
+                f.write(xs.tobytes())
+                f.write(ys.tobytes())
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+class LayoutWorker(threading.Thread):
+    """
+    force_layout'u arka planda çalıştırır. Graf, kurucuda (çağıran iş
+    parçacığında) CSR olarak dondurulur; sonradan yapılan düzenlemeler
+    hesabı etkilemez. Ara ve son konumlar updates kuyruğuna
+    (iterasyon, konumlar, bitti_mi) olarak yazılır; GUI bunu after() ile
+    yoklar. Bitince son konumlar kuyruğa, ardından önbelleğe konur.
+    """
+
+    def __init__(self, g: Graph, initial: Optional[Positions] = None,
+                 cache: Optional[LayoutCache] = None, iterations: int = 100,
+                 temperature: Optional[float] = None, every: int = 5):
+        super().__init__(daemon=True)
+        self.csr = g.to_csr()
+        self.key = _csr_fingerprint(self.csr)
+        self.initial = dict(initial) if initial else None
+        self.cache = cache
+        self.iterations = iterations
+        self.temperature = temperature
+        self.every = every
+        self.updates: "queue.Queue[Tuple[int, Positions, bool]]" = queue.Queue()
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def run(self) -> None:
+        def push(it: int, positions: Positions) -> None:
+            self.updates.put((it, positions, False))
+
+        positions = _force_layout_csr(
+            self.csr, self.initial, self.iterations, 0.7, 0.01,
+            self.temperature, 0, push, self.every, self._cancel,
+        )
+        if self._cancel.is_set():
+            return
+        # önce son güncelleme: önbellek yazımı ne olursa olsun GUI bitişi görür
+        self.updates.put((self.iterations, positions, True))
+        if self.cache is not None:
+            self.cache.put(self.key, positions)
@@ -1,17 +1,17 @@
 # main.py
-# Bu dosya şu an kullanılmıyor.
-# Asıl giriş noktası: gui.py (masaüstü arayüz)
+# gui.py'nin açılış grafı (load_graph) ve küçük bir konsol örneği.
+# Giriş noktaları: gui.py (masaüstü arayüz), cli.py (ekransız toplu analiz)
 # main.py
 
 import os
 
-from graph import Graph,Node,Edge
+from graph import Graph,Node
 from dinamik_agirlik import calculate_weight
 from dijkstra import dijkstra_shortest_path
 from astar import astar_shortest_path
 from centrality import top_k_degree_centrality
 from components import connected_components
-from welsh_powell import welsh_powell_coloring
+from sharding import sharded_coloring
 
 CSV_PATH ="test_graf.csv"
 
@@ -29,14 +29,13 @@ def build_default_graph() -> Graph:
     g.add_node(Node(4, "Node4", 0.9, 15))
     g.add_node(Node(5, "Node5", 0.3, 3))
 
-    def add_edge(a, b):
-        g.add_undirected_edge(a, b, calculate_weight(g.nodes[a], g.nodes[b]))
-
-    add_edge(1, 2)
-    add_edge(1, 3)
-    add_edge(2, 3)
-    add_edge(3, 4)
-    add_edge(4, 5)
+    # Ağırlıklar calculate_weight ile türetilir ve degree değiştikçe güncellenir
+    g.weight_func = calculate_weight
+    g.add_undirected_edge(1, 2)
+    g.add_undirected_edge(1, 3)
+    g.add_undirected_edge(2, 3)
+    g.add_undirected_edge(3, 4)
+    g.add_undirected_edge(4, 5)
 
     # Oluşturulan grafı CSV'ye yaz
     g.to_csv(CSV_PATH)
@@ -62,44 +61,13 @@ def load_graph():
         )
         g.add_node(node)
 
-       # --- Kenarlar: daha karışık bir yapı ---
+    # --- Kenarlar: daha karışık bir yapı ---
     # Her düğüm; +1, +2 ve +5 komşularına bağlansın (daire etrafında dönen bir yapı)
-    added = set()  # { (küçük_id, büyük_id) } şeklinde tutulacak
-
-    def add_undirected_edge(a, b, w=1.0):
-        """a <-> b kenarını, tekrar etmeyecek şekilde ekler."""
-        key = tuple(sorted((a, b)))
-        if key in added or a == b:
-            return
-        added.add(key)
-
-        # adjacency list yoksa oluştur
-        if a not in g.adj:
-            g.adj[a] = []
-        if b not in g.adj:
-            g.adj[b] = []
-
-        e1 = Edge(from_id=a, to_id=b, weight=w)
-        e2 = Edge(from_id=b, to_id=a, weight=w)
-        g.adj[a].append(e1)
-        g.adj[b].append(e2)
-
-    # 1..30 düğümler için bağlantıları kur
+    # Tekrarlayan kenarları ve degree güncellemesini Graph kendisi yönetir.
     for i in range(1, 31):
         for offset in (1, 2, 5):  # +1, +2, +5 komşuları
             j = ((i + offset - 1) % 30) + 1  # 30'dan sonra tekrar başa dön
-            add_undirected_edge(i, j, w=1.0)
-
-
-    # Degree'ler backend'de de kabaca doğru olsun
-    for nid, node in g.nodes.items():
-        try:
-            node.degree = len(g.neighbors(nid))
-        except Exception:
-            if nid in g.adj:
-                node.degree = len(g.adj[nid])
-            else:
-                node.degree = 0
+            g.add_undirected_edge(i, j, 1.0)
 
     return g
 
@@ -127,7 +95,7 @@ if __name__ == "__main__":
     for i, comp in enumerate(comps, start=1):
         names = [g.nodes[n].name for n in comp]
         print(f"- Component {i}: {comp} -> {names}")
-    color_map, table = welsh_powell_coloring(g)
+    color_map, table = sharded_coloring(g)
     print("\nWelsh-Powell Coloring:")
     # node_id:color şeklinde kısa çıktı
     print("Color map:", {nid: color_map[nid] for nid in sorted(color_map)})
@@ -0,0 +1,121 @@
+# parallel.py
+# Graf CSR dizilerini işçi süreçlerle paylaşma yardımcıları.
+#
+# Graph nesnesini her işe pickle'lamak yerine ids/offsets/targets/weights
+# dizileri bir kez multiprocessing.shared_memory bloklarına kopyalanır;
+# işçiler başlatılırken bu bloklara bağlanıp CSRGraph görünümü kurar.
+from __future__ import annotations
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from csr import CSRGraph
+
+# (blok adı, typecode, eleman sayısı)
+_Block = Tuple[str, str, int]
+
+# İşçi süreçte paylaşılan graf ve blok referansları
+_WORKER_CSR: Optional[CSRGraph] = None
+_WORKER_BLOCKS: List[shared_memory.SharedMemory] = []
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """None -> CPU sayısı; en az 1."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, workers)
+
+
+class SharedCSR:
+    """CSR dizilerinin paylaşımlı bellek kopyası (with bloğu ile kullanılır)."""
+
+    def __init__(self, csr: CSRGraph):
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.spec: Dict[str, _Block] = {
+            "ids": self._share(csr.ids, "q"),
+            "offsets": self._share(csr.offsets, "q"),
+            "targets": self._share(csr.targets, "q"),
+            "weights": self._share(csr.weights, "d"),
+        }
+
+    def _share(self, values, typecode: str) -> _Block:
+        data = array(typecode, values)
+        # boş dizi için de geçerli bir blok açılabilsin diye en az 1 bayt
+        shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+        shm.buf[:len(data) * data.itemsize] = data.tobytes()
+        self._blocks.append(shm)
+        return shm.name, typecode, len(data)
+
+    def close(self) -> None:
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedCSR":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_block(block: _Block):
+    """Paylaşımlı bloğa bağlanıp typecode'a göre memoryview döner (işçi tarafı)."""
+    name, typecode, count = block
+    # İşçiler ana sürecin resource_tracker'ını paylaşır; bloğu yalnızca
+    # sahibi (ana süreç) unlink eder
+    shm = shared_memory.SharedMemory(name=name)
+    _WORKER_BLOCKS.append(shm)
+    size = count * array(typecode).itemsize
+    return shm.buf[:size].cast(typecode)
+
+
+def init_worker(spec: Dict[str, _Block]) -> None:
+    """ProcessPoolExecutor initializer'ı: paylaşılan CSR görünümünü kurar."""
+    global _WORKER_CSR
+    _WORKER_CSR = CSRGraph(
+        attach_block(spec["ids"]),
+        attach_block(spec["offsets"]),
+        attach_block(spec["targets"]),
+        attach_block(spec["weights"]),
+    )
+
+
+def worker_csr() -> CSRGraph:
+    """İşçi süreçteki paylaşılan CSR."""
+    assert _WORKER_CSR is not None, "init_worker çağrılmamış"
+    return _WORKER_CSR
+
+
+def csr_pool(
+    csr: CSRGraph,
+    workers: int,
+    extra_init: Optional[Callable[..., None]] = None,
+    extra_args: tuple = (),
+) -> Tuple[SharedCSR, ProcessPoolExecutor]:
+    """CSR'ı paylaşıma açar ve ona bağlı işçilerle bir havuz başlatır."""
+    shared = SharedCSR(csr)
+    try:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_with_extra,
+            initargs=(shared.spec, extra_init, extra_args),
+        )
+    except BaseException:
+        # havuz kurulamadıysa paylaşılan bloklar sızmasın
+        shared.close()
+        raise
+    return shared, pool
+
+
+def _init_with_extra(spec, extra_init, extra_args) -> None:
+    init_worker(spec)
+    if extra_init is not None:
+        extra_init(*extra_args)
+
+
+def chunked(n: int, size: int) -> List[range]:
+    """0..n-1 aralığını size'lık parçalara böler."""
+    return [range(i, min(i + size, n)) for i in range(0, n, size)]
@@ -0,0 +1,470 @@
+# renderer.py
+# Canvas için kalıcı (retained-mode) graf çizici.
+#
+# draw_graph her değişiklikte her şeyi silip yeniden çizmek yerine çizili
+# durumu hatırlar: graf değişince yalnızca eklenen/silinen düğüm ve kenarların
+# canvas öğeleri oluşturulur/silinir. Yalnızca görünür alandaki (viewport)
+# öğeler çizilir; kaydırma (pan) ve yakınlaştırma (zoom) canvas.move /
+# canvas.scale ile tek çağrıda yapılır, ardından görünür küme güncellenir.
+# Uzaklaştırınca yazılar gizlenir ve kenarlar incelir (level of detail).
+# Toplu boyamada (renklendirme) her stil sınıfı bir canvas etiketidir; boyama
+# düğüm başına değil sınıf başına birkaç Tk çağrısıdır.
+from __future__ import annotations
+import math
+import tkinter as tk
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from graph import Graph
+
+EdgeKey = Tuple[int, int]
+
+NODE_RADIUS = 20
+NODE_FILL = "#88c4ff"
+EDGE_FILL = "gray"
+EDGE_WIDTH = 2
+GRID_SPACING = (120, 90)
+CELL_SIZE = 240          # uzamsal ızgara hücresi (dünya birimi)
+LABEL_MIN_SCALE = 0.5    # bu ölçeğin altında düğüm yazıları gizlenir
+THIN_EDGE_SCALE = 0.5    # bu ölçeğin altında kenarlar 1 piksel çizilir
+MIN_SCALE, MAX_SCALE = 0.01, 5.0
+
+
+def edge_key(a: int, b: int) -> EdgeKey:
+    return (a, b) if a < b else (b, a)
+
+
+class GraphRenderer:
+    """
+    positions: node_id -> (x, y) dünya koordinatları (GraphApp.node_positions
+    ile aynı sözlük). Ekran = dünya * scale + (tx, ty).
+    """
+
+    def __init__(self, canvas: tk.Canvas, positions: Dict[int, Tuple[float, float]]):
+        self.canvas = canvas
+        self.positions = positions
+        self.graph: Optional[Graph] = None
+        self.on_node_click: Optional[Callable[[int], None]] = None
+
+        self.scale = 1.0
+        self.tx = 0.0
+        self.ty = 0.0
+
+        # Model: grafın bilinen hali
+        self._version: Optional[int] = None
+        self._incident: Dict[int, Set[EdgeKey]] = {}
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._next_slot = 0
+        self._columns = 6
+
+        # Çizili öğeler (yalnızca görünürler)
+        self._node_draw: Dict[int, Tuple[int, int]] = {}   # nid -> (oval, yazı)
+        self._edge_draw: Dict[EdgeKey, int] = {}
+        self._item_node: Dict[int, int] = {}               # canvas öğesi -> nid
+
+        # Görünüm ayarları (renklendirme, vurgu, seçim)
+        self.node_defaults = {"fill": NODE_FILL, "width": 2}
+        self.node_style: Dict[int, dict] = {}
+        # Sınıf bazlı stil: nid -> sınıf, sınıf -> (canvas etiketi, stil)
+        self.node_class: Dict[int, Hashable] = {}
+        self._class_styles: Dict[Hashable, Tuple[str, dict]] = {}
+        self.edge_style: Dict[EdgeKey, dict] = {}
+        self._labels_visible = True
+        self._edge_width = EDGE_WIDTH
+
+        self._drag_from: Optional[Tuple[int, int]] = None
+        self._refresh_pending = False
+
+        canvas.bind("<ButtonPress-1>", self._on_press)
+        canvas.bind("<B1-Motion>", self._on_drag)
+        canvas.bind("<ButtonRelease-1>", self._on_release)
+        canvas.bind("<MouseWheel>", self._on_wheel)
+        canvas.bind("<Button-4>", lambda e: self.zoom(1.15, e.x, e.y))
+        canvas.bind("<Button-5>", lambda e: self.zoom(1 / 1.15, e.x, e.y))
+        canvas.bind("<Configure>", lambda e: self.schedule_refresh())
+
+    # ---------- Model senkronizasyonu ----------
+
+    def set_graph(self, graph: Optional[Graph]) -> None:
+        """Yeni bir graf: her şey sıfırlanır, düğümler yerleştirilip sığdırılır."""
+        self.canvas.delete("all")
+        self._node_draw.clear()
+        self._edge_draw.clear()
+        self._item_node.clear()
+        self.positions.clear()
+        self._incident.clear()
+        self._cells.clear()
+        self.node_style.clear()
+        self.node_class.clear()
+        self._class_styles.clear()
+        self.edge_style.clear()
+        self.node_defaults = {"fill": NODE_FILL, "width": 2}
+        self._next_slot = 0
+        self._version = None
+        self.graph = graph
+        if graph is not None:
+            self._columns = max(6, math.ceil(math.sqrt(len(graph.nodes))))
+        self.sync()
+        self.fit_view()
+
+    def sync(self) -> None:
+        """Grafla çizili modeli karşılaştırıp yalnızca farkları uygular."""
+        g = self.graph
+        if g is None:
+            return
+        if self._version == g.version:
+            return
+        self._version = g.version
+
+        for nid in [nid for nid in self.positions if nid not in g.nodes]:
+            self._forget_node(nid)
+        for nid in g.nodes:
+            if nid not in self.positions:
+                self._place_node(nid, self._grid_position(self._next_slot))
+                self._next_slot += 1
+
+        current: Set[EdgeKey] = set()
+        for a in g.nodes:
+            for b in g.neighbors(a):
+                if a < b:
+                    current.add((a, b))
+        known: Set[EdgeKey] = set()
+        for keys in self._incident.values():
+            known.update(keys)
+
+        for key in known - current:
+            for nid in key:
+                if nid in self._incident:
+                    self._incident[nid].discard(key)
+            self.edge_style.pop(key, None)
+            item = self._edge_draw.pop(key, None)
+            if item is not None:
+                self.canvas.delete(item)
+        for key in current - known:
+            self._incident[key[0]].add(key)
+            self._incident[key[1]].add(key)
+
+        self.refresh_view()
+
+    def _grid_position(self, slot: int) -> Tuple[float, float]:
+        sx, sy = GRID_SPACING
+        row, col = divmod(slot, self._columns)
+        return 80 + col * sx, 80 + row * sy
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // CELL_SIZE), int(y // CELL_SIZE)
+
+    def _place_node(self, nid: int, pos: Tuple[float, float]) -> None:
+        self.positions[nid] = pos
+        self._incident.setdefault(nid, set())
+        self._cells.setdefault(self._cell(*pos), set()).add(nid)
+
+    def _forget_node(self, nid: int) -> None:
+        pos = self.positions.pop(nid)
+        self._cells.get(self._cell(*pos), set()).discard(nid)
+        for key in self._incident.pop(nid, set()):
+            other = key[1] if key[0] == nid else key[0]
+            if other in self._incident:
+                self._incident[other].discard(key)
+            self.edge_style.pop(key, None)
+            item = self._edge_draw.pop(key, None)
+            if item is not None:
+                self.canvas.delete(item)
+        self.node_style.pop(nid, None)
+        self._delete_node_items(nid)
+
+    def update_positions(self, moved: Dict[int, Tuple[float, float]]) -> None:
+        """Düğümleri yeni dünya koordinatlarına taşır (yerleşim akışı için)."""
+        touched: Set[EdgeKey] = set()
+        for nid, pos in moved.items():
+            old = self.positions.get(nid)
+            if old is None:
+                continue
+            old_cell, new_cell = self._cell(*old), self._cell(*pos)
+            if old_cell != new_cell:
+                self._cells[old_cell].discard(nid)
+                self._cells.setdefault(new_cell, set()).add(nid)
+            self.positions[nid] = pos
+            items = self._node_draw.get(nid)
+            if items is not None:
+                x, y = self.to_screen(*pos)
+                r = NODE_RADIUS * self.scale
+                self.canvas.coords(items[0], x - r, y - r, x + r, y + r)
+                self.canvas.coords(items[1], x, y)
+                touched.update(self._incident[nid])
+        for key in touched:
+            item = self._edge_draw.get(key)
+            if item is not None:
+                self.canvas.coords(item, *self._edge_coords(key))
+        self.schedule_refresh()
+
+    # ---------- Görünüm dönüşümü ----------
+
+    def to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        return x * self.scale + self.tx, y * self.scale + self.ty
+
+    def to_world(self, x: float, y: float) -> Tuple[float, float]:
+        return (x - self.tx) / self.scale, (y - self.ty) / self.scale
+
+    def fit_view(self) -> None:
+        """Tüm düğümleri görünür alana sığdırır."""
+        self.canvas.update_idletasks()
+        w = max(self.canvas.winfo_width(), 100)
+        h = max(self.canvas.winfo_height(), 100)
+        if self.positions:
+            xs = [p[0] for p in self.positions.values()]
+            ys = [p[1] for p in self.positions.values()]
+            pad = 2 * NODE_RADIUS
+            x0, x1 = min(xs) - pad, max(xs) + pad
+            y0, y1 = min(ys) - pad, max(ys) + pad
+            scale = min(w / (x1 - x0), h / (y1 - y0), 1.0)
+        else:
+            x0 = y0 = 0.0
+            scale = 1.0
+        self.scale = max(MIN_SCALE, scale)
+        self.tx = -x0 * self.scale
+        self.ty = -y0 * self.scale
+        self._redraw_all()
+
+    def zoom(self, factor: float, cx: float, cy: float) -> None:
+        """(cx, cy) ekran noktası sabit kalacak şekilde ölçekler."""
+        new_scale = min(MAX_SCALE, max(MIN_SCALE, self.scale * factor))
+        factor = new_scale / self.scale
+        if factor == 1.0:
+            return
+        self.scale = new_scale
+        self.tx = (self.tx - cx) * factor + cx
+        self.ty = (self.ty - cy) * factor + cy
+        self.canvas.scale("all", cx, cy, factor, factor)
+        self.schedule_refresh()
+
+    def pan(self, dx: float, dy: float) -> None:
+        self.tx += dx
+        self.ty += dy
+        self.canvas.move("all", dx, dy)
+        self.schedule_refresh()
+
+    # ---------- Görünür küme (culling) ve çizim ----------
+
+    def schedule_refresh(self) -> None:
+        """Art arda gelen olaylarda görünür küme bir kez güncellensin."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.canvas.after_idle(self.refresh_view)
+
+    def _visible_nodes(self) -> Set[int]:
+        w = self.canvas.winfo_width()
+        h = self.canvas.winfo_height()
+        margin = NODE_RADIUS * self.scale
+        x0, y0 = self.to_world(-margin, -margin)
+        x1, y1 = self.to_world(w + margin, h + margin)
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+
+        visible: Set[int] = set()
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            cells = self._cells.items()
+        else:
+            cells = (
+                ((cx, cy), self._cells.get((cx, cy), ()))
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+            )
+        positions = self.positions
+        for (cx, cy), members in cells:
+            if not (cx0 <= cx <= cx1 and cy0 <= cy <= cy1):
+                continue
+            for nid in members:
+                x, y = positions[nid]
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    visible.add(nid)
+        return visible
+
+    def refresh_view(self) -> None:
+        """Görünür alana girenleri çizer, çıkanları siler; LOD'u uygular."""
+        self._refresh_pending = False
+        self._apply_level_of_detail()
+
+        visible = self._visible_nodes()
+        for nid in [nid for nid in self._node_draw if nid not in visible]:
+            self._delete_node_items(nid)
+        for nid in visible:
+            if nid not in self._node_draw:
+                self._create_node_items(nid)
+
+        # Bir ucu görünür olan kenarlar çizilir
+        edges: Set[EdgeKey] = set()
+        for nid in visible:
+            edges.update(self._incident[nid])
+        for key in [key for key in self._edge_draw if key not in edges]:
+            self.canvas.delete(self._edge_draw.pop(key))
+        created = False
+        for key in edges:
+            if key not in self._edge_draw:
+                self._create_edge_item(key)
+                created = True
+        if created:
+            self.canvas.tag_lower("edge")
+
+    def _redraw_all(self) -> None:
+        self.canvas.delete("all")
+        self._node_draw.clear()
+        self._edge_draw.clear()
+        self._item_node.clear()
+        self.refresh_view()
+
+    def _apply_level_of_detail(self) -> None:
+        labels = self.scale >= LABEL_MIN_SCALE
+        if labels != self._labels_visible:
+            self._labels_visible = labels
+            self.canvas.itemconfigure("label", state="normal" if labels else "hidden")
+        width = EDGE_WIDTH if self.scale >= THIN_EDGE_SCALE else 1
+        if width != self._edge_width:
+            self._edge_width = width
+            self.canvas.itemconfigure("edge", width=width)
+            # vurgulu kenarlar kendi kalınlığını korur
+            for key, style in self.edge_style.items():
+                item = self._edge_draw.get(key)
+                if item is not None:
+                    self.canvas.itemconfigure(item, **style)
+
+    def _create_node_items(self, nid: int) -> None:
+        x, y = self.to_screen(*self.positions[nid])
+        r = NODE_RADIUS * self.scale
+        style = dict(self.node_defaults)
+        tags: Tuple[str, ...] = ("node",)
+        cls = self._class_styles.get(self.node_class.get(nid))
+        if cls is not None:
+            tags += (cls[0],)
+            style.update(cls[1])
+        style.update(self.node_style.get(nid, {}))
+        oval = self.canvas.create_oval(
+            x - r, y - r, x + r, y + r, outline="black", tags=tags, **style
+        )
+        text = self.canvas.create_text(
+            x, y, text=str(nid), tags=("label",),
+            state="normal" if self._labels_visible else "hidden",
+        )
+        self._node_draw[nid] = (oval, text)
+        self._item_node[oval] = nid
+        self._item_node[text] = nid
+
+    def _delete_node_items(self, nid: int) -> None:
+        items = self._node_draw.pop(nid, None)
+        if items is None:
+            return
+        for item in items:
+            self._item_node.pop(item, None)
+            self.canvas.delete(item)
+
+    def _edge_coords(self, key: EdgeKey):
+        x1, y1 = self.to_screen(*self.positions[key[0]])
+        x2, y2 = self.to_screen(*self.positions[key[1]])
+        return x1, y1, x2, y2
+
+    def _create_edge_item(self, key: EdgeKey) -> None:
+        style = {"fill": EDGE_FILL, "width": self._edge_width, **self.edge_style.get(key, {})}
+        self._edge_draw[key] = self.canvas.create_line(
+            *self._edge_coords(key), tags=("edge",), **style
+        )
+
+    # ---------- Stil (renklendirme, vurgu, seçim) ----------
+
+    def set_node_style(self, nid: int, **style) -> None:
+        self.node_style.setdefault(nid, {}).update(style)
+        items = self._node_draw.get(nid)
+        if items is not None:
+            self.canvas.itemconfigure(items[0], **style)
+
+    def reset_node_styles(self) -> None:
+        self.node_style.clear()
+        self._clear_node_classes()
+        self.node_defaults = {"fill": NODE_FILL, "width": 2}
+        self.canvas.itemconfigure("node", **self.node_defaults)
+
+    def _clear_node_classes(self) -> None:
+        for tag, _ in self._class_styles.values():
+            self.canvas.dtag(tag)
+        self.node_class.clear()
+        self._class_styles.clear()
+
+    def set_node_classes(
+        self, classes: Dict[int, Hashable], styles: Dict[Hashable, dict]
+    ) -> None:
+        """
+        Düğümleri sınıflarla (ör. renk sınıfı) toplu boyar. Her sınıf bir
+        canvas etiketidir: çizili öğeler sınıf başına tek Tcl çağrısıyla
+        etiketlenir ve tek itemconfigure ile boyanır; sonradan çizilen öğeler
+        etiketini oluşturulurken alır. set_node_style ile verilen düğüm
+        stilleri sınıf stilinin üstündedir.
+        """
+        self._clear_node_classes()
+        self.node_class.update(classes)
+        for i, (cls, style) in enumerate(styles.items()):
+            self._class_styles[cls] = (f"class{i}", dict(style))
+
+        members: Dict[Hashable, List[int]] = {}
+        for nid, items in self._node_draw.items():
+            cls = classes.get(nid)
+            if cls in self._class_styles:
+                members.setdefault(cls, []).append(items[0])
+        for cls, items in members.items():
+            tag, style = self._class_styles[cls]
+            self._add_tag(tag, items)
+            self.canvas.itemconfigure(tag, **style)
+        for nid, style in self.node_style.items():
+            items = self._node_draw.get(nid)
+            if items is not None and nid in classes:
+                self.canvas.itemconfigure(items[0], **style)
+
+    def _add_tag(self, tag: str, items: List[int]) -> None:
+        # Öğe başına Python -> Tk gidiş dönüşü yerine Tcl tarafında tek döngü
+        self.canvas.tk.call(
+            "foreach", "item", tuple(items), f"{self.canvas} addtag {tag} withtag $item"
+        )
+
+    def select_node(self, nid: int) -> None:
+        """Seçili düğümün kenarlığını kalınlaştırır, diğerlerini inceltir."""
+        self.node_defaults["width"] = 1
+        for style in self.node_style.values():
+            style.pop("width", None)
+        self.canvas.itemconfigure("node", width=1)
+        self.set_node_style(nid, width=3)
+
+    def set_edge_style(self, key: EdgeKey, **style) -> None:
+        self.edge_style.setdefault(key, {}).update(style)
+        item = self._edge_draw.get(key)
+        if item is not None:
+            self.canvas.itemconfigure(item, **style)
+
+    def reset_edge_styles(self) -> None:
+        self.edge_style.clear()
+        self.canvas.itemconfigure("edge", fill=EDGE_FILL, width=self._edge_width)
+
+    # ---------- Fare olayları ----------
+
+    def _on_press(self, event) -> None:
+        current = self.canvas.find_withtag("current")
+        nid = self._item_node.get(current[0]) if current else None
+        if nid is not None:
+            self._drag_from = None
+            if self.on_node_click is not None:
+                self.on_node_click(nid)
+            return
+        self._drag_from = (event.x, event.y)
+
+    def _on_drag(self, event) -> None:
+        if self._drag_from is None:
+            return
+        x0, y0 = self._drag_from
+        self._drag_from = (event.x, event.y)
+        self.pan(event.x - x0, event.y - y0)
+
+    def _on_release(self, _event) -> None:
+        self._drag_from = None
+
+    def _on_wheel(self, event) -> None:
+        self.zoom(1.15 if event.delta > 0 else 1 / 1.15, event.x, event.y)
+
+    def visible_counts(self) -> Tuple[int, int]:
+        """(çizili düğüm, çizili kenar) sayısı."""
+        return len(self._node_draw), len(self._edge_draw)
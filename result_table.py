@@ -0,0 +1,78 @@
+# result_table.py
+# Uzun sonuç tabloları için tembel (lazy) ttk.Treeview.
+#
+# Satırlar tek seferde eklenmez: ilk sayfa gösterilir, kaydırma çubuğu sona
+# yaklaştıkça sonraki sayfa eklenir. Satırlar len() ve indeksleme destekleyen
+# herhangi bir dizi olabilir; LazyRows ile satırlar ancak gösterilecekleri
+# zaman üretilir (50k düğümlük tabloda bile açılış tek sayfa kadar sürer).
+from __future__ import annotations
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Sequence
+
+PAGE_SIZE = 500          # her seferde eklenen satır sayısı
+LOAD_MORE_AT = 0.9       # görünür alanın alt sınırı bu orana gelince yeni sayfa
+
+
+class LazyRows(Sequence):
+    """keys[i] için make_row(keys[i]) satırını istendiğinde üretir."""
+
+    def __init__(self, keys: Sequence, make_row: Callable[..., Sequence]):
+        self.keys = keys
+        self.make_row = make_row
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        return self.make_row(self.keys[i])
+
+
+class LazyTable(ttk.Frame):
+    """Başlık, sayaç ve sayfa sayfa dolan Treeview."""
+
+    def __init__(self, parent, **kw):
+        super().__init__(parent, **kw)
+        self.title_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.title_var).pack(fill="x", padx=5, pady=2)
+
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(body, show="headings")
+        self._scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self._scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self._rows: Sequence[Sequence] = ()
+        self._loaded = 0
+        self._load_pending = False
+
+    def show(self, title: str, columns: Sequence[str], rows: Sequence[Sequence]) -> None:
+        """Tabloyu yeni sütun ve satırlarla değiştirir (ilk sayfa eklenir)."""
+        self.tree.delete(*self.tree.get_children())
+        self.tree.configure(columns=list(columns))
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=90, stretch=True)
+        self._rows = rows
+        self._loaded = 0
+        self._load_page()
+        self.title_var.set(f"{title} ({len(rows)} satır)")
+
+    def _load_page(self) -> None:
+        self._load_pending = False
+        end = min(self._loaded + PAGE_SIZE, len(self._rows))
+        insert = self.tree.insert
+        for i in range(self._loaded, end):
+            insert("", "end", values=tuple(self._rows[i]))
+        self._loaded = end
+
+    def _on_scroll(self, first, last) -> None:
+        self._scrollbar.set(first, last)
+        if (float(last) >= LOAD_MORE_AT and self._loaded < len(self._rows)
+                and not self._load_pending):
+            # yeni satırlar Treeview'ın kendi kaydırma geri çağrısını tetikler;
+            # ekleme olay döngüsüne bırakılır ki iç içe çağrı olmasın
+            self._load_pending = True
+            self.after_idle(self._load_page)
@@ -0,0 +1,176 @@
+# sharding.py
+# Bileşen bazlı (sharded) paralel yürütme.
+#
+# Bağlı bileşenler arasında kenar olmadığından renklendirme, mesafe tabanlı
+# merkezilik gibi algoritmalar her bileşende bağımsız çalıştırılabilir.
+# Bileşenler boyutlarına göre "shard"lara paketlenir; her shard bir işçi
+# sürece gider ve orada paylaşılan CSR'dan bileşenin alt grafı çıkarılır.
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from csr import CSRGraph
+from graph import Graph
+from centrality import (
+    CentralityRow,
+    closeness_value,
+    distance_sums,
+    rows_from_scores,
+)
+from welsh_powell import ColoringRow, color_csr, coloring_table
+import parallel
+
+if TYPE_CHECKING:
+    from jobs import CancelToken
+
+# Bundan küçük graflarda süreç havuzu açmak kazançtan çok maliyet getirir
+MIN_PARALLEL_NODES = 20000
+
+# Bir bileşen görevi: (bileşenin alt grafı, *args) -> sonuç
+ComponentTask = Callable[..., Any]
+
+
+def component_shards(
+    g: Graph, csr: CSRGraph, workers: int, min_shard_nodes: int = 256
+) -> List[List[List[int]]]:
+    """
+    Bileşenleri (CSR indeksleriyle) yaklaşık eşit düğüm sayılı shard'lara
+    paketler: büyükten küçüğe, hedef boyut dolunca yeni shard açılır.
+    İşçi başına birkaç shard düşer ki yük dengelensin.
+    """
+    index = csr.index
+    comps = [[index[nid] for nid in comp] for comp in g.components().groups()]
+    comps.sort(key=len, reverse=True)
+    target = max(min_shard_nodes, -(-len(csr) // (workers * 4)))
+
+    shards: List[List[List[int]]] = []
+    current: List[List[int]] = []
+    size = 0
+    for comp in comps:
+        current.append(comp)
+        size += len(comp)
+        if size >= target:
+            shards.append(current)
+            current = []
+            size = 0
+    if current:
+        shards.append(current)
+    return shards
+
+
+def _run_shard(task: ComponentTask, shard: List[List[int]], args: tuple) -> List[Any]:
+    """İşçi süreç: shard'daki her bileşen için görevi çalıştırır."""
+    csr = parallel.worker_csr()
+    return [task(csr.subgraph(members), *args) for members in shard]
+
+
+def map_components(
+    g: Graph,
+    task: ComponentTask,
+    args: tuple = (),
+    workers: Optional[int] = None,
+    min_parallel_nodes: int = MIN_PARALLEL_NODES,
+    cancel: Optional["CancelToken"] = None,
+) -> List[Any]:
+    """
+    task'ı her bağlı bileşenin alt grafı üzerinde çalıştırır; sonuçlar
+    bileşen başına bir eleman olarak döner (sıra: shard sırası).
+    task modül düzeyinde tanımlı olmalı (işçilere pickle ile gider).
+    Küçük graflarda veya workers=1 iken süreç havuzu açılmaz.
+    cancel (jobs.CancelToken) her bileşen / shard sonucunda kontrol edilir;
+    ilerleme düğüm sayısı olarak raporlanır.
+    """
+    csr = g.to_csr()
+    n = len(csr)
+    workers = parallel.resolve_workers(workers)
+    results: List[Any] = []
+    done = 0
+    if workers == 1 or n < min_parallel_nodes:
+        for shard in component_shards(g, csr, 1):
+            for members in shard:
+                if cancel is not None:
+                    cancel.check(done, n)
+                results.append(task(csr.subgraph(members), *args))
+                done += len(members)
+        return results
+
+    shards = component_shards(g, csr, workers)
+    shared, pool = parallel.csr_pool(csr, workers)
+    with shared, pool:
+        futures = [pool.submit(_run_shard, task, shard, args) for shard in shards]
+        for shard, future in zip(shards, futures):
+            if cancel is not None:
+                if cancel.cancelled:
+                    for f in futures:
+                        f.cancel()  # sırada bekleyen shard'lar başlamasın
+                cancel.check(done, n)
+            results.extend(future.result())
+            done += sum(len(members) for members in shard)
+    return results
+
+
+# ---------- Bileşen görevleri ----------
+
+def _color_component(sub: CSRGraph, strategy: str) -> List[Tuple[int, int]]:
+    # Bileşen alt grafı düğümün tüm komşularını içerir: derece = satır uzunluğu
+    degree = [sub.degree(i) for i in range(len(sub))]
+    return list(zip(sub.ids, color_csr(sub, degree, strategy)))
+
+
+def _distance_sums_component(sub: CSRGraph, weighted: bool, word_size: int):
+    return list(sub.ids), distance_sums(sub, weighted, word_size)
+
+
+# ---------- Birleştiren sürümler ----------
+
+def sharded_coloring(
+    g: Graph,
+    strategy: str = "welsh_powell",
+    workers: Optional[int] = None,
+    cancel: Optional["CancelToken"] = None,
+) -> Tuple[Dict[int, int], List[ColoringRow]]:
+    """
+    welsh_powell_coloring'in bileşen bazlı paralel sürümü; aynı
+    (color_map, table) biçimini döner. Renk numaraları her bileşende 1'den
+    başlar (bileşenler arası kenar olmadığından çakışma olmaz).
+    """
+    color_map: Dict[int, int] = {}
+    for pairs in map_components(
+        g, _color_component, (strategy,), workers, cancel=cancel
+    ):
+        color_map.update(pairs)
+    return color_map, coloring_table(g, color_map)
+
+
+def _sharded_distance_scores(
+    g: Graph, weighted: bool, word_size: int, workers: Optional[int], metric: str
+) -> List[CentralityRow]:
+    n = len(g.nodes)
+    ids: List[int] = []
+    scores: List[float] = []
+    norm = 1.0 / (n - 1) if n > 1 else 0.0
+    parts = map_components(
+        g, _distance_sums_component, (weighted, word_size), workers
+    )
+    for comp_ids, (dist_sum, reach, harm) in parts:
+        ids.extend(comp_ids)
+        if metric == "harmonic":
+            scores.extend(h * norm for h in harm)
+        else:
+            scores.extend(
+                closeness_value(d, r, n) for d, r in zip(dist_sum, reach)
+            )
+    return rows_from_scores(g, ids, scores)
+
+
+def sharded_closeness_centrality(
+    g: Graph, weighted: bool = False, word_size: int = 64, workers: Optional[int] = None
+) -> List[CentralityRow]:
+    """closeness_centrality'nin bileşen bazlı paralel sürümü."""
+    return _sharded_distance_scores(g, weighted, word_size, workers, "closeness")
+
+
+def sharded_harmonic_centrality(
+    g: Graph, weighted: bool = False, word_size: int = 64, workers: Optional[int] = None
+) -> List[CentralityRow]:
+    """harmonic_centrality'nin bileşen bazlı paralel sürümü."""
+    return _sharded_distance_scores(g, weighted, word_size, workers, "harmonic")
@@ -0,0 +1,147 @@
+# snapshot.py
+# Graf için sürümlü ikili anlık görüntü (snapshot) formatı.
+#
+# Dosya düzeni (tüm sayılar little-endian, her bölüm 8 bayta hizalı):
+#   başlık    : MAGIC (8 bayt) + <I I q q> (sürüm, bayraklar, n, m)
+#   ids       : int64[n]
+#   activity  : float64[n]
+#   interact. : int64[n]
+#   degree    : int64[n]
+#   offsets   : int64[n + 1]   (CSR)
+#   targets   : int64[m]       (CSR, düğüm indeksleri)
+#   weights   : float64[m]     (önceden hesaplanmış kenar ağırlıkları)
+#   name_offs : int64[n + 1]
+#   names     : utf-8 bayt dizisi
+#
+# Bayraklar: FLAG_DYNAMIC_WEIGHTS, ağırlıkların düğüm özelliklerinden
+# türetildiğini (grafın weight_func'ı vardı) belirtir; yüklemede ağırlık
+# fonksiyonu yeniden bağlanır, böylece sonraki değişiklikler CSV'den
+# yüklenmiş grafla aynı ağırlıkları üretir.
+from __future__ import annotations
+import mmap
+import struct
+import sys
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from graph import Graph, Node
+
+MAGIC = b"GRAFSNAP"
+VERSION = 1
+_HEADER = struct.Struct("<IIqq")
+_HEADER_SIZE = len(MAGIC) + _HEADER.size
+_LITTLE = sys.byteorder == "little"
+
+FLAG_DYNAMIC_WEIGHTS = 1
+
+
+def _pad(n: int) -> int:
+    return (-n) % 8
+
+
+def _write_array(f, a: array) -> None:
+    if not _LITTLE:
+        a = array(a.typecode, a)
+        a.byteswap()
+    f.write(memoryview(a).cast("B"))
+
+
+def save_snapshot(g: Graph, path: str) -> None:
+    """Grafı (düğüm kolonları + CSR dizileri + ağırlıklar) ikili dosyaya yazar."""
+    from csr import CSRGraph
+
+    g.refresh_weights()
+    csr = g._csr if g.frozen else CSRGraph.from_graph(g)
+    nodes = [g.nodes[nid] for nid in csr.ids]
+    n = len(nodes)
+    m = csr.num_edges
+
+    names = [node.name.encode("utf-8") for node in nodes]
+    name_offsets = array("q", [0])
+    for b in names:
+        name_offsets.append(name_offsets[-1] + len(b))
+
+    columns: List[array] = [
+        array("q", csr.ids),
+        array("d", (node.activity for node in nodes)),
+        array("q", (node.interaction for node in nodes)),
+        array("q", (node.degree for node in nodes)),
+        array("q", csr.offsets),
+        array("q", csr.targets),
+        array("d", csr.weights),
+        name_offsets,
+    ]
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        flags = FLAG_DYNAMIC_WEIGHTS if g.weight_func is not None else 0
+        f.write(_HEADER.pack(VERSION, flags, n, m))
+        for a in columns:
+            _write_array(f, a)
+        blob = b"".join(names)
+        f.write(blob)
+        f.write(b"\0" * _pad(len(blob)))
+
+
+def load_snapshot(
+    path: str,
+    weight_func: Optional[Callable[[Node, Node], float]] = None,
+) -> Graph:
+    """
+    Anlık görüntüyü mmap ile açar. CSR dizileri dosya üzerinde sıfır
+    kopyalı memoryview olarak kullanılır; dönen graf dondurulmuş
+    (frozen) durumdadır ve değiştirildiğinde belleğe kopyalanır.
+    Eşleme grafa bağlıdır: graf çözülünce (thaw) kapatılır, graf
+    bırakılınca da son görünümle birlikte serbest kalır.
+    Dosya dinamik ağırlıklıysa grafın weight_func'ı weight_func olur
+    (None ise calculate_weight); değilse ağırlıklar sabit kalır.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mm[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Geçersiz snapshot dosyası: {path}")
+    version, flags, n, m = _HEADER.unpack_from(mm, len(MAGIC))
+    if version != VERSION:
+        raise ValueError(f"Desteklenmeyen snapshot sürümü: {version}")
+
+    buf = memoryview(mm)
+    pos = _HEADER_SIZE
+
+    def take(typecode: str, count: int):
+        nonlocal pos
+        size = count * 8
+        view = buf[pos:pos + size].cast(typecode)
+        pos += size
+        if not _LITTLE:
+            # Büyük-endian makinede sıfır kopya mümkün değil
+            view = array(typecode, view.tobytes())
+            view.byteswap()
+        return view
+
+    ids = take("q", n)
+    activity = take("d", n)
+    interaction = take("q", n)
+    degree = take("q", n)
+    offsets = take("q", n + 1)
+    targets = take("q", m)
+    weights = take("d", m)
+    name_offsets = take("q", n + 1)
+    names = buf[pos:pos + name_offsets[n]]
+
+    nodes: Dict[int, Node] = {}
+    for i in range(n):
+        nid = ids[i]
+        name = str(names[name_offsets[i]:name_offsets[i + 1]], "utf-8")
+        nodes[nid] = Node(nid, name, activity[i], interaction[i], degree[i])
+
+    from csr import CSRGraph
+    del buf, names
+    g = Graph.from_csr(nodes, CSRGraph(ids, offsets, targets, weights))
+    g._mapping = mm
+    if flags & FLAG_DYNAMIC_WEIGHTS:
+        if weight_func is None:
+            from dinamik_agirlik import calculate_weight
+            weight_func = calculate_weight
+        g.weight_func = weight_func
+    return g
@@ -0,0 +1,201 @@
+# traversal.py
+# Dizi tabanlı BFS / DFS çekirdekleri.
+#
+# algoritma.BFS / DFS her düğümde graph.neighbors() ile yeni bir liste
+# üretir ve ziyaret bilgisini set'te tutar. Buradaki çekirdekler grafın CSR
+# dizileri (offsets/targets) üzerinde, indeks tabanlı çalışır: ziyaret
+# bilgisi bytearray, derinlik ve ebeveyn önceden ayrılmış dizilerdedir.
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from csr import CSRGraph
+from graph import Graph
+
+
+@dataclass
+class TraversalResult:
+    """
+    Gezinme sonucu (hepsi CSR indeksleriyle):
+      order[k]  : k. ziyaret edilen düğümün indeksi
+      level[i]  : i'nin başlangıca uzaklığı (ağaç derinliği); -1 ulaşılmadı
+      parent[i] : gezinme ağacında i'nin ebeveyni; -1 kök ya da ulaşılmadı
+    ids / index ile node_id'ye çevrilir.
+    """
+    ids: Sequence[int]
+    index: Dict[int, int]
+    order: array
+    level: array
+    parent: array
+
+    def order_ids(self) -> List[int]:
+        """Ziyaret sırası, node_id olarak (algoritma.BFS.run ile aynı biçim)."""
+        return list(map(self.ids.__getitem__, self.order))
+
+    def level_of(self, node_id: int) -> int:
+        return self.level[self.index[node_id]]
+
+    def parent_of(self, node_id: int) -> Optional[int]:
+        p = self.parent[self.index[node_id]]
+        return None if p < 0 else self.ids[p]
+
+    def path_to(self, node_id: int) -> List[int]:
+        """Ağaçta kökten node_id'ye giden yol (ulaşılmadıysa boş)."""
+        i = self.index[node_id]
+        if self.level[i] < 0:
+            return []
+        path = []
+        while i >= 0:
+            path.append(self.ids[i])
+            i = self.parent[i]
+        path.reverse()
+        return path
+
+
+def _prepare(g: Graph, start_id: int):
+    csr = g.to_csr()
+    if start_id not in csr.index:
+        raise ValueError(f"Böyle bir id yok: {start_id}")
+    n = len(csr)
+    level = array("q", [-1]) * n
+    parent = array("q", [-1]) * n
+    return csr, csr.index[start_id], level, parent
+
+
+def _result(csr: CSRGraph, order: array, level: array, parent: array) -> TraversalResult:
+    return TraversalResult(csr.ids, csr.index, order, level, parent)
+
+
+def bfs_arrays(g: Graph, start_id: int) -> TraversalResult:
+    """Seviye seviye (top-down) BFS; sıra algoritma.BFS.run ile aynıdır."""
+    csr, s, level, parent = _prepare(g, start_id)
+    offsets = csr.offsets
+    targets = csr.targets
+    visited = bytearray(len(csr))
+    visited[s] = 1
+    level[s] = 0
+    order = array("q", [s])
+
+    frontier = [s]
+    depth = 0
+    while frontier:
+        depth += 1
+        nxt = []
+        for u in frontier:
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if not visited[v]:
+                    visited[v] = 1
+                    level[v] = depth
+                    parent[v] = u
+                    nxt.append(v)
+        order.extend(nxt)
+        frontier = nxt
+    return _result(csr, order, level, parent)
+
+
+def dfs_arrays(g: Graph, start_id: int) -> TraversalResult:
+    """İteratif DFS; sıra algoritma.DFS.run ile aynıdır."""
+    csr, s, level, parent = _prepare(g, start_id)
+    offsets = csr.offsets
+    targets = csr.targets
+    visited = bytearray(len(csr))
+    order = array("q")
+
+    # Yığında (düğüm, onu ekleyen düğüm) çiftleri iki paralel listede
+    stack = [s]
+    pushed_by = [-1]
+    while stack:
+        u = stack.pop()
+        p = pushed_by.pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        order.append(u)
+        parent[u] = p
+        level[u] = 0 if p < 0 else level[p] + 1
+        # Komşular tersten eklenir; böylece ilk komşu önce gezilir
+        for k in range(offsets[u + 1] - 1, offsets[u] - 1, -1):
+            v = targets[k]
+            if not visited[v]:
+                stack.append(v)
+                pushed_by.append(u)
+    return _result(csr, order, level, parent)
+
+
+def direction_optimizing_bfs(
+    g: Graph, start_id: int, alpha: float = 14.0, beta: float = 24.0
+) -> TraversalResult:
+    """
+    Yön değiştiren BFS (Beamer): sınır (frontier) küçükken top-down,
+    büyüdüğünde bottom-up çalışır. Bottom-up adımda her ziyaret edilmemiş
+    düğüm, komşularından biri sınırdaysa ilk bulduğunu ebeveyn seçip durur;
+    küçük çaplı sosyal graflarda orta seviyelerde kenarların çoğu hiç
+    taranmaz.
+      top-down -> bottom-up : sınırdan çıkan kenar > ziyaret edilmemiş kenar / alpha
+      bottom-up -> top-down : sınır boyutu < n / beta
+    level ve parent geçerli bir BFS ağacıdır; seviye içi sıra bfs_arrays'ten
+    farklı olabilir.
+    """
+    csr, s, level, parent = _prepare(g, start_id)
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+    visited = bytearray(n)
+    visited[s] = 1
+    level[s] = 0
+    order = array("q", [s])
+
+    frontier = [s]
+    unexplored_edges = len(targets) - (offsets[s + 1] - offsets[s])
+    bottom_up = False
+    unvisited: Optional[List[int]] = None
+    depth = 0
+
+    while frontier:
+        depth += 1
+        if bottom_up:
+            if len(frontier) < n / beta:
+                bottom_up = False
+        else:
+            frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+            if frontier_edges > unexplored_edges / alpha:
+                bottom_up = True
+
+        nxt = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            if unvisited is None:
+                unvisited = [v for v in range(n) if not visited[v]]
+            still = []
+            for v in unvisited:
+                if visited[v]:
+                    continue
+                for k in range(offsets[v], offsets[v + 1]):
+                    u = targets[k]
+                    if in_frontier[u]:
+                        visited[v] = 1
+                        level[v] = depth
+                        parent[v] = u
+                        nxt.append(v)
+                        break
+                else:
+                    still.append(v)
+            unvisited = still
+        else:
+            for u in frontier:
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if not visited[v]:
+                        visited[v] = 1
+                        level[v] = depth
+                        parent[v] = u
+                        nxt.append(v)
+
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in nxt)
+        order.extend(nxt)
+        frontier = nxt
+    return _result(csr, order, level, parent)
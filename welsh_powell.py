@@ -1,8 +1,11 @@
 # welsh_powell.py
 from __future__ import annotations
+import heapq
+from array import array
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 
+from csr import CSRGraph
 from graph import Graph
 
 
@@ -14,56 +17,172 @@ class ColoringRow:
     color: int  # 1,2,3...
 
 
-def welsh_powell_coloring(g: Graph, nodes_subset: Optional[List[int]] = None) -> Tuple[Dict[int, int], List[ColoringRow]]:
+# Renklendirme stratejileri
+STRATEGIES = ("welsh_powell", "dsatur", "smallest_last")
+
+
+def _welsh_powell(order: List[int], offsets, targets, n: int) -> List[int]:
     """
-    Welsh-Powell (greedy) graph coloring.
-    - nodes_subset verilirse sadece o düğümler renklendirilir (bileşen bazlı).
-    Dönen:
-      - color_map: node_id -> color_id (1..k)
-      - table: ColoringRow listesi
+    Renk sınıfı sınıf sınıf kurulur: sıradaki boyanmamış düğümler gezilir,
+    yasaklı değilse mevcut renge boyanır ve komşuları bu renk için yasaklanır.
+    forbidden[v] == c  <=>  v'nin c renginde bir komşusu var.
     """
-    if nodes_subset is None:
-        nodes_subset = list(g.nodes.keys())
+    color = [0] * n
+    forbidden = array("q", [0]) * n
+    remaining = order
+    current = 0
+    while remaining:
+        current += 1
+        rest = []
+        for v in remaining:
+            if forbidden[v] == current:
+                rest.append(v)
+                continue
+            color[v] = current
+            for k in range(offsets[v], offsets[v + 1]):
+                forbidden[targets[k]] = current
+        remaining = rest
+    return color
 
-    # Degree'a göre azalan sırala
-    ordered = sorted(nodes_subset, key=lambda nid: g.nodes[nid].degree, reverse=True)
 
-    color_map: Dict[int, int] = {}
-    current_color = 0
+def _first_fit(v: int, color: List[int], offsets, targets, used: array) -> int:
+    """v'nin komşularında kullanılmayan en küçük renk (used: damga dizisi)."""
+    stamp = v + 1
+    for k in range(offsets[v], offsets[v + 1]):
+        c = color[targets[k]]
+        if c and c < len(used):
+            used[c] = stamp
+    c = 1
+    while c < len(used) and used[c] == stamp:
+        c += 1
+    return c
 
-    for u in ordered:
-        if u in color_map:
-            continue
 
-        current_color += 1
-        color_map[u] = current_color
+def _dsatur(order: List[int], offsets, targets, n: int, degree: List[int]) -> List[int]:
+    """
+    DSatur: her adımda komşularında en çok farklı renk bulunan (doygunluğu en
+    yüksek) düğüm boyanır; eşitlikte degree, sonra Welsh-Powell sırası.
+    """
+    color = [0] * n
+    used = array("q", [0]) * (n + 2)
+    neighbor_colors: List[set] = [set() for _ in range(n)]
+    rank = [0] * n
+    for pos, v in enumerate(order):
+        rank[v] = pos
+    heap = [(0, -degree[v], rank[v], v) for v in order]
+    heapq.heapify(heap)
 
-        # Bu renge boyanmış node'lar ile çakışmayanları aynı renge boya
-        for v in ordered:
-            if v in color_map:
-                continue
+    while heap:
+        neg_sat, _, _, v = heapq.heappop(heap)
+        if color[v] or -neg_sat != len(neighbor_colors[v]):
+            continue  # eski kayıt
+        c = _first_fit(v, color, offsets, targets, used)
+        color[v] = c
+        for k in range(offsets[v], offsets[v + 1]):
+            u = targets[k]
+            if not color[u] and c not in neighbor_colors[u]:
+                neighbor_colors[u].add(c)
+                heapq.heappush(
+                    heap, (-len(neighbor_colors[u]), -degree[u], rank[u], u)
+                )
+    return color
+
+
+def _smallest_last(order: List[int], offsets, targets, n: int) -> List[int]:
+    """
+    Smallest-last: en küçük (kalan) dereceli düğüm tekrar tekrar çıkarılır,
+    çıkarılma sırasının tersiyle first-fit boyanır. Kova kuyruğu ile O(V+E).
+    """
+    deg = [offsets[v + 1] - offsets[v] for v in range(n)]
+    max_deg = max(deg, default=0)
+    buckets: List[List[int]] = [[] for _ in range(max_deg + 1)]
+    for v in reversed(order):
+        buckets[deg[v]].append(v)
+    removed = bytearray(n)
+    removal: List[int] = []
+    low = 0
+    while len(removal) < n:
+        while not buckets[low]:
+            low += 1
+        v = buckets[low].pop()
+        if removed[v] or deg[v] != low:
+            continue  # eski kayıt
+        removed[v] = 1
+        removal.append(v)
+        for k in range(offsets[v], offsets[v + 1]):
+            u = targets[k]
+            if not removed[u]:
+                deg[u] -= 1
+                buckets[deg[u]].append(u)
+                if deg[u] < low:
+                    low = deg[u]
 
-            conflict = False
-            for x, c in color_map.items():
-                if c != current_color:
-                    continue
-                if g.has_edge(v, x) or g.has_edge(x, v):
-                    conflict = True
-                    break
+    color = [0] * n
+    used = array("q", [0]) * (n + 2)
+    for v in reversed(removal):
+        color[v] = _first_fit(v, color, offsets, targets, used)
+    return color
 
-            if not conflict:
-                color_map[v] = current_color
 
+def color_csr(
+    csr: CSRGraph, degree: List[int], strategy: str = "welsh_powell"
+) -> List[int]:
+    """
+    CSR indeksleriyle renklendirme çekirdeği: color[i] (1..k).
+    degree[i] sıralama için kullanılan derece (Node.degree).
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Bilinmeyen strateji: {strategy}")
+    n = len(csr)
+    offsets = csr.offsets
+    targets = csr.targets
+
+    # Degree'a göre azalan sırala (eşitlikte verilen sıra korunur)
+    order = sorted(range(n), key=degree.__getitem__, reverse=True)
+
+    if strategy == "dsatur":
+        return _dsatur(order, offsets, targets, n, degree)
+    if strategy == "smallest_last":
+        return _smallest_last(order, offsets, targets, n)
+    return _welsh_powell(order, offsets, targets, n)
+
+
+def coloring_table(g: Graph, color_map: Dict[int, int]) -> List[ColoringRow]:
+    """color_map'ten renk, sonra degree sıralı ColoringRow tablosu."""
     table: List[ColoringRow] = [
         ColoringRow(
             node_id=nid,
             name=g.nodes[nid].name,
             degree=g.nodes[nid].degree,
-            color=color_map[nid],
+            color=c,
         )
-        for nid in ordered
+        for nid, c in color_map.items()
     ]
 
     # düzenli görünmesi için: renk, sonra degree
     table.sort(key=lambda r: (r.color, -r.degree, r.node_id))
-    return color_map, table
+    return table
+
+
+def welsh_powell_coloring(
+    g: Graph,
+    nodes_subset: Optional[List[int]] = None,
+    strategy: str = "welsh_powell",
+) -> Tuple[Dict[int, int], List[ColoringRow]]:
+    """
+    Welsh-Powell (greedy) graph coloring.
+    - nodes_subset verilirse sadece o düğümler renklendirilir (bileşen bazlı).
+    - strategy: "welsh_powell" (varsayılan), "dsatur" veya "smallest_last"
+    Dönen:
+      - color_map: node_id -> color_id (1..k)
+      - table: ColoringRow listesi
+    Komşuluk CSR dizilerinden okunur; has_edge / neighbors çağrılmaz.
+    nodes_subset modunda alt küme dışındaki komşular rengi kısıtlamaz.
+    """
+    csr = g.to_csr()
+    if nodes_subset is not None:
+        csr = csr.subgraph([csr.index[nid] for nid in nodes_subset])
+    degree = [g.nodes[nid].degree for nid in csr.ids]
+    color = color_csr(csr, degree, strategy)
+    color_map: Dict[int, int] = dict(zip(csr.ids, color))
+    return color_map, coloring_table(g, color_map)